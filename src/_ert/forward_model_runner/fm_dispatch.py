@@ -21,6 +21,7 @@
 from _ert.forward_model_runner.runner import ForwardModelRunner
 
 if TYPE_CHECKING:
+    from _ert.forward_model_runner.forward_model_step import ForwardModelStep
     from ert.config.forward_model_step import ForwardModelJSON
 
     class ForwardModelDescriptionJSON(ForwardModelJSON):
@@ -148,19 +149,20 @@ def _report_all_messages(
 
 
 def _stop_reporters_and_sigkill(
-    reporters: Iterable[Reporter], exited_event: Exited | None = None
+    reporters: Iterable[Reporter], exited_events: Iterable[Exited] = ()
 ) -> None:
-    _stop_reporters(reporters, exited_event)
+    _stop_reporters(reporters, exited_events)
     pgid = os.getpgid(os.getpid())
     os.killpg(pgid, signal.SIGKILL)
 
 
 def _stop_reporters(
-    reporters: Iterable[reporting.Reporter], exited_event: Exited | None = None
+    reporters: Iterable[reporting.Reporter], exited_events: Iterable[Exited] = ()
 ) -> None:
+    exited_events = list(exited_events)
     for reporter in reporters:
         if isinstance(reporter, reporting.Event):
-            reporter.stop(exited_event=exited_event)
+            reporter.stop(exited_events=exited_events)
 
 
 class Namespace(argparse.Namespace):
@@ -216,10 +218,14 @@ def fm_dispatch(args: list[str]) -> None:
     fm_runner = ForwardModelRunner(fm_description)
 
     def sigterm_handler(_signo: int, _stack_frame: Any) -> None:
-        exited_event = Exited(
-            fm_runner._currently_running_step, exit_code=1
-        ).with_error(FORWARD_MODEL_TERMINATED_MSG)
-        _stop_reporters_and_sigkill(reporters, exited_event)
+        running_steps: list[ForwardModelStep | None] = list(
+            fm_runner._currently_running_steps
+        ) or [None]
+        exited_events = [
+            Exited(step, exit_code=1).with_error(FORWARD_MODEL_TERMINATED_MSG)
+            for step in running_steps
+        ]
+        _stop_reporters_and_sigkill(reporters, exited_events)
 
     signal.signal(signal.SIGTERM, sigterm_handler)
     _report_all_messages(fm_runner.run(parsed_args.steps), reporters)
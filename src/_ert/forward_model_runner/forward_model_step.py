@@ -20,6 +20,7 @@
 from psutil import AccessDenied, NoSuchProcess, Process, TimeoutExpired, ZombieProcess
 
 from .io import check_executable
+from .process_tree import ProcessTreeSampler, create_process_tree_sampler
 from .reporting.message import (
     Exited,
     ProcessTreeStatus,
@@ -86,6 +87,9 @@ def killed_by_oom(pids: set[int]) -> bool:
 
 class ForwardModelStep:
     MEMORY_POLL_PERIOD = 5  # Seconds between memory polls
+    # Memory is polled less often, up to this many times MEMORY_POLL_PERIOD,
+    # while the readings are stable
+    MAX_MEMORY_POLL_PERIOD_FACTOR = 4
     TARGET_FILE_POLL_PERIOD = 5  # Seconds to wait for target file after step completion
 
     def __init__(
@@ -96,6 +100,15 @@ def __init__(
         self.index = index
         self.std_err = step_data.get("stderr")
         self.std_out = step_data.get("stdout")
+        self._process: Process | None = None
+        self._killed = False
+
+    def kill(self) -> None:
+        """Kills the process of the step and its children. A step that has
+        not started its process yet kills it as soon as it is started."""
+        self._killed = True
+        if self._process is not None:
+            _kill_process_tree(self._process)
 
     def run(self) -> Generator[Start | Exited | Running]:
         try:
@@ -175,6 +188,9 @@ def _run(self) -> Generator[Start | Exited | Running]:
                 env=self._create_environment(),
             )
             process = Process(proc.pid)
+            self._process = process
+            if self._killed:
+                _kill_process_tree(process)
         except OSError as e:
             exited_message = self._handle_process_io_error_and_create_exited_message(
                 e, stderr
@@ -188,7 +204,14 @@ def _run(self) -> Generator[Start | Exited | Running]:
         max_memory_usage = 0
         fm_step_pids = {int(process.pid)}
         cpu_seconds_processtree: ProcesstreeTimer = ProcesstreeTimer()
+        sampler: ProcessTreeSampler | None = None
+        memory_poll_period: float = self.MEMORY_POLL_PERIOD
+        next_memory_poll = 0.0
+        previous_memory_rss = 0
         while True:
+            # The process is waited on, and its running time checked, every
+            # MEMORY_POLL_PERIOD, while its memory is polled less often when
+            # it is stable
             try:
                 exit_code = process.wait(timeout=self.MEMORY_POLL_PERIOD)
                 if exit_code is not None:
@@ -202,13 +225,30 @@ def _run(self) -> Generator[Start | Exited | Running]:
                     )
                 )
                 if isinstance(potential_exited_msg, Exited):
+                    if sampler is not None:
+                        sampler.close()
                     yield potential_exited_msg
                     return
 
-            (memory_rss, cpu_seconds_snapshot, oom_score, pids) = _get_processtree_data(
-                process
+            if time.monotonic() < next_memory_poll:
+                continue
+            memory_poll_time = time.monotonic()
+            if sampler is None:
+                sampler = create_process_tree_sampler(process.pid)
+            (memory_rss, cpu_seconds_snapshot, oom_score, pids) = (
+                sampler.sample()
+                if sampler is not None
+                else _get_processtree_data(process)
             )
             cpu_seconds_processtree.update(cpu_seconds_snapshot)
+            memory_poll_period = self._next_poll_period(
+                memory_poll_period,
+                previous_memory_rss,
+                memory_rss,
+                pids <= fm_step_pids,
+            )
+            next_memory_poll = memory_poll_time + memory_poll_period
+            previous_memory_rss = memory_rss
             fm_step_pids |= pids
             max_memory_usage = max(memory_rss, max_memory_usage)
             yield Running(
@@ -222,6 +262,8 @@ def _run(self) -> Generator[Start | Exited | Running]:
                     oom_score=oom_score,
                 ),
             )
+        if sampler is not None:
+            sampler.close()
         ensure_file_handles_closed([stdin, stdout, stderr])
         exited_message = self._create_exited_message_based_on_exit_code(
             max_memory_usage,
@@ -232,6 +274,26 @@ def _run(self) -> Generator[Start | Exited | Running]:
         )
         yield exited_message
 
+    def _next_poll_period(
+        self,
+        poll_period: float,
+        previous_memory_rss: int,
+        memory_rss: int,
+        same_processes: bool,
+    ) -> float:
+        """Doubles the memory poll period while the process tree and its memory
+        usage is stable, and goes back to MEMORY_POLL_PERIOD when it changes."""
+        stable = (
+            same_processes
+            and abs(memory_rss - previous_memory_rss) <= 0.05 * previous_memory_rss
+        )
+        if not stable:
+            return self.MEMORY_POLL_PERIOD
+        return min(
+            2 * poll_period,
+            self.MAX_MEMORY_POLL_PERIOD_FACTOR * self.MEMORY_POLL_PERIOD,
+        )
+
     def _create_exited_message_based_on_exit_code(
         self,
         max_memory_usage: int,
@@ -331,6 +393,9 @@ def _handle_process_io_error_and_create_exited_message(
     def name(self) -> str:
         return self.step_data["name"]
 
+    def depends_on(self) -> list[int] | None:
+        return self.step_data.get("depends_on")
+
     def _check_step_files(self) -> list[str]:
         """
         Returns the empty list if no failed checks, or a list of errors in case
@@ -384,6 +449,14 @@ def _check_target_file_is_written(
         return f"Could not find target_file:{target_file}"
 
 
+def _kill_process_tree(process: Process) -> None:
+    with contextlib.suppress(NoSuchProcess, AccessDenied, ZombieProcess):
+        for child in process.children(recursive=True):
+            with contextlib.suppress(NoSuchProcess, AccessDenied, ZombieProcess):
+                child.kill()
+        process.kill()
+
+
 def _get_existing_target_file_mtime(file: str | None) -> int | None:
     mtime = None
     if file and path.exists(file):
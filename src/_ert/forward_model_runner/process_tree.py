@@ -0,0 +1,217 @@
+"""Sampling of memory and cpu usage of the process tree of a forward model step,
+by reading /proc and cgroup v2 files directly.
+
+The files of each process are kept open between samples and read again with
+os.pread, so a sample costs one read per file instead of an open, read and
+close. When the step runs in a cgroup of its own, the memory and cpu usage
+of the whole tree is read from the cgroup, independent of how many processes
+it has.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import sys
+from pathlib import Path
+from typing import Protocol
+
+PROC = Path("/proc")
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+CLOCK_TICKS_PER_SECOND = os.sysconf("SC_CLK_TCK")
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+# Number of samples between full scans of /proc, in which processes that
+# were seen before and found not to be part of the tree are checked again.
+FULL_SCAN_INTERVAL = 10
+
+ProcessTreeData = tuple[int, dict[str, float], int | None, set[int]]
+
+
+class ProcessTreeSampler(Protocol):
+    def sample(self) -> ProcessTreeData: ...
+
+    def close(self) -> None: ...
+
+
+class _OpenFiles:
+    """Files kept open for repeated reading with os.pread."""
+
+    def __init__(self) -> None:
+        self._fds: dict[Path, int] = {}
+
+    def read(self, path: Path) -> str | None:
+        fd = self._fds.get(path)
+        try:
+            if fd is None:
+                fd = self._fds[path] = os.open(path, os.O_RDONLY)
+            content = os.pread(fd, 65536, 0)
+        except OSError:
+            # The process has exited, or the file can not be read
+            self.close(path)
+            return None
+        return content.decode("utf-8", errors="replace")
+
+    def close(self, path: Path) -> None:
+        if (fd := self._fds.pop(path, None)) is not None:
+            with contextlib.suppress(OSError):
+                os.close(fd)
+
+    def close_all(self, keep: set[Path] | None = None) -> None:
+        for path in list(self._fds):
+            if keep is None or path not in keep:
+                self.close(path)
+
+
+def _parse_stat(stat: str) -> tuple[int, float, int]:
+    """The parent pid, user cpu seconds and resident set size in bytes from
+    the content of /proc/<pid>/stat."""
+    # The process name is in parentheses and may contain spaces
+    fields = stat[stat.rindex(")") + 2 :].split()
+    return (
+        int(fields[1]),
+        int(fields[11]) / CLOCK_TICKS_PER_SECOND,
+        int(fields[21]) * PAGE_SIZE,
+    )
+
+
+def _max_oom_score(files: _OpenFiles, pids: set[int]) -> int | None:
+    oom_score = None
+    for pid in pids:
+        content = files.read(PROC / str(pid) / "oom_score")
+        if content is None:
+            continue
+        with contextlib.suppress(ValueError):
+            score = int(content)
+            oom_score = score if oom_score is None else max(oom_score, score)
+    return oom_score
+
+
+class ProcfsSampler:
+    """Finds the descendants of a process by one scan of /proc, reading the
+    parent pid from /proc/<pid>/stat, which also holds the cpu time and
+    resident set size of the process."""
+
+    def __init__(self, pid: int) -> None:
+        self._pid = pid
+        self._files = _OpenFiles()
+        self._not_in_tree: set[int] = set()
+        self._samples = 0
+
+    def sample(self) -> ProcessTreeData:
+        if self._samples % FULL_SCAN_INTERVAL == 0:
+            # pids are reused, so a process seen earlier may now be a new
+            # process in the tree
+            self._not_in_tree.clear()
+        self._samples += 1
+
+        running = {int(entry) for entry in os.listdir(PROC) if entry.isdigit()}
+        self._not_in_tree &= running
+        stats: dict[int, tuple[int, float, int]] = {}
+        for pid in sorted(running - self._not_in_tree):
+            content = self._files.read(PROC / str(pid) / "stat")
+            if content is None:
+                continue
+            with contextlib.suppress(ValueError, IndexError):
+                stats[pid] = _parse_stat(content)
+
+        tree = {self._pid} if self._pid in stats else set()
+        added = True
+        while added:
+            children = {
+                pid
+                for pid, (ppid, _, _) in stats.items()
+                if ppid in tree and pid not in tree
+            }
+            tree |= children
+            added = bool(children)
+
+        self._not_in_tree |= set(stats) - tree
+        self._files.close_all(
+            keep={
+                PROC / str(pid) / name for pid in tree for name in ("stat", "oom_score")
+            }
+        )
+
+        memory_rss = sum(stats[pid][2] for pid in tree)
+        cpu_seconds = {str(pid): stats[pid][1] for pid in tree}
+        return (
+            memory_rss,
+            cpu_seconds,
+            _max_oom_score(self._files, tree),
+            tree - {self._pid},
+        )
+
+    def close(self) -> None:
+        self._files.close_all()
+
+
+class CgroupSampler:
+    """Reads the memory and cpu usage of a cgroup v2 holding only the
+    process tree of the step."""
+
+    def __init__(self, cgroup: Path) -> None:
+        self._cgroup = cgroup
+        self._files = _OpenFiles()
+
+    def _read_keyed(self, name: str) -> dict[str, int]:
+        content = self._files.read(self._cgroup / name) or ""
+        values = {}
+        for line in content.splitlines():
+            key, _, value = line.partition(" ")
+            with contextlib.suppress(ValueError):
+                values[key] = int(value)
+        return values
+
+    def sample(self) -> ProcessTreeData:
+        memory = self._read_keyed("memory.stat")
+        cpu = self._read_keyed("cpu.stat")
+        pids = {
+            int(pid)
+            for pid in (self._files.read(self._cgroup / "cgroup.procs") or "").split()
+        }
+        self._files.close_all(
+            keep={
+                self._cgroup / name
+                for name in ("memory.stat", "cpu.stat", "cgroup.procs")
+            }
+            | {PROC / str(pid) / "oom_score" for pid in pids}
+        )
+        # Resident memory of the processes, as opposed to memory.current,
+        # which also counts the page cache of the files they have written
+        memory_rss = memory.get("anon", 0) + memory.get("file_mapped", 0)
+        return (
+            memory_rss,
+            {"cgroup": cpu.get("user_usec", 0) / 1e6},
+            _max_oom_score(self._files, pids),
+            pids,
+        )
+
+    def close(self) -> None:
+        self._files.close_all()
+
+
+def _cgroup_of(pid: int | str) -> Path | None:
+    with contextlib.suppress(OSError):
+        for line in (
+            (PROC / str(pid) / "cgroup").read_text(encoding="utf-8").split("\n")
+        ):
+            if line.startswith("0::"):
+                return Path(line.removeprefix("0::"))
+    return None
+
+
+def create_process_tree_sampler(pid: int) -> ProcessTreeSampler | None:
+    """A sampler for the process tree of pid, preferring the cgroup of the
+    process if it is not shared with this process. None if neither /proc
+    nor cgroups are available, as on macOS."""
+    if sys.platform != "linux" or not PROC.is_dir():
+        return None
+    cgroup = _cgroup_of(pid)
+    if cgroup is not None and cgroup != _cgroup_of("self"):
+        cgroup_path = CGROUP_ROOT / cgroup.relative_to("/")
+        if (cgroup_path / "memory.stat").exists() and (
+            cgroup_path / "cpu.stat"
+        ).exists():
+            return CgroupSampler(cgroup_path)
+    return ProcfsSampler(pid)
@@ -7,6 +7,7 @@
 import signal
 import threading
 import uuid
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Final, TypedDict
 
@@ -105,8 +106,8 @@ def __init__(
             # can be finished but not all the events were sent yet
             self._finished_event_timeout = 600
 
-    def stop(self, exited_event: Exited | None = None) -> None:
-        if exited_event:
+    def stop(self, exited_events: Iterable[Exited] = ()) -> None:
+        for exited_event in exited_events:
             self._statemachine.transition(exited_event)
         self._event_queue.put(Event._sentinel)
         self._done.set()
@@ -14,6 +14,8 @@ class Manifest(TypedDict):
     path: str
     error: NotRequired[str]
     md5sum: NotRequired[str]
+    size: NotRequired[int]
+    mtime: NotRequired[float]
 
 
 STEP_EXIT_FAILED_STRING_TEMPLATE = """Step {step_name} FAILED with code {exit_code}
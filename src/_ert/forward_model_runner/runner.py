@@ -1,7 +1,10 @@
 import hashlib
 import json
 import os
+import queue
+import threading
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -16,6 +19,33 @@
     Message,
 )
 
+MAX_CHECKSUM_WORKERS = 4
+
+
+def _run_step_in_thread(
+    step: ForwardModelStep,
+    messages: queue.Queue[tuple[ForwardModelStep, Message | None]],
+    stopped: threading.Event,
+) -> None:
+    for status_update in step.run():
+        if stopped.is_set():
+            return
+        messages.put((step, status_update))
+    messages.put((step, None))
+
+
+def _populate_checksum(info: Manifest) -> None:
+    path = Path(info["path"])
+    if not path.exists():
+        info["error"] = f"Expected file {path} not created by forward model!"
+        return
+    stat = path.stat()
+    # The file is hashed in chunks, so it is never read fully into memory
+    with open(path, "rb") as f:
+        info["md5sum"] = hashlib.file_digest(f, "md5").hexdigest()
+    info["size"] = stat.st_size
+    info["mtime"] = stat.st_mtime
+
 
 class ForwardModelRunner:
     def __init__(self, steps_data: "ForwardModelDescriptionJSON") -> None:
@@ -28,13 +58,14 @@ def __init__(self, steps_data: "ForwardModelDescriptionJSON") -> None:
         self.real_id = steps_data.get("real_id")
         self.ert_pid = steps_data.get("ert_pid")
         self.global_environment = steps_data.get("global_environment")
+        self.max_parallel_steps = max(steps_data.get("max_parallel_steps", 1), 1)
         if self.simulation_id is not None:
             os.environ["ERT_RUN_ID"] = self.simulation_id
 
         self.steps: list[ForwardModelStep] = []
         for index, step_data in enumerate(steps_data["jobList"]):
             self.steps.append(ForwardModelStep(step_data, index))
-        self._currently_running_step: ForwardModelStep | None = None
+        self._currently_running_steps: list[ForwardModelStep] = []
         self._set_environment()
 
     def _read_manifest(self) -> dict[str, Manifest] | None:
@@ -52,12 +83,11 @@ def _populate_checksums(
     ) -> dict[str, Manifest]:
         if not manifest:
             return {}
-        for info in manifest.values():
-            path = Path(info["path"])
-            if path.exists():
-                info["md5sum"] = hashlib.md5(path.read_bytes()).hexdigest()
-            else:
-                info["error"] = f"Expected file {path} not created by forward model!"
+        # Hashing releases the GIL, so the files are hashed in parallel threads
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_CHECKSUM_WORKERS, len(manifest))
+        ) as executor:
+            list(executor.map(_populate_checksum, manifest.values()))
         return manifest
 
     def run(self, names_of_steps_to_run: list[str]) -> Generator[Message]:
@@ -90,21 +120,89 @@ def run(self, names_of_steps_to_run: list[str]) -> Generator[Message]:
         else:
             yield init_message
 
-        for step in step_queue:
-            self._currently_running_step = step
-            for status_update in step.run():
-                yield status_update
-                if not status_update.success():
-                    yield Checksum(checksum_dict={}, run_path=os.getcwd())
-                    yield Finish().with_error(
-                        "Not all forward model steps completed successfully."
-                    )
-                    return
+        if any(step.depends_on() is not None for step in step_queue):
+            status_updates = self._run_steps_concurrently(step_queue)
+        else:
+            status_updates = self._run_steps_in_order(step_queue)
+        for status_update in status_updates:
+            yield status_update
+            if not status_update.success():
+                # Stops the steps that are still running before the
+                # final status is reported
+                status_updates.close()
+                yield Checksum(checksum_dict={}, run_path=os.getcwd())
+                yield Finish().with_error(
+                    "Not all forward model steps completed successfully."
+                )
+                return
 
         checksum_dict = self._populate_checksums(self._read_manifest())
         yield Checksum(checksum_dict=checksum_dict, run_path=os.getcwd())
         yield Finish()
 
+    def _run_steps_in_order(
+        self, step_queue: list[ForwardModelStep]
+    ) -> Generator[Message]:
+        for step in step_queue:
+            self._currently_running_steps = [step]
+            yield from step.run()
+
+    def _run_steps_concurrently(
+        self, step_queue: list[ForwardModelStep]
+    ) -> Generator[Message]:
+        """Runs each step in a thread as soon as the steps it depends on have
+        completed, with at most max_parallel_steps running at the same time.
+
+        Status updates are yielded as they arrive. Once the caller stops
+        consuming them, which it does on the first failure, no further steps
+        are started, the processes of the running steps are killed and their
+        threads are joined.
+        """
+        indices = {step.index for step in step_queue}
+        waiting = list(step_queue)
+        completed: set[int] = set()
+        running = 0
+        messages: queue.Queue[tuple[ForwardModelStep, Message | None]] = queue.Queue()
+        stopped = threading.Event()
+        threads: list[threading.Thread] = []
+        try:
+            while waiting or running:
+                for step in list(waiting):
+                    if running >= self.max_parallel_steps:
+                        break
+                    dependencies = {
+                        index
+                        for index in step.depends_on() or []
+                        if index in indices and index < step.index
+                    }
+                    if dependencies <= completed:
+                        waiting.remove(step)
+                        running += 1
+                        self._currently_running_steps.append(step)
+                        thread = threading.Thread(
+                            target=_run_step_in_thread,
+                            args=(step, messages, stopped),
+                            name=f"step-{step.index}",
+                            daemon=True,
+                        )
+                        thread.start()
+                        threads.append(thread)
+
+                step, status_update = messages.get()
+                if status_update is None:
+                    running -= 1
+                    self._currently_running_steps.remove(step)
+                    completed.add(step.index)
+                else:
+                    yield status_update
+        finally:
+            stopped.set()
+            for step in self._currently_running_steps:
+                step.kill()
+            for thread in threads:
+                thread.join()
+            self._currently_running_steps.clear()
+
     def _set_environment(self) -> None:
         if self.global_environment:
             for key, value in self.global_environment.items():
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import os
 import time
 import traceback
 from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 import numpy as np
 import polars as pl
@@ -162,26 +165,43 @@ def analysis_EnIF(
     )
 
     # Learn the precision matrix block-sparse over parameter groups
-    Prec_u = sp.sparse.csc_matrix((0, 0), dtype=float)
+    progress_callback(AnalysisStatusEvent(msg="Fitting parameter precision.."))
+    parameters = list(parameters)
+    scaled_parameters = []
+    graphs = []
     for param_group in parameters:
         config_node = source_ensemble.experiment.parameter_configuration[param_group]
         X_local = source_ensemble.load_parameters_numpy(param_group, iens_active_index)
-        X_local_scaler = StandardScaler()
-        X_scaled = X_local_scaler.fit_transform(X_local.T)
-
-        graph_u_sub = config_node.load_parameter_graph()
-
-        # This will work for dim(X_scaled) on order O(n^5)
-        Prec_u_sub = fit_precision_cholesky_approximate(
-            X_scaled,
-            graph_u_sub,
-            neighbourhood_expansion=2,
-            verbose_level=2,
-            use_tqdm=True,
+        scaled_parameters.append(StandardScaler().fit_transform(X_local.T))
+        graphs.append(config_node.load_parameter_graph())
+
+    # This will work for dim(X_scaled) on order O(n^5)
+    fit_precision = partial(
+        fit_precision_cholesky_approximate,
+        neighbourhood_expansion=2,
+        verbose_level=2,
+    )
+    # The groups are independent, so they are fitted in parallel
+    if len(parameters) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(len(parameters), os.cpu_count() or 1)
+        ) as executor:
+            precisions = list(
+                executor.map(
+                    partial(fit_precision, use_tqdm=False), scaled_parameters, graphs
+                )
+            )
+    else:
+        precisions = list(
+            map(partial(fit_precision, use_tqdm=True), scaled_parameters, graphs)
         )
 
-        # Add to block-diagonal full precision
-        Prec_u = sp.sparse.block_diag((Prec_u, Prec_u_sub), format="csc")
+    # Block-diagonal full precision
+    Prec_u = (
+        sp.sparse.block_diag(precisions, format="csc")
+        if precisions
+        else sp.sparse.csc_matrix((0, 0), dtype=float)
+    )
 
     # Precision of observation errors
     Prec_eps = sp.sparse.diags(
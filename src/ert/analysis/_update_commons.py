@@ -2,6 +2,7 @@
 
 import logging
 from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
 from fnmatch import fnmatch
 
@@ -108,6 +109,7 @@ def _auto_scale_observations(
     )
 
     obs_keys = observations_and_responses["observation_key"].to_numpy().astype(str)
+    groups_to_scale = []
     for input_group in auto_scale_observations:
         group = _expand_wildcards(obs_keys, input_group)
         obs_group_mask = np.isin(obs_keys, group) & obs_mask
@@ -117,13 +119,32 @@ def _auto_scale_observations(
             continue
 
         logger.info(f"Scaling observation group: {group}")
+        groups_to_scale.append(
+            (
+                input_group,
+                obs_group_mask,
+                observations_and_responses.filter(obs_group_mask),
+            )
+        )
 
-        data_for_obs = observations_and_responses.filter(obs_group_mask)
-        scaling_factors, clusters, nr_components = misfit_preprocessor.main(
-            data_for_obs.select(active_realizations).to_numpy(),
-            data_for_obs.select(_OutlierColumns.scaled_std).to_numpy(),
+    # The groups are scaled independently of each other, and the heavy lifting
+    # is done by numpy and scipy, which release the GIL.
+    with ThreadPoolExecutor() as executor:
+        results = list(
+            executor.map(
+                lambda data_for_obs: misfit_preprocessor.main(
+                    data_for_obs.select(active_realizations).to_numpy(),
+                    data_for_obs.select(_OutlierColumns.scaled_std).to_numpy(),
+                ),
+                [data_for_obs for _, _, data_for_obs in groups_to_scale],
+            )
         )
 
+    for (input_group, obs_group_mask, data_for_obs), (
+        scaling_factors,
+        clusters,
+        nr_components,
+    ) in zip(groups_to_scale, results, strict=True):
         scaling_factors_updated[obs_group_mask] *= scaling_factors
 
         scaling_factors_dfs.append(
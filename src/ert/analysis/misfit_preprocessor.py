@@ -3,10 +3,15 @@
 import numpy as np
 import numpy.typing as npt
 from scipy.cluster.hierarchy import fcluster, linkage
-from scipy.stats import spearmanr
+from scipy.stats import rankdata
 
 logger = logging.getLogger(__name__)
 
+# Groups with at least this many observations, and more observations than
+# realizations, are clustered without building the correlation matrix
+LOW_RANK_MIN_OBSERVATIONS = 5000
+LOW_RANK_MAX_ITERATIONS = 100
+
 
 def get_scaling_factor(nr_observations: int, nr_components: int) -> float:
     """Calculates an observation scaling factor which is
@@ -46,14 +51,22 @@ def get_nr_primary_components(
         The minimum number of principal components required to meet or exceed
         the specified variance threshold.
     """
-    data_matrix = responses - responses.mean(axis=0)
-    _, singulars, _ = np.linalg.svd(data_matrix.astype(float), full_matrices=False)
+    data_matrix = (responses - responses.mean(axis=0)).astype(float)
+    nr_realizations, nr_observations = data_matrix.shape
+    if nr_observations > nr_realizations:
+        # The rank is at most the number of realizations, so the squared
+        # singular values are the eigenvalues of the small gram matrix
+        eigenvalues = np.linalg.eigvalsh(data_matrix @ data_matrix.T)
+        squared_singulars = np.clip(eigenvalues[::-1], 0.0, None)
+    else:
+        singulars = np.linalg.svd(data_matrix, compute_uv=False)
+        squared_singulars = singulars**2
     # Calculate cumulative variance ratio:
     # Squared singular values are proportional to variance explained by each principal
     # component. We compute the cumulative sum of these, then divide by their total
     # sum to get the cumulative proportion of variance explained by each successive
     # component.
-    variance_ratio = np.cumsum(singulars**2) / np.sum(singulars**2)
+    variance_ratio = np.cumsum(squared_singulars) / np.sum(squared_singulars)
 
     num_components = np.searchsorted(variance_ratio, threshold, side="left") + 1
 
@@ -68,21 +81,97 @@ def cluster_responses(
     Cluster responses using hierarchical clustering based on Spearman correlation.
     Observations that tend to vary similarly across different simulation runs will
     be clustered together.
+
+    Groups of at least LOW_RANK_MIN_OBSERVATIONS observations, with more
+    observations than realizations, are clustered without building the
+    correlation matrix of every pair of observations, see _cluster_low_rank.
     """
-    correlation = spearmanr(responses).statistic
-    if isinstance(correlation, np.float64):
-        correlation = np.array([[1, correlation], [correlation, 1]])
-    # Take absolute value to cluster based on correlation strength rather
-    # than direction.
-    # This ensures that strong negative correlations (-0.9) are
-    # treated as similar to
-    # strong positive correlations (+0.9), since both represent
-    # strong relationships.
-    correlation = np.abs(correlation)
-    linkage_matrix = linkage(correlation, "average", "euclidean")
+    # Spearman correlation is the Pearson correlation of the ranks
+    ranks = rankdata(responses, axis=0)
+    nr_realizations, nr_observations = ranks.shape
+    if nr_observations >= LOW_RANK_MIN_OBSERVATIONS and nr_observations > (
+        nr_realizations
+    ):
+        logger.info(
+            f"Clustering {nr_observations} observations with low-rank "
+            f"clustering, as there are at least {LOW_RANK_MIN_OBSERVATIONS} "
+            f"observations and only {nr_realizations} realizations"
+        )
+        return _cluster_low_rank(_correlation_features(ranks), nr_clusters)
+    else:
+        logger.info(
+            f"Clustering {nr_observations} observations with hierarchical "
+            "clustering of their correlation matrix"
+        )
+        correlation = np.corrcoef(ranks, rowvar=False)
+        # Take absolute value to cluster based on correlation strength rather
+        # than direction.
+        # This ensures that strong negative correlations (-0.9) are
+        # treated as similar to
+        # strong positive correlations (+0.9), since both represent
+        # strong relationships.
+        correlation = np.abs(correlation)
+        linkage_matrix = linkage(correlation, "average", "euclidean")
     return fcluster(linkage_matrix, nr_clusters, criterion="maxclust")
 
 
+def _correlation_features(
+    ranks: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """
+    Features of the observations, of shape (n_observations, n_realizations),
+    whose inner products are the correlations of the ranks. They are the
+    centered ranks of each observation normalized to unit length.
+    """
+    centered = ranks - ranks.mean(axis=0)
+    norms = np.linalg.norm(centered, axis=0)
+    return (centered / np.where(norms == 0, 1.0, norms)).T
+
+
+def _cluster_low_rank(
+    features: npt.NDArray[np.float64], nr_clusters: int
+) -> npt.NDArray[np.int_]:
+    """
+    Clusters the observations by the absolute correlation of their features,
+    without computing the correlation of every pair of observations.
+
+    Each cluster has a unit center, and an observation belongs to the cluster
+    whose center it has the largest absolute correlation with, so strong
+    negative correlation groups observations as strong positive correlation
+    does. The centers are chosen to be as uncorrelated as possible, and are
+    then moved to the sign-aligned mean of their observations until the
+    clusters no longer change.
+    """
+    nr_observations = features.shape[0]
+    nr_clusters = max(1, min(nr_clusters, nr_observations))
+    centers = np.empty((nr_clusters, features.shape[1]))
+    centers[0] = features[0]
+    similarity = np.abs(features @ centers[0])
+    for k in range(1, nr_clusters):
+        centers[k] = features[np.argmin(similarity)]
+        similarity = np.maximum(similarity, np.abs(features @ centers[k]))
+
+    labels = np.full(nr_observations, -1)
+    for _ in range(LOW_RANK_MAX_ITERATIONS):
+        correlation = features @ centers.T
+        new_labels = np.argmax(np.abs(correlation), axis=1)
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for k in range(nr_clusters):
+            members = labels == k
+            if not members.any():
+                continue
+            signs = np.sign(correlation[members, k])
+            center = np.where(signs == 0, 1.0, signs) @ features[members]
+            if (norm := np.linalg.norm(center)) > 0:
+                centers[k] = center / norm
+
+    # Labelled from 1 in order of appearance, as by fcluster
+    _, first, inverse = np.unique(labels, return_index=True, return_inverse=True)
+    return np.argsort(np.argsort(first))[inverse] + 1
+
+
 def main(
     responses: npt.NDArray[np.float64],
     obs_errors: npt.NDArray[np.float64],
@@ -30,6 +30,7 @@
 from .model_config import ModelConfig
 from .parameter_config import ParameterCardinality, ParameterConfig, ParameterMetadata
 from .parsing import (
+    ChecksumVerification,
     ConfigValidationError,
     ConfigWarning,
     ErrorInfo,
@@ -72,6 +73,7 @@
 __all__ = [
     "AnalysisConfig",
     "AnalysisModule",
+    "ChecksumVerification",
     "ConfigValidationError",
     "ConfigWarning",
     "DataSource",
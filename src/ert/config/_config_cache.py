@@ -0,0 +1,436 @@
+"""A persistent cache of user configurations.
+
+Parsing a configuration with deep INCLUDE trees, reading the REFCASE and
+building large observation sets takes time, so the parsed config dict, the
+refcase and the observations are stored in the cache directory of the user.
+
+An entry is found from the content hash of the configuration file, and is
+used again as long as every file it was built from has the same content
+hash: the configuration file, the files it includes, the observation files,
+the observation data files and the refcase. The environment variables
+referred to in the configuration files must have the same values, and the
+paths in the config dict must still exist, or still not exist.
+
+The entries are stored as JSON and parquet, and never as pickle, as reading
+a pickle from the cache directory could execute arbitrary code.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import warnings
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import polars as pl
+from lark import Token
+from pydantic import TypeAdapter
+
+from ert.shared import __version__
+
+from ._observations import GeneralObservation
+from ._read_summary import _get_summary_filenames
+from .parsing import (
+    ChecksumVerification,
+    ConfigDict,
+    ConfigKeys,
+    ConfigWarning,
+    ContextList,
+    ForwardModelStepKeys,
+    HistorySource,
+    HookRuntime,
+    ObservationType,
+    QueueSystem,
+    SchemaItemType,
+    WarningInfo,
+    WorkflowJobKeys,
+)
+from .parsing._read_file import record_files_read
+from .parsing.context_values import ContextBool, ContextFloat, ContextInt
+from .parsing.file_context_token import FileContextToken
+from .refcase import Refcase
+
+if TYPE_CHECKING:
+    from .ert_config import ErtConfig
+
+logger = logging.getLogger(__name__)
+
+# Increase when the content of the cache entries changes
+CONFIG_CACHE_VERSION = 2
+
+T = TypeVar("T", bound="ErtConfig")
+
+_ENUMS: dict[str, type[Enum]] = {
+    enum.__name__: enum
+    for enum in (
+        ChecksumVerification,
+        ConfigKeys,
+        ForwardModelStepKeys,
+        HistorySource,
+        HookRuntime,
+        ObservationType,
+        QueueSystem,
+        SchemaItemType,
+        WorkflowJobKeys,
+    )
+}
+
+_WARNINGS: dict[str, type[Warning]] = {
+    warning.__name__: warning
+    for warning in (
+        ConfigWarning,
+        DeprecationWarning,
+        FutureWarning,
+        PendingDeprecationWarning,
+        RuntimeWarning,
+        UserWarning,
+    )
+}
+
+_REFCASE = TypeAdapter(Refcase)
+
+
+def config_cache_directory() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ert" / "config"
+
+
+@dataclass
+class _CacheEntry:
+    config_dict: ConfigDict
+    warnings: list[ConfigWarning | Warning]
+    refcase: Refcase | None
+    observations: dict[str, pl.DataFrame]
+
+
+def _entry_directory(config_file: str, contents: str) -> Path:
+    key = "\0".join(
+        [
+            __version__,
+            str(CONFIG_CACHE_VERSION),
+            _digest(contents.encode("utf-8")),
+            os.path.abspath(config_file),
+            os.getcwd(),
+            # Executables are looked up in PATH
+            os.environ.get("PATH", ""),
+        ]
+    )
+    return config_cache_directory() / hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def _file_digest(file: str) -> str:
+    with open(file, "rb") as fin:
+        return hashlib.file_digest(fin, "sha256").hexdigest()
+
+
+def _referenced_environment(contents: Iterable[str]) -> dict[str, str]:
+    contents = list(contents)
+    return {
+        key: value
+        for key, value in os.environ.items()
+        if any(f"${key}" in content for content in contents)
+    }
+
+
+def _absolute_paths(value: Any) -> Iterable[str]:
+    if isinstance(value, str):
+        if os.path.isabs(value):
+            yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _absolute_paths(item)
+    elif isinstance(value, list | tuple):
+        for item in value:
+            yield from _absolute_paths(item)
+
+
+def _data_files(config_dict: ConfigDict, config: ErtConfig) -> list[str]:
+    """The files that are not configuration files, which the refcase and the
+    observations are read from."""
+    files: list[str] = []
+    if (refcase := config_dict.get(ConfigKeys.REFCASE)) is not None:
+        files.extend(_get_summary_filenames(str(refcase)))
+    for observation in config.observation_declarations:
+        if isinstance(observation, GeneralObservation):
+            files.extend(
+                file
+                for file in (observation.obs_file, observation.index_file)
+                if file is not None
+            )
+    return [os.path.abspath(file) for file in files]
+
+
+def _encode(value: Any) -> Any:
+    """Encodes a config dict as JSON, keeping the types of its values."""
+    match value:
+        case None | bool() | int() | float() | str() if type(value) in {
+            type(None),
+            bool,
+            int,
+            float,
+            str,
+        }:
+            return value
+        case FileContextToken():
+            return {
+                "token": [
+                    value.type,
+                    value.value,
+                    value.start_pos,
+                    value.line,
+                    value.column,
+                    value.end_line,
+                    value.end_column,
+                    value.end_pos,
+                    value.filename,
+                ]
+            }
+        case Enum() if _ENUMS.get(type(value).__name__) is type(value):
+            return {"enum": type(value).__name__, "value": value.value}
+        case ContextBool():
+            return {"bool": bool(value), "context": _encode(value.token)}
+        case ContextInt():
+            return {"int": int(value), "context": _encode(value.token)}  # type: ignore[attr-defined]
+        case ContextFloat():
+            return {"float": float(value), "context": _encode(value.token)}  # type: ignore[attr-defined]
+        case ContextList():
+            return {
+                "list": [_encode(item) for item in value],
+                "context": _encode(value.token),
+            }
+        case list() if type(value) is list:
+            return [_encode(item) for item in value]
+        case tuple() if type(value) is tuple:
+            return {"tuple": [_encode(item) for item in value]}
+        case dict() if type(value) is dict:
+            return {
+                "dict": [[_encode(key), _encode(item)] for key, item in value.items()]
+            }
+    raise TypeError(f"Can not cache value of type {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    match value:
+        case {"token": [type_, token_value, *positions, filename]}:
+            return FileContextToken(Token(type_, token_value, *positions), filename)
+        case {"enum": name, "value": enum_value}:
+            return _ENUMS[name](enum_value)
+        case {"bool": bool_value, "context": token}:
+            return ContextBool(bool_value, _decode(token))
+        case {"int": int_value, "context": token}:
+            return ContextInt(int_value, _decode(token))
+        case {"float": float_value, "context": token}:
+            return ContextFloat(float_value, _decode(token))
+        case {"list": items, "context": token}:
+            return ContextList.with_values(_decode(token), _decode(items))
+        case {"tuple": items}:
+            return tuple(_decode(item) for item in items)
+        case {"dict": items}:
+            return {_decode(key): _decode(item) for key, item in items}
+    raise ValueError(f"Unknown cached value {value!r}")
+
+
+def _encode_warning(message: Warning | str, category: type[Warning]) -> dict[str, Any]:
+    if isinstance(message, ConfigWarning):
+        return {
+            "category": ConfigWarning.__name__,
+            "info": dataclasses.asdict(message.info),
+        }
+    return {
+        "category": category.__name__ if category.__name__ in _WARNINGS else "",
+        "message": str(message),
+    }
+
+
+def _decode_warning(warning: dict[str, Any]) -> ConfigWarning | Warning:
+    if "info" in warning:
+        return ConfigWarning(WarningInfo(**warning["info"]))
+    return _WARNINGS.get(warning["category"], UserWarning)(warning["message"])
+
+
+def _emit(message: Warning) -> None:
+    if isinstance(message, ConfigWarning):
+        ConfigWarning._formatted_warn(message)
+    else:
+        warnings.warn(message, stacklevel=3)
+
+
+def _is_up_to_date(entry: dict[str, Any]) -> bool:
+    # <DATE> is substituted with the date the configuration is parsed, so
+    # an entry from another day may have another value for it
+    if entry["date"] is not None and entry["date"] != datetime.date.today().isoformat():
+        return False
+    contents = []
+    try:
+        for file, digest in entry["text_files"].items():
+            content = Path(file).read_bytes()
+            if _digest(content) != digest:
+                return False
+            contents.append(content.decode("utf-8"))
+        for file, digest in entry["data_files"].items():
+            if _file_digest(file) != digest:
+                return False
+    except (OSError, UnicodeDecodeError):
+        return False
+    if _referenced_environment(contents) != entry["environment"]:
+        return False
+    return all(
+        os.path.exists(path) == exists for path, exists in entry["paths"].items()
+    )
+
+
+def _load(entry_directory: Path) -> _CacheEntry | None:
+    try:
+        entry = json.loads((entry_directory / "entry.json").read_text(encoding="utf-8"))
+        if not _is_up_to_date(entry):
+            return None
+        return _CacheEntry(
+            config_dict=_decode(entry["config_dict"]),
+            warnings=[_decode_warning(warning) for warning in entry["warnings"]],
+            refcase=(
+                None
+                if entry["refcase"] is None
+                else _REFCASE.validate_python(entry["refcase"])
+            ),
+            observations={
+                name: pl.read_parquet(entry_directory / f"{name}.parquet")
+                for name in entry["observations"]
+            },
+        )
+    except FileNotFoundError:
+        return None
+    except Exception as err:
+        logger.warning(f"Could not read cached configuration {entry_directory}: {err}")
+        return None
+
+
+def _store(
+    entry_directory: Path,
+    entry: dict[str, Any],
+    observations: dict[str, pl.DataFrame],
+) -> None:
+    # The entry is written to a temporary directory that is then renamed,
+    # so that a reader never sees a partly written entry
+    try:
+        entry_directory.parent.mkdir(parents=True, exist_ok=True)
+        temporary_directory = Path(
+            tempfile.mkdtemp(dir=entry_directory.parent, suffix=".tmp")
+        )
+    except OSError as err:
+        logger.warning(f"Could not cache configuration in {entry_directory}: {err}")
+        return
+    try:
+        for name, df in observations.items():
+            df.write_parquet(temporary_directory / f"{name}.parquet")
+        (temporary_directory / "entry.json").write_text(
+            json.dumps(entry), encoding="utf-8"
+        )
+        shutil.rmtree(entry_directory, ignore_errors=True)
+        temporary_directory.rename(entry_directory)
+    except OSError as err:
+        logger.warning(f"Could not cache configuration in {entry_directory}: {err}")
+        shutil.rmtree(temporary_directory, ignore_errors=True)
+
+
+def cached_config(
+    config_file: str,
+    contents: str,
+    parse: Callable[[], ConfigDict],
+    build: Callable[[ConfigDict, Refcase | None, dict[str, pl.DataFrame] | None], T],
+) -> T:
+    """The configuration built from the configuration file with the given
+    contents.
+
+    The config dict, refcase and observations are taken from the cache if it
+    is up to date. Otherwise the config dict is made by calling parse, and
+    build is given None for the refcase and the observations, and reads them.
+    """
+    entry_directory = _entry_directory(config_file, contents)
+    if (entry := _load(entry_directory)) is not None:
+        logger.info(f"Using cached configuration {entry_directory} for {config_file}")
+        for message in entry.warnings:
+            _emit(message)
+        return build(entry.config_dict, entry.refcase, entry.observations)
+
+    captured_warnings: list[warnings.WarningMessage] = []
+    try:
+        with (
+            record_files_read() as files_read,
+            warnings.catch_warnings(record=True) as captured_warnings,
+        ):
+            warnings.simplefilter("always")
+            config_dict = parse()
+    finally:
+        # The warnings are emitted again outside catch_warnings, so they go
+        # through the filters and handlers of the caller
+        for captured in captured_warnings:
+            _emit(
+                captured.message
+                if isinstance(captured.message, Warning)
+                else captured.category(captured.message)
+            )
+
+    # The config dict is encoded before building, as building changes it
+    try:
+        encoded_config_dict = _encode(config_dict)
+    except TypeError as err:
+        logger.warning(f"Could not cache configuration {config_file}: {err}")
+        return build(config_dict, None, None)
+    paths = {path: os.path.exists(path) for path in _absolute_paths(config_dict)}
+
+    config = build(config_dict, None, None)
+
+    files_read[os.path.normpath(os.path.abspath(config_file))] = contents
+    try:
+        text_files = {file: _file_digest(file) for file in files_read}
+        data_files = {
+            file: _file_digest(file) for file in _data_files(config_dict, config)
+        }
+    except OSError as err:
+        logger.warning(f"Could not cache configuration {config_file}: {err}")
+        return config
+    observations = config.observations
+    refcase = config.ensemble_config.refcase
+    _store(
+        entry_directory,
+        {
+            "date": (
+                datetime.date.today().isoformat()
+                if any("<DATE>" in content for content in files_read.values())
+                else None
+            ),
+            "text_files": text_files,
+            "data_files": data_files,
+            "environment": _referenced_environment(files_read.values()),
+            "paths": paths,
+            "config_dict": encoded_config_dict,
+            "warnings": [
+                _encode_warning(captured.message, captured.category)
+                for captured in captured_warnings
+            ],
+            "refcase": None
+            if refcase is None
+            else _REFCASE.dump_python(refcase, mode="json"),
+            "observations": list(observations),
+        },
+        observations,
+    )
+    return config
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Sequence
 from datetime import datetime, timedelta
@@ -36,6 +37,48 @@
 DEFAULT_TIME_DELTA = timedelta(seconds=30)
 
 
+class _TimeMap:
+    """The times of a time map, also kept in sorted order so the nearest time
+    to an observation is found by bisection rather than by a scan over all
+    the times."""
+
+    def __init__(self, times: list[datetime]) -> None:
+        self.times = times
+        self._order = sorted(range(len(times)), key=times.__getitem__)
+        self._sorted_times = [times[i] for i in self._order]
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __getitem__(self, index: int) -> datetime:
+        return self.times[index]
+
+    def find_nearest(
+        self, time: datetime, threshold: timedelta = DEFAULT_TIME_DELTA
+    ) -> int:
+        """The index of the time nearest to time, and less than threshold
+        from it. The first index is used if several are equally near."""
+        position = bisect_left(self._sorted_times, time)
+        candidates = []
+        below = position - 1
+        while below >= 0 and time - self._sorted_times[below] < threshold:
+            candidates.append(self._order[below])
+            below -= 1
+        above = position
+        while (
+            above < len(self._sorted_times)
+            and self._sorted_times[above] - time < threshold
+        ):
+            candidates.append(self._order[above])
+            above += 1
+        if not candidates:
+            raise IndexError(f"{time} is not in the time map")
+        return min(candidates, key=lambda i: (abs(time - self.times[i]), i))
+
+
+_SummaryRow = tuple[str, str, datetime, float, float]
+
+
 def create_observation_dataframes(
     observations: Sequence[Observation],
     ensemble_config: EnsembleConfig,
@@ -47,12 +90,24 @@ def create_observation_dataframes(
     obs_time_list: list[datetime] = []
     if ensemble_config.refcase is not None:
         obs_time_list = ensemble_config.refcase.all_dates
+        # Read the vectors of all history observations in one pass over the
+        # refcase
+        ensemble_config.refcase.load(
+            _refcase_key(obs.name, history)
+            for obs in observations
+            if isinstance(obs, HistoryObservation)
+        )
     elif time_map is not None:
         obs_time_list = time_map
 
     time_len = len(obs_time_list)
+    time_map_index = _TimeMap(obs_time_list)
     config_errors: list[ErrorInfo] = []
     grouped: dict[str, list[pl.DataFrame]] = defaultdict(list)
+    # Summary observations have one row each, so they are collected as rows
+    # and made into one frame, as a frame per observation is slow when there
+    # are many of them
+    summary_rows: list[_SummaryRow] = []
     for obs in observations:
         obs_name = obs.name
         try:
@@ -68,11 +123,11 @@ def create_observation_dataframes(
                         )
                     )
                 case SummaryObservation():
-                    grouped["summary"].append(
+                    summary_rows.append(
                         _handle_summary_observation(
                             obs,
                             obs_name,
-                            obs_time_list,
+                            time_map_index,
                             bool(ensemble_config.refcase),
                         )
                     )
@@ -82,7 +137,7 @@ def create_observation_dataframes(
                             ensemble_config,
                             obs,
                             obs_name,
-                            obs_time_list,
+                            time_map_index,
                             bool(ensemble_config.refcase),
                         )
                     )
@@ -94,6 +149,9 @@ def create_observation_dataframes(
     if config_errors:
         raise ObservationConfigError.from_collected(config_errors)
 
+    if summary_rows:
+        grouped["summary"].append(_summary_rows_to_dataframe(summary_rows))
+
     datasets: dict[str, pl.DataFrame] = {}
 
     for name, dfs in grouped.items():
@@ -126,6 +184,12 @@ def _handle_error_mode(
             assert_never(default)
 
 
+def _refcase_key(summary_key: str, history_type: HistorySource) -> str:
+    if history_type == HistorySource.REFCASE_HISTORY:
+        return history_key(summary_key)
+    return summary_key
+
+
 def _handle_history_observation(
     ensemble_config: EnsembleConfig,
     history_observation: HistoryObservation,
@@ -139,15 +203,12 @@ def _handle_history_observation(
             "REFCASE is required for HISTORY_OBSERVATION", summary_key
         )
 
-    if history_type == HistorySource.REFCASE_HISTORY:
-        local_key = history_key(summary_key)
-    else:
-        local_key = summary_key
-    if local_key not in refcase.keys:
+    local_key = _refcase_key(summary_key, history_type)
+    if local_key not in refcase:
         raise ObservationConfigError.with_context(
             f"Key {local_key!r} is not present in refcase", summary_key
         )
-    values = refcase.values[refcase.keys.index(local_key)]
+    values = refcase.values(local_key)
     std_dev = _handle_error_mode(values, history_observation)
     for segment in history_observation.segments:
         start = segment.start
@@ -233,27 +294,10 @@ def _parse_date(date_str: str) -> datetime:
             return date
 
 
-def _find_nearest(
-    time_map: list[datetime],
-    time: datetime,
-    threshold: timedelta = DEFAULT_TIME_DELTA,
-) -> int:
-    nearest_index = -1
-    nearest_diff = None
-    for i, t in enumerate(time_map):
-        diff = abs(time - t)
-        if diff < threshold and (nearest_diff is None or nearest_diff > diff):
-            nearest_diff = diff
-            nearest_index = i
-    if nearest_diff is None:
-        raise IndexError(f"{time} is not in the time map")
-    return nearest_index
-
-
 def _get_restart(
     date_dict: ObservationDate,
     obs_name: str,
-    time_map: list[datetime],
+    time_map: _TimeMap,
     has_refcase: bool,
 ) -> int:
     if date_dict.restart is not None:
@@ -267,7 +311,7 @@ def _get_restart(
     time, date_str = _get_time(date_dict, time_map[0], context=obs_name)
 
     try:
-        return _find_nearest(time_map, time)
+        return time_map.find_nearest(time)
     except IndexError as err:
         raise ObservationConfigError.with_context(
             f"Could not find {time} ({date_str}) in "
@@ -289,9 +333,9 @@ def _get_restart(
 def _handle_summary_observation(
     summary_dict: SummaryObservation,
     obs_key: str,
-    time_map: list[datetime],
+    time_map: _TimeMap,
     has_refcase: bool,
-) -> pl.DataFrame:
+) -> _SummaryRow:
     summary_key = summary_dict.key
     value = summary_dict.value
     std_dev = float(_handle_error_mode(np.array(value), summary_dict))
@@ -323,13 +367,18 @@ def _handle_summary_observation(
             "Observation uncertainty must be strictly > 0", summary_key
         ) from None
 
+    return summary_key, obs_key, date, value, std_dev
+
+
+def _summary_rows_to_dataframe(rows: list[_SummaryRow]) -> pl.DataFrame:
+    response_keys, observation_keys, dates, values, std_devs = zip(*rows, strict=True)
     return pl.DataFrame(
         {
-            "response_key": [summary_key],
-            "observation_key": [obs_key],
-            "time": pl.Series([date]).dt.cast_time_unit("ms"),
-            "observations": pl.Series([value], dtype=pl.Float32),
-            "std": pl.Series([std_dev], dtype=pl.Float32),
+            "response_key": pl.Series(response_keys, dtype=pl.String),
+            "observation_key": pl.Series(observation_keys, dtype=pl.String),
+            "time": pl.Series(dates, dtype=pl.Datetime("ms")),
+            "observations": pl.Series(values, dtype=pl.Float32),
+            "std": pl.Series(std_devs, dtype=pl.Float32),
         }
     )
 
@@ -338,7 +387,7 @@ def _handle_general_observation(
     ensemble_config: EnsembleConfig,
     general_observation: GeneralObservation,
     obs_key: str,
-    time_map: list[datetime],
+    time_map: _TimeMap,
     has_refcase: bool,
 ) -> pl.DataFrame:
     response_key = general_observation.data
@@ -83,7 +83,9 @@ def get_gen_kw_templates(config_dict: ConfigDict) -> list[tuple[str, str]]:
         ]
 
     @classmethod
-    def from_dict(cls, config_dict: ConfigDict) -> EnsembleConfig:
+    def from_dict(
+        cls, config_dict: ConfigDict, refcase: Refcase | None = None
+    ) -> EnsembleConfig:
         # Grid file handling:
         # Each field can specify its own grid file, or fall back to a global grid.
         # If neither is provided, validation will fail when processing fields.
@@ -141,7 +143,8 @@ def make_field(field_list: list[str | dict[str, str]]) -> FieldConfig:
             if instance is not None and instance.keys:
                 response_configs.append(instance)
 
-        refcase = Refcase.from_config_dict(config_dict)
+        if refcase is None:
+            refcase = Refcase.from_config_dict(config_dict)
 
         return cls(
             response_configs={response.name: response for response in response_configs},
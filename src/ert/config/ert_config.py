@@ -20,6 +20,7 @@
 
 from ert.substitutions import Substitutions
 
+from ._config_cache import cached_config
 from ._create_observation_dataframes import create_observation_dataframes
 from ._design_matrix_validator import DesignMatrixValidator
 from ._observations import (
@@ -57,6 +58,7 @@
 )
 from .parsing.observations_parser import ObservationDict
 from .queue_config import KnownQueueOptions, QueueConfig
+from .refcase import Refcase
 from .workflow import Workflow
 from .workflow_fixtures import fixtures_per_hook
 from .workflow_job import (
@@ -238,6 +240,8 @@ def handle_default(fm_step: ForwardModelStep, arg: str) -> str:
             ),
             "max_running_minutes": fm_step.max_running_minutes,
         }
+        if fm_step.depends_on is not None:
+            fm_step_json["depends_on"] = fm_step.depends_on
 
         try:
             if not skip_pre_experiment_validation:
@@ -255,7 +259,7 @@ def handle_default(fm_step: ForwardModelStep, arg: str) -> str:
     if job_list_errors:
         raise ConfigValidationError.from_collected(job_list_errors)
 
-    return {
+    forward_model_json: ForwardModelJSON = {
         "global_environment": env_vars,
         "config_path": config_path,
         "config_file": config_file,
@@ -263,6 +267,12 @@ def handle_default(fm_step: ForwardModelStep, arg: str) -> str:
         "run_id": run_id,
         "ert_pid": str(os.getpid()),
     }
+    if any(fm_step.depends_on is not None for fm_step in forward_model_steps):
+        num_cpu = context.get("<NUM_CPU>", "1")
+        forward_model_json["max_parallel_steps"] = (
+            int(num_cpu) if num_cpu.isdigit() else 1
+        )
+    return forward_model_json
 
 
 def check_non_utf_chars(file_path: str) -> None:
@@ -653,9 +663,54 @@ def create_list_of_forward_model_steps_to_run(
     if errors:
         raise ConfigValidationError.from_collected(errors)
 
+    if config_dict.get(ConfigKeys.PARALLEL_FORWARD_MODEL, False):
+        infer_forward_model_step_dependencies(fm_steps)
+
     return fm_steps
 
 
+def _files_referenced_by_step(fm_step: ForwardModelStep) -> set[str]:
+    """The arguments and files of a forward model step, normalized so that
+    different files with the same base name, like CASE.DATA and CASE.UNSMRY,
+    are considered the same."""
+    private_args = Substitutions(fm_step.private_args)
+    references = [
+        private_args.substitute(fm_step.default_mapping.get(arg, arg))
+        for arg in fm_step.arglist
+    ]
+    references += [
+        file
+        for file in (fm_step.stdin_file, fm_step.start_file, fm_step.target_file)
+        if file is not None
+    ]
+    files = set()
+    for reference in references:
+        directory, name = path.split(path.normpath(reference))
+        stem = name.split(".", maxsplit=1)[0]
+        files.add(path.join(directory, stem) if stem else reference)
+    return files
+
+
+def infer_forward_model_step_dependencies(fm_steps: list[ForwardModelStep]) -> None:
+    """Sets which earlier steps each forward model step depends on, so that
+    steps can run concurrently.
+
+    A step depends on an earlier step if they refer to a common file. Steps
+    without any arguments or files can not be reasoned about, and depend on
+    all earlier steps, and all later steps depend on them.
+    """
+    referenced_files = [_files_referenced_by_step(fm_step) for fm_step in fm_steps]
+    for index, fm_step in enumerate(fm_steps):
+        files = referenced_files[index]
+        fm_step.depends_on = [
+            earlier
+            for earlier in range(index)
+            if not files
+            or not referenced_files[earlier]
+            or files & referenced_files[earlier]
+        ]
+
+
 def log_observation_keys(
     observations: list[ObservationDict],
 ) -> None:
@@ -814,12 +869,17 @@ class ErtConfigWithPlugins(ErtConfig):
         return ErtConfigWithPlugins
 
     @classmethod
-    def from_file(cls, user_config_file: str) -> Self:
+    def from_file(cls, user_config_file: str, use_cache: bool = False) -> Self:
         """
         Reads the given :ref:`User Config File<List of keywords>` and the
         `Site wide configuration` and returns an ErtConfig containing the
         configured values specified in those files.
 
+        With use_cache, the parsed configuration, the refcase and the
+        observations are cached in the user's cache directory, and are used
+        as long as the configuration file, the files it includes and the
+        observation and refcase files are unchanged.
+
         Raises:
             ConfigValidationError: Signals one or more incorrectly configured
             value(s) that the user needs to fix before ert can run.
@@ -830,12 +890,37 @@ def from_file(cls, user_config_file: str) -> Self:
         """
         user_config_contents = read_file(user_config_file)
         cls._log_config_file(user_config_file, user_config_contents)
-        user_config_dict = cls._config_dict_from_contents(
-            user_config_contents,
-            user_config_file,
+        if use_cache:
+            return cached_config(
+                user_config_file,
+                user_config_contents,
+                lambda: cls._config_dict_from_contents(
+                    user_config_contents,
+                    user_config_file,
+                ),
+                cls._from_parsed_dict,
+            )
+        return cls._from_parsed_dict(
+            cls._config_dict_from_contents(
+                user_config_contents,
+                user_config_file,
+            )
         )
+
+    @classmethod
+    def _from_parsed_dict(
+        cls,
+        user_config_dict: ConfigDict,
+        refcase: Refcase | None = None,
+        observations: dict[str, pl.DataFrame] | None = None,
+    ) -> Self:
+        # Logged here, and not when parsing, so that it is logged for a
+        # cached configuration as well
+        cls._log_custom_forward_model_steps(user_config_dict)
         cls._log_config_dict(user_config_dict)
-        return cls.from_dict(user_config_dict)
+        return cls.from_dict(
+            user_config_dict, refcase=refcase, observations=observations
+        )
 
     @classmethod
     def _config_dict_from_contents(
@@ -847,8 +932,6 @@ def _config_dict_from_contents(
             user_config_contents,
             file_name=config_file_name,
         )
-        cls._log_custom_forward_model_steps(user_config_dict)
-
         config_dir = path.abspath(path.dirname(config_file_name))
         cls.apply_config_content_defaults(user_config_dict, config_dir)
         return user_config_dict
@@ -859,15 +942,25 @@ def from_file_contents(
         user_config_contents: str,
         config_file_name: str = "./config.ert",
     ) -> Self:
-        return cls.from_dict(
-            cls._config_dict_from_contents(
-                user_config_contents,
-                config_file_name,
-            )
+        user_config_dict = cls._config_dict_from_contents(
+            user_config_contents,
+            config_file_name,
         )
+        cls._log_custom_forward_model_steps(user_config_dict)
+        return cls.from_dict(user_config_dict)
 
     @classmethod
-    def from_dict(cls, config_dict: ConfigDict) -> Self:
+    def from_dict(
+        cls,
+        config_dict: ConfigDict,
+        refcase: Refcase | None = None,
+        observations: dict[str, pl.DataFrame] | None = None,
+    ) -> Self:
+        """
+        Builds the ErtConfig from a config dict. The refcase and the
+        observations are read from the files in the config dict, unless they
+        are given.
+        """
         substitutions = _substitutions_from_dict(config_dict)
         runpath_file = config_dict.get(
             ConfigKeys.RUNPATH_FILE, ErtConfig.DEFAULT_RUNPATH_FILE
@@ -971,7 +1064,9 @@ def from_dict(cls, config_dict: ConfigDict) -> Self:
                     config_dict[ConfigKeys.SUMMARY] = [summary_keys] + [
                         [key] for key in summary_obs if key not in summary_keys
                     ]
-            ensemble_config = EnsembleConfig.from_dict(config_dict=config_dict)
+            ensemble_config = EnsembleConfig.from_dict(
+                config_dict=config_dict, refcase=refcase
+            )
             time_map = None
             if time_map_args := config_dict.get(ConfigKeys.TIME_MAP):
                 time_map_file, time_map_contents = time_map_args
@@ -1069,11 +1164,15 @@ def from_dict(cls, config_dict: ConfigDict) -> Self:
             # The observations are created here because create_observation_dataframes
             # will perform additonal validation which needs the context in
             # obs_configs which is stripped by pydantic
-            cls_config._observations = create_observation_dataframes(
-                obs_configs,
-                ensemble_config,
-                time_map,
-                history_source,
+            cls_config._observations = (
+                observations
+                if observations is not None
+                else create_observation_dataframes(
+                    obs_configs,
+                    ensemble_config,
+                    time_map,
+                    history_source,
+                )
             )
         except PydanticValidationError as err:
             raise ConfigValidationError.from_pydantic(err) from err
@@ -8,11 +8,12 @@
 
 import networkx as nx
 import numpy as np
+import polars as pl
 import xarray as xr
 
 from ert.substitutions import substitute_runpath_name
 
-from .parameter_config import ParameterConfig, ParameterMetadata
+from .parameter_config import ParameterCardinality, ParameterConfig, ParameterMetadata
 
 if TYPE_CHECKING:
     import numpy.typing as npt
@@ -40,6 +41,10 @@ def parameter_keys(self) -> list[str]:
     def metadata(self) -> list[ParameterMetadata]:
         return []
 
+    @property
+    def cardinality(self) -> ParameterCardinality:
+        return ParameterCardinality.one_config_per_ensemble_dataset
+
     type: Literal["everest_parameters"] = "everest_parameters"
     input_keys: list[str] = field(default_factory=list)
     forward_init: bool = False
@@ -61,17 +66,18 @@ def write_to_runpath(
         Path.mkdir(file_path.parent, exist_ok=True, parents=True)
 
         data: MutableDataType = {}
-        for da in ensemble.load_parameters(self.name, real_nr)["values"]:
-            assert isinstance(da, xr.DataArray)
-            name = str(da.names.values)
+        df = ensemble.load_parameters(self.name, real_nr)
+        assert isinstance(df, pl.DataFrame)
+        for key, value in df.drop("realization").row(0, named=True).items():
+            name = key.removeprefix(f"{self.name}.").replace(".", "\0")
             try:
                 outer, inner = name.split("\0")
 
                 if outer not in data:
                     data[outer] = {}
-                data[outer][inner] = float(da)  # type: ignore
+                data[outer][inner] = float(value)  # type: ignore
             except ValueError:
-                data[name] = float(da)
+                data[name] = float(value)
 
         with open(file_path, "w", encoding="utf-8") as f:
             json.dump(data, f)
@@ -80,25 +86,36 @@ def create_storage_datasets(
         self,
         from_data: npt.NDArray[np.float64],
         iens_active_index: npt.NDArray[np.int_],
-    ) -> Iterator[tuple[int, xr.Dataset]]:
-        for i, realization in enumerate(iens_active_index):
-            yield (
-                int(realization),
-                xr.Dataset(
-                    {
-                        "values": ("names", from_data[:, i]),
-                        "names": [
-                            x.split(f"{self.name}.")[1].replace(".", "\0")
-                            for x in self.parameter_keys
-                        ],
-                    }
-                ),
-            )
+    ) -> Iterator[tuple[int | None, pl.DataFrame]]:
+        # All realizations are stored together, one column per control
+        yield (
+            None,
+            pl.DataFrame(
+                {
+                    "realization": iens_active_index,
+                    **{
+                        key: pl.Series(from_data[i, :], dtype=pl.Float64)
+                        for i, key in enumerate(self.parameter_keys)
+                    },
+                }
+            ),
+        )
 
     def load_parameters(
         self, ensemble: Ensemble, realizations: npt.NDArray[np.int_]
     ) -> npt.NDArray[np.float64]:
-        raise NotImplementedError
+        df = ensemble.load_parameters(self.name, realizations)
+        assert isinstance(df, pl.DataFrame)
+        return df.drop("realization").to_numpy().T.copy()
+
+    def copy_parameters(
+        self,
+        source_ensemble: Ensemble,
+        target_ensemble: Ensemble,
+        realizations: npt.NDArray[np.int_],
+    ) -> None:
+        df = source_ensemble.load_parameters(self.name, realizations)
+        target_ensemble.save_parameters(df, self.name)
 
     def load_parameter_graph(self) -> nx.Graph[int]:
         raise NotImplementedError
@@ -47,6 +47,8 @@ class ForwardModelStepJSON(TypedDict):
             environment of the forward model step run
         max_running_minutes: Maximum runtime in minutes. If the forward model step
             takes longer than this, the step is requested to be cancelled.
+        depends_on: Indices of the steps that must complete before this step
+            is started. If not given, the steps are run one at a time in order.
     """
 
     name: str
@@ -60,6 +62,7 @@ class ForwardModelStepJSON(TypedDict):
     argList: list[str]
     environment: dict[str, str] | None
     max_running_minutes: int | None
+    depends_on: NotRequired[list[int]]
 
 
 class ForwardModelStepOptions(TypedDict, total=False):
@@ -125,6 +128,8 @@ class ForwardModelStep(BaseModel):
         private_args: A dictionary of user-provided keyword arguments.
             For example, if the user provides <A>=2, the dictionary will contain
             { "A": "2" }
+        depends_on: Indices of the forward model steps that must complete
+            before this step can start, None if the steps run in order.
     """
 
     name: str
@@ -144,6 +149,7 @@ class ForwardModelStep(BaseModel):
     environment: dict[str, str] = Field(default_factory=dict)
     default_mapping: dict[str, str] = Field(default_factory=dict)
     private_args: dict[str, str] = Field(default_factory=dict)
+    depends_on: list[int] | None = None
 
     default_env: ClassVar[dict[str, str]] = {
         "_ERT_ITERATION_NUMBER": "<ITER>",
@@ -257,3 +263,4 @@ class ForwardModelJSON(TypedDict):
     jobList: list[ForwardModelStepJSON]
     run_id: str | None
     ert_pid: str
+    max_parallel_steps: NotRequired[int]
@@ -1,9 +1,12 @@
 import os
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
 from typing import Any, Literal, Self, cast
 
 import numpy as np
+import numpy.typing as npt
 import polars as pl
 from pydantic import Field
 
@@ -18,6 +21,60 @@
 )
 from .responses_index import responses_index
 
+MAX_GEN_DATA_READ_WORKERS = 8
+GEN_DATA_BINARY_SUFFIX = ".npy"
+
+
+def _binary_file(filename: Path) -> Path:
+    return filename.parent / (filename.name + GEN_DATA_BINARY_SUFFIX)
+
+
+def _exists(filename: Path) -> bool:
+    return filename.exists() or _binary_file(filename).exists()
+
+
+def _read_values(filename: Path) -> npt.NDArray[np.float64]:
+    """Reads a GEN_DATA file with one value per line.
+
+    A forward model can save the values with numpy.save to the file name
+    with .npy appended, which is then read instead of the text file, unless
+    it is older than the text file.
+    """
+    binary_file = _binary_file(filename)
+    if binary_file.exists() and (
+        not filename.exists() or binary_file.stat().st_mtime >= filename.stat().st_mtime
+    ):
+        try:
+            data = np.load(binary_file, allow_pickle=False)
+        except (ValueError, OSError, EOFError) as err:
+            raise InvalidResponseFile(f"{binary_file}: {err}") from err
+        if data.ndim > 1:
+            raise InvalidResponseFile(
+                f"{binary_file} has shape {data.shape}, expected one dimension"
+            )
+        return np.atleast_1d(data).astype(np.float64)
+
+    if not filename.exists():
+        raise FileNotFoundError(f"{filename} not found.")
+    with suppress(pl.exceptions.PolarsError, ValueError):
+        values = pl.read_csv(
+            filename,
+            has_header=False,
+            schema={"values": pl.Float64},
+            comment_prefix="#",
+            quote_char=None,
+        )["values"]
+        # Empty lines are read as missing values
+        if values.null_count() == 0:
+            return values.to_numpy(writable=True)
+
+    # Files that can not be read as one value per line, such as files with
+    # empty lines or several values on one line, are read by numpy
+    try:
+        return np.loadtxt(filename, ndmin=1)
+    except ValueError as err:
+        raise InvalidResponseFile(str(err)) from err
+
 
 class GenDataConfig(ResponseConfig):
     type: Literal["gen_data"] = "gen_data"
@@ -138,62 +195,50 @@ def from_config_dict(cls, config_dict: ConfigDict) -> Self:
         )
 
     def read_from_file(self, run_path: str, iens: int, iter_: int) -> pl.DataFrame:
-        def _read_file(filename: Path, report_step: int) -> pl.DataFrame:
-            try:
-                data = np.loadtxt(filename, ndmin=1)
-            except ValueError as err:
-                raise InvalidResponseFile(str(err)) from err
+        def _read_file(filename: Path) -> npt.NDArray[np.float64]:
+            data = _read_values(filename)
             active_information_file = filename.parent / (filename.name + "_active")
-            if active_information_file.exists():
-                try:
-                    active_list = np.loadtxt(active_information_file)
-                except ValueError as err:
-                    raise InvalidResponseFile(str(err)) from err
+            if _exists(active_information_file):
+                active_list = _read_values(active_information_file)
                 data[active_list == 0] = np.nan
-            return pl.DataFrame(
-                {
-                    "report_step": pl.Series(
-                        np.full(len(data), report_step), dtype=pl.UInt16
-                    ),
-                    "index": pl.Series(np.arange(len(data)), dtype=pl.UInt16),
-                    "values": pl.Series(data, dtype=pl.Float32),
-                }
-            )
-
-        errors = []
+            return data
 
         run_path_ = Path(run_path)
-        datasets_per_name = []
-
+        files_to_read: list[tuple[str, int, Path]] = []
         for name, input_file, report_steps in zip(
             self.keys, self.input_files, self.report_steps_list, strict=False
         ):
-            datasets_per_report_step = []
             if report_steps is None:
-                try:
-                    filename = substitute_runpath_name(input_file, iens, iter_)
-                    datasets_per_report_step.append(_read_file(run_path_ / filename, 0))
-                except (InvalidResponseFile, FileNotFoundError) as err:
-                    errors.append(err)
+                filename = substitute_runpath_name(input_file, iens, iter_)
+                files_to_read.append((name, 0, run_path_ / filename))
             else:
                 for report_step in report_steps:
                     filename = substitute_runpath_name(
                         input_file % report_step, iens, iter_
                     )
-                    try:
-                        datasets_per_report_step.append(
-                            _read_file(run_path_ / filename, report_step)
-                        )
-                    except (InvalidResponseFile, FileNotFoundError) as err:
-                        errors.append(err)
-
-            if len(datasets_per_report_step) > 0:
-                ds_all_report_steps = pl.concat(datasets_per_report_step)
-                ds_all_report_steps.insert_column(
-                    0, pl.Series("response_key", [name] * len(ds_all_report_steps))
+                    files_to_read.append((name, report_step, run_path_ / filename))
+
+        def _try_read_file(
+            filename: Path,
+        ) -> npt.NDArray[np.float64] | InvalidResponseFile | FileNotFoundError:
+            try:
+                return _read_file(filename)
+            except (InvalidResponseFile, FileNotFoundError) as err:
+                return err
+
+        if len(files_to_read) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_GEN_DATA_READ_WORKERS, len(files_to_read))
+            ) as executor:
+                results = list(
+                    executor.map(
+                        _try_read_file, [filename for *_, filename in files_to_read]
+                    )
                 )
-                datasets_per_name.append(ds_all_report_steps)
+        else:
+            results = [_try_read_file(filename) for *_, filename in files_to_read]
 
+        errors = [result for result in results if isinstance(result, Exception)]
         if errors:
             if all(isinstance(err, FileNotFoundError) for err in errors):
                 raise FileNotFoundError(
@@ -206,8 +251,43 @@ def _read_file(filename: Path, report_step: int) -> pl.DataFrame:
                     f"{self.name}, errors: {','.join([str(err) for err in errors])}"
                 )
 
-        combined = pl.concat(datasets_per_name)
-        return combined
+        data_per_name: dict[str, list[tuple[int, npt.NDArray[np.float64]]]] = {}
+        for (name, report_step, _), data in zip(files_to_read, results, strict=True):
+            assert not isinstance(data, Exception)
+            data_per_name.setdefault(name, []).append((report_step, data))
+
+        return pl.concat(
+            pl.DataFrame(
+                {
+                    "response_key": pl.repeat(
+                        name,
+                        sum(len(data) for _, data in data_per_report_step),
+                        dtype=pl.String,
+                        eager=True,
+                    ),
+                    "report_step": pl.Series(
+                        np.concatenate(
+                            [
+                                np.full(len(data), report_step)
+                                for report_step, data in data_per_report_step
+                            ]
+                        ),
+                        dtype=pl.UInt16,
+                    ),
+                    "index": pl.Series(
+                        np.concatenate(
+                            [np.arange(len(data)) for _, data in data_per_report_step]
+                        ),
+                        dtype=pl.UInt16,
+                    ),
+                    "values": pl.Series(
+                        np.concatenate([data for _, data in data_per_report_step]),
+                        dtype=pl.Float32,
+                    ),
+                }
+            )
+            for name, data_per_report_step in data_per_name.items()
+        )
 
     def get_args_for_key(self, key: str) -> tuple[str | None, list[int] | None]:
         for i, _key in enumerate(self.keys):
@@ -33,10 +33,14 @@ class ParameterCardinality(StrEnum):
 
     one_config_per_realization_dataset: one config instance per group, one
     dataset per realization
+
+    one_config_per_ensemble_dataset: one config instance per group, one
+    dataset per group with all realizations of the ensemble
     """
 
     multiple_configs_per_ensemble_dataset = auto()
     one_config_per_realization_dataset = auto()
+    one_config_per_ensemble_dataset = auto()
 
 
 class ParameterMetadata(BaseModel):
@@ -15,13 +15,14 @@
     ObservationType,
     parse_observations,
 )
-from .queue_system import QueueSystem
+from .queue_system import ChecksumVerification, QueueSystem
 from .schema_item_type import SchemaItemType
 from .workflow_job_keywords import WorkflowJobKeys
 from .workflow_job_schema import init_workflow_job_schema
 from .workflow_schema import init_workflow_schema
 
 __all__ = [
+    "ChecksumVerification",
     "ConfigDict",
     "ConfigKeys",
     "ConfigValidationError",
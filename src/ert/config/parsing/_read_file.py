@@ -1,14 +1,31 @@
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 
 from .config_errors import ConfigValidationError, ErrorInfo
 from .file_context_token import FileContextToken
 
+_files_read: ContextVar[dict[str, str] | None] = ContextVar("files_read", default=None)
+
+
+@contextmanager
+def record_files_read() -> Iterator[dict[str, str]]:
+    """Records the path and content of every file read with read_file in
+    the context."""
+    files_read: dict[str, str] = {}
+    reset_token = _files_read.set(files_read)
+    try:
+        yield files_read
+    finally:
+        _files_read.reset(reset_token)
+
 
 def read_file(file: str, token: FileContextToken | None = None) -> str:
     file = os.path.normpath(os.path.abspath(file))
     try:
-        return Path(file).read_text(encoding="utf-8")
+        content = Path(file).read_text(encoding="utf-8")
     except OSError as err:
         raise ConfigValidationError.with_context(str(err), token or file) from err
     except UnicodeDecodeError as e:
@@ -53,3 +70,6 @@ def read_file(file: str, token: FileContextToken | None = None) -> str:
                 for bad_line in bad_byte_lines
             ]
         ) from e
+    if (files_read := _files_read.get()) is not None:
+        files_read[file] = content
+    return content
@@ -51,6 +51,8 @@ class ConfigKeys(StrEnum):
     LOAD_WORKFLOW_JOB = "LOAD_WORKFLOW_JOB"
     STOP_LONG_RUNNING = "STOP_LONG_RUNNING"
     MAX_RUNTIME = "MAX_RUNTIME"
+    CHECKSUM_VERIFICATION = "CHECKSUM_VERIFICATION"
+    PARALLEL_FORWARD_MODEL = "PARALLEL_FORWARD_MODEL"
     TIME_MAP = "TIME_MAP"
     NUM_CPU = "NUM_CPU"
     REALIZATION_MEMORY = "REALIZATION_MEMORY"
@@ -17,7 +17,7 @@
 from .history_source import HistorySource
 from .hook_runtime import HookRuntime
 from .observations_parser import parse_observations
-from .queue_system import QueueSystem
+from .queue_system import ChecksumVerification, QueueSystem
 from .schema_dict import SchemaItemDict
 from .schema_item_type import SchemaItemType
 
@@ -96,6 +96,22 @@ def stop_long_running_keyword() -> SchemaItem:
     )
 
 
+def parallel_forward_model_keyword() -> SchemaItem:
+    return SchemaItem(
+        kw=ConfigKeys.PARALLEL_FORWARD_MODEL,
+        type_map=[SchemaItemType.BOOL],
+    )
+
+
+def checksum_verification_keyword() -> SchemaItem:
+    return SchemaItem(
+        kw=ConfigKeys.CHECKSUM_VERIFICATION,
+        argc_min=1,
+        argc_max=1,
+        type_map=[ChecksumVerification],
+    )
+
+
 def analysis_set_var_keyword() -> SchemaItem:
     return SchemaItem(
         kw=ConfigKeys.ANALYSIS_SET_VAR,
@@ -304,6 +320,8 @@ def init_user_config_schema() -> ConfigSchemaDict:
         string_keyword(ConfigKeys.MIN_REALIZATIONS),
         int_keyword(ConfigKeys.MAX_RUNTIME),
         stop_long_running_keyword(),
+        checksum_verification_keyword(),
+        parallel_forward_model_keyword(),
         analysis_set_var_keyword(),
         # the two fault types are just added to the config object only to
         # be able to print suitable messages before exiting.
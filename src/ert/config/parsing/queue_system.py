@@ -9,6 +9,20 @@ def _ignore_case(enum: type[StrEnum], value: str) -> StrEnum | None:
     return None
 
 
+class ChecksumVerification(StrEnum):
+    """How files in the manifest of a forward model are verified before
+    they are loaded. Comparing size and modification time is cheaper than
+    hashing the files, as no file has to be read."""
+
+    MD5 = auto()
+    SIZE_MTIME = auto()
+
+    @classmethod
+    def _missing_(cls, value: object) -> StrEnum | None:
+        assert isinstance(value, str)
+        return _ignore_case(cls, value)
+
+
 class QueueSystem(StrEnum):
     LSF = auto()
     LOCAL = auto()
@@ -24,6 +24,7 @@
 
 from ._get_num_cpu import get_num_cpu_from_data_file
 from .parsing import (
+    ChecksumVerification,
     ConfigDict,
     ConfigKeys,
     ConfigValidationError,
@@ -362,6 +363,7 @@ class QueueConfig(BaseModelWithContextSupport):
     )
     stop_long_running: bool = False
     max_runtime: int | None = None
+    checksum_verification: ChecksumVerification = ChecksumVerification.MD5
 
     @classmethod
     def from_dict(
@@ -476,6 +478,9 @@ def from_dict(
             queue_options=selected_queue_options,
             stop_long_running=bool(stop_long_running),
             max_runtime=config_dict.get(ConfigKeys.MAX_RUNTIME),
+            checksum_verification=config_dict.get(
+                ConfigKeys.CHECKSUM_VERIFICATION, ChecksumVerification.MD5
+            ),
         )
 
     def create_local_copy(self) -> QueueConfig:
@@ -485,6 +490,7 @@ def create_local_copy(self) -> QueueConfig:
             queue_options=LocalQueueOptions(max_running=self.max_running),
             stop_long_running=bool(self.stop_long_running),
             max_runtime=self.max_runtime,
+            checksum_verification=self.checksum_verification,
         )
 
     @property
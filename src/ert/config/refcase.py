@@ -1,11 +1,13 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from typing import Self
 
 import numpy as np
+import numpy.typing as npt
 
-from ._read_summary import read_summary
+from ._read_summary import DateUnit, _get_summary_filenames, _read_spec, _read_summary
 from .parsing.config_dict import ConfigDict
 from .parsing.config_errors import ConfigValidationError
 from .parsing.config_keywords import ConfigKeys
@@ -13,10 +15,21 @@
 
 @dataclass(eq=False)
 class Refcase:
+    """The summary vectors of a reference case.
+
+    Only the keys and dates are read when the refcase is created. The values
+    of a vector are read from the summary file the first time they are
+    asked for, so memory use and load time scale with the number of keys
+    that are used, and not with the size of the refcase.
+    """
+
     start_date: datetime
     keys: list[str]
     dates: Sequence[datetime]
-    values: list[list[float]]
+    summary_file: str
+    date_unit: DateUnit
+    date_index: int
+    indices: list[int]
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Refcase):
@@ -25,27 +38,85 @@ def __eq__(self, other: object) -> bool:
             self.start_date == other.start_date
             and self.keys == other.keys
             and self.dates == other.dates
-            and np.all(self.values == other.values)
+            and self.summary_file == other.summary_file
         )
 
     @property
     def all_dates(self) -> list[datetime]:
         return [self.start_date, *self.dates]
 
+    @cached_property
+    def _key_indices(self) -> dict[str, int]:
+        return dict(zip(self.keys, self.indices, strict=True))
+
+    @cached_property
+    def _values(self) -> dict[str, npt.NDArray[np.float32]]:
+        return {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._key_indices
+
+    def load(self, keys: Iterable[str]) -> None:
+        """Reads the values of the given keys that are in the refcase and not
+        read before, in one pass over the summary file."""
+        to_load = [
+            key
+            for key in dict.fromkeys(keys)
+            if key in self._key_indices and key not in self._values
+        ]
+        if not to_load:
+            return
+        try:
+            values, _ = _read_summary(
+                self.summary_file,
+                self.start_date,
+                self.date_unit,
+                np.array([self._key_indices[key] for key in to_load], dtype=np.int64),
+                self.date_index,
+            )
+        except Exception as err:
+            raise ConfigValidationError(
+                f"Could not read refcase {self.summary_file}: {err}"
+            ) from err
+        values = values.reshape(len(to_load), len(self.dates))
+        self._values.update(zip(to_load, values, strict=True))
+
+    def values(self, key: str) -> npt.NDArray[np.float64]:
+        """The values of the summary vector with the given key at each of the
+        dates. Raises KeyError if the key is not in the refcase."""
+        if key not in self._key_indices:
+            raise KeyError(key)
+        self.load([key])
+        return self._values[key].astype(np.float64)
+
     @classmethod
     def from_config_dict(cls, config_dict: ConfigDict) -> Self | None:
-        data = None
         refcase_file_path = config_dict.get(ConfigKeys.REFCASE)
-        if refcase_file_path is not None:
-            try:
-                start_date, refcase_keys, time_map, data = read_summary(
-                    str(refcase_file_path), ["*"]
-                )
-            except Exception as err:
-                raise ConfigValidationError(f"Could not read refcase: {err}") from err
-
-        return (
-            cls(start_date, refcase_keys, time_map, data.tolist())
-            if data is not None
-            else None
+        if refcase_file_path is None:
+            return None
+        try:
+            summary_file, spec_file = _get_summary_filenames(str(refcase_file_path))
+            date_index, start_date, date_unit, keys, indices = _read_spec(
+                spec_file, ["*"]
+            )
+            _, dates = _read_summary(
+                summary_file,
+                start_date,
+                date_unit,
+                np.array([], dtype=np.int64),
+                date_index,
+            )
+        except Exception as err:
+            raise ConfigValidationError(
+                f"Could not read refcase {refcase_file_path}: {err}"
+            ) from err
+
+        return cls(
+            start_date,
+            keys,
+            dates,
+            summary_file,
+            date_unit,
+            date_index,
+            indices.tolist(),
         )
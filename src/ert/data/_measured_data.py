@@ -12,6 +12,7 @@
 
 import numpy as np
 import pandas as pd
+import polars as pl
 
 if TYPE_CHECKING:
     from ert.storage import Ensemble
@@ -99,10 +100,17 @@ def _get_data(
 
         active_realizations = ensemble.get_realization_list_with_responses()
 
-        # Check if responses exist for all selected response types
+        # Check if responses exist for all selected response types. Only the
+        # row count is collected, the values are loaded once further down by
+        # get_observations_and_responses
         for response_type in selected_response_types:
-            df = ensemble.load_responses(response_type, tuple(active_realizations))
-            if df.is_empty():
+            num_rows = (
+                ensemble.load_responses_lazy(response_type, tuple(active_realizations))
+                .select(pl.len())
+                .collect()
+                .item()
+            )
+            if num_rows == 0:
                 raise ResponseError(
                     f"No response loaded for observation type: {response_type}"
                 )
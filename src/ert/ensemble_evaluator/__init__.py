@@ -1,7 +1,7 @@
 from ._ensemble import LegacyEnsemble as Ensemble
 from ._ensemble import Realization
 from .config import EvaluatorServerConfig
-from .evaluator import EnsembleEvaluator
+from .evaluator import EnsembleEvaluator, PersistentEnsembleEvaluator
 from .event import EndEvent, FullSnapshotEvent, SnapshotUpdateEvent, WarningEvent
 from .snapshot import EnsembleSnapshot, FMStepSnapshot, RealizationSnapshot
 
@@ -13,6 +13,7 @@
     "EvaluatorServerConfig",
     "FMStepSnapshot",
     "FullSnapshotEvent",
+    "PersistentEnsembleEvaluator",
     "Realization",
     "RealizationSnapshot",
     "SnapshotUpdateEvent",
@@ -34,11 +34,11 @@
 from _ert.forward_model_runner.fm_dispatch import FORWARD_MODEL_TERMINATED_MSG
 from ert.ensemble_evaluator import identifiers as ids
 from ert.ensemble_evaluator import state
-from ert.scheduler import create_driver
+from ert.scheduler import Driver, create_driver
 from ert.scheduler.scheduler import Scheduler
 from ert.shared.net_utils import get_machine_name
 
-from ..config import QueueSystem
+from ..config import QueueConfig, QueueSystem
 from ._ensemble import FMStepSnapshot
 from ._ensemble import LegacyEnsemble as Ensemble
 from .config import EvaluatorServerConfig
@@ -75,11 +75,20 @@ def __init__(
         config: EvaluatorServerConfig,
         end_event: threading.Event,
         event_handler: Callable[[EEEvent], None] | None = None,
+    ) -> None:
+        self._init_event_pipeline(config, end_event)
+        self._set_ensemble(
+            ensemble,
+            event_handler,
+            create_driver(ensemble._queue_config.queue_options),
+        )
+
+    def _init_event_pipeline(
+        self, config: EvaluatorServerConfig, end_event: threading.Event
     ) -> None:
         self._config: EvaluatorServerConfig = config
         if self._config is None:
             raise ValueError("no config for evaluator")
-        self._ensemble: Ensemble = ensemble
 
         self._events: asyncio.Queue[SnapshotInputEvent] = asyncio.Queue()
         self._events_to_send: asyncio.Queue[EEEvent | EETerminated | EventSentinel] = (
@@ -101,6 +110,18 @@ def __init__(
         self._dispatchers_connected: set[bytes] = set()
         self._dispatchers_empty: asyncio.Event = asyncio.Event()
         self._dispatchers_empty.set()
+        self._end_event = end_event
+
+        self._publisher_receiving_timeout: float = 60.0
+        self._evaluation_result: asyncio.Future[bool] = asyncio.Future()
+
+    def _set_ensemble(
+        self,
+        ensemble: Ensemble,
+        event_handler: Callable[[EEEvent], None] | None,
+        driver: Driver,
+    ) -> None:
+        self._ensemble: Ensemble = ensemble
         # Send initial snapshot created by ensemble
         self._events_to_send.put_nowait(
             EESnapshot(
@@ -109,18 +130,15 @@ def __init__(
             )
         )
         self._event_handler = event_handler
-        self._end_event = end_event
-
-        self._publisher_receiving_timeout: float = 60.0
-        self._evaluation_result: asyncio.Future[bool] = asyncio.Future()
         self._scheduler = Scheduler(
-            create_driver(self.ensemble._queue_config.queue_options),
+            driver,
             self.ensemble.active_reals,
             self._manifest_queue,
             self._events,
             max_submit=self.ensemble._queue_config.max_submit,
             max_running=self.ensemble._queue_config.max_running,
             submit_sleep=self.ensemble._queue_config.submit_sleep,
+            checksum_verification=self.ensemble._queue_config.checksum_verification,
             ens_id=self.ensemble.id_,
         )
 
@@ -157,8 +175,7 @@ async def _publisher(self) -> None:
                         ENSEMBLE_STATE_FAILED,
                     }:
                         logger.debug("observed evaluation stopped event, signal done")
-                        await self._events_to_send.put(EventSentinel())
-                        self.stop()
+                        await self._on_ensemble_stopped()
 
                     elif event.snapshot.get(ids.STATUS) == ENSEMBLE_STATE_CANCELLED:
                         logger.debug(
@@ -170,7 +187,7 @@ async def _publisher(self) -> None:
                                 "Experiment cancelled by user during evaluation"
                             )
                         )
-                        self.stop()
+                        self._on_ensemble_cancelled()
 
             except TimeoutError:
                 if closetracker_received:  # THIS SHOULD NOT BE NEEDED ANYMORE
@@ -184,6 +201,13 @@ async def _publisher(self) -> None:
                 self._evaluation_result.set_result(False)
                 return
 
+    async def _on_ensemble_stopped(self) -> None:
+        await self._events_to_send.put(EventSentinel())
+        self.stop()
+
+    def _on_ensemble_cancelled(self) -> None:
+        self.stop()
+
     async def _monitor_end_event(self) -> None:
         while True:
             if self._end_event.is_set():
@@ -264,8 +288,17 @@ def set_event_handler(
                     batch.append((function, event))
                     self._events.task_done()
                 except asyncio.QueueEmpty:
+                    if not batch:
+                        # Nothing is held back, so all events so far are
+                        # passed on for processing
+                        self._complete_batch.set()
                     await asyncio.sleep(0.1)
                     continue
+                if isinstance(
+                    event, EnsembleSucceeded | EnsembleCancelled | EnsembleFailed
+                ):
+                    # No need to wait for more events once the ensemble is done
+                    break
             self._complete_batch.set()
             await self._batch_processing_queue.put(batch)
             if self._events.qsize() > 2 * self._max_batch_size:
@@ -400,16 +433,7 @@ async def _server(self) -> None:
             return
         try:
             await self._server_done.wait()
-            try:
-                await asyncio.wait_for(self._dispatchers_empty.wait(), timeout=5)
-            except TimeoutError:
-                logger.warning(
-                    "Not all dispatchers were disconnected when closing zmq server!"
-                )
-            await self._manifest_queue.join()
-            await self._events.join()
-            await self._complete_batch.wait()
-            await self._batch_processing_queue.join()
+            await self._wait_for_events_to_be_processed()
             event = EETerminated()
             await self._events_to_send.put(event)
             await self._events_to_send.join()
@@ -426,6 +450,18 @@ async def _server(self) -> None:
                 logger.warning(f"Failed to clean up zmq context {exc}")
             logger.info("ZMQ cleanup done!")
 
+    async def _wait_for_events_to_be_processed(self) -> None:
+        try:
+            await asyncio.wait_for(self._dispatchers_empty.wait(), timeout=5)
+        except TimeoutError:
+            logger.warning(
+                "Not all dispatchers were disconnected when closing zmq server!"
+            )
+        await self._manifest_queue.join()
+        await self._events.join()
+        await self._complete_batch.wait()
+        await self._batch_processing_queue.join()
+
     def stop(self) -> None:
         self._server_done.set()
 
@@ -648,6 +684,149 @@ async def evaluate(
             await self._events.put(EnsembleCancelled(ensemble=self.ensemble.id_))
 
 
+class PersistentEnsembleEvaluator(EnsembleEvaluator):
+    """An evaluator that evaluates a sequence of ensembles, one at a time.
+
+    The server, the driver and the event pipeline are started once, and kept
+    running between the ensembles, instead of being set up and torn down for
+    each ensemble. This is for running many small ensembles, like the batches
+    of an Everest optimization.
+
+    Call start before evaluating the first ensemble with evaluate_ensemble,
+    and close after the last one.
+
+    Only the local queue is supported, as only the LocalDriver can be given
+    new jobs after it has finished.
+    """
+
+    def __init__(
+        self,
+        queue_config: QueueConfig,
+        config: EvaluatorServerConfig,
+        end_event: threading.Event,
+    ) -> None:
+        if queue_config.queue_system != QueueSystem.LOCAL:
+            raise ValueError(
+                "The persistent ensemble evaluator only supports the local "
+                f"queue, not {queue_config.queue_system}"
+            )
+        self._init_event_pipeline(config, end_event)
+        self._driver = create_driver(queue_config.queue_options)
+        self._finish_tasks: set[asyncio.Task[None]] = set()
+
+    async def start(self) -> None:
+        self._ee_tasks = [asyncio.create_task(self._server(), name="server_task")]
+        await self._server_started
+        self._ee_tasks += [
+            asyncio.create_task(
+                self._batch_events_into_buffer(), name="dispatcher_task"
+            ),
+            asyncio.create_task(self._process_event_buffer(), name="processing_task"),
+            asyncio.create_task(self._publisher(), name="publisher_task"),
+            asyncio.create_task(self.listen_for_messages(), name="listener_task"),
+        ]
+
+    async def evaluate_ensemble(
+        self,
+        ensemble: Ensemble,
+        event_handler: Callable[[EEEvent], None] | None = None,
+    ) -> list[int]:
+        """Evaluate the ensemble, and return its successful realizations.
+
+        Events from dispatchers of earlier ensembles are ignored, since they
+        are filtered on the ensemble id, and the events the driver has not
+        delivered for them are dropped.
+        """
+        self._evaluation_result = asyncio.Future()
+        # The iens of the ensembles repeat, so events the driver sent after
+        # the previous ensemble finished, like those of killed realizations,
+        # must not be read as events of this one
+        self._driver.clear_event_queue()
+        self._set_ensemble(ensemble, event_handler, self._driver)
+        ensemble_tasks = [
+            asyncio.create_task(self.evaluate(), name="ensemble_task"),
+            asyncio.create_task(
+                self._monitor_end_event(), name="monitor_end_event_task"
+            ),
+        ]
+        try:
+            pending: list[asyncio.Future[Any]] = [
+                self._evaluation_result,
+                *self._ee_tasks,
+            ]
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in self._ee_tasks:
+                if task not in done:
+                    continue
+                if task_exception := task.exception():
+                    self.log_exception(task_exception, task.get_name())
+                    raise task_exception
+                msg = f"Something went wrong, {task.get_name()} is done prematurely!"
+                logger.error(msg)
+                raise RuntimeError(msg)
+            if self._evaluation_result.result() is not True:
+                return []
+        finally:
+            # A cancelled ensemble has its dispatchers terminated by a task
+            # that belongs to it, and not to the ensembles that come after it
+            ensemble_tasks += [
+                task
+                for task in self._ee_tasks
+                if task.get_name() == "dispatcher_termination_task"
+            ]
+            self._ee_tasks = [
+                task for task in self._ee_tasks if task not in ensemble_tasks
+            ]
+            for task in ensemble_tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*ensemble_tasks, return_exceptions=True)
+
+        self._log_forward_model_steps_with_missing_status_updates()
+        return self._ensemble.get_successful_realizations()
+
+    async def close(self) -> None:
+        self.stop()
+        try:
+            if self._ee_tasks:
+                await asyncio.wait_for(
+                    asyncio.shield(self._ee_tasks[0]),
+                    timeout=self.CLOSE_SERVER_TIMEOUT,
+                )
+        except TimeoutError:
+            logger.info("Time-out while waiting for server_task to complete")
+        finally:
+            for task in self._ee_tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*self._ee_tasks, return_exceptions=True)
+        logger.debug("Evaluator is closed")
+
+    async def _on_ensemble_stopped(self) -> None:
+        # The ensemble is done when all of its events are processed, while
+        # the publisher keeps running for the next ensemble
+        task = asyncio.create_task(
+            self._finish_ensemble(self._evaluation_result),
+            name="finish_ensemble_task",
+        )
+        self._finish_tasks.add(task)
+        task.add_done_callback(self._finish_tasks.discard)
+
+    def _on_ensemble_cancelled(self) -> None:
+        pass
+
+    async def _finish_ensemble(self, evaluation_result: asyncio.Future[bool]) -> None:
+        try:
+            await self._wait_for_events_to_be_processed()
+            await self._events_to_send.join()
+        except Exception as err:
+            if not evaluation_result.done():
+                evaluation_result.set_exception(err)
+            return
+        if not evaluation_result.done():
+            evaluation_result.set_result(True)
+
+
 def detect_overspent_cpu(num_cpu: int, real_id: str, fm_step: FMStepSnapshot) -> str:
     """Produces a message warning about misconfiguration of NUM_CPU if
     so is detected. Returns an empty string if everything is ok."""
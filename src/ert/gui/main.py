@@ -147,11 +147,13 @@ def _start_initial_gui_window(
         args.config = os.path.basename(args.config)
 
         if runtime_plugins is not None:
-            ert_config = ErtConfig.with_plugins(runtime_plugins).from_file(args.config)
+            ert_config = ErtConfig.with_plugins(runtime_plugins).from_file(
+                args.config, use_cache=True
+            )
         else:
             with ErtPluginContext() as default_runtime_plugins:
                 ert_config = ErtConfig.with_plugins(default_runtime_plugins).from_file(
-                    args.config
+                    args.config, use_cache=True
                 )
         local_storage_set_ert_config(ert_config)
 
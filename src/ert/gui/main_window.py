@@ -98,6 +98,7 @@ def __init__(
         QMainWindow.__init__(self)
         self.available_fonts = QFontDatabase.families()
         self.notifier = ErtNotifier()
+        self.notifier.ertChanged.connect(self._refresh_plot_windows)
         self.plugins_tool: PluginsTool | None = None
         self.ert_config = ert_config
         self.config_file = config_file
@@ -177,6 +178,13 @@ def right_clicked(self) -> None:
     def get_external_plot_windows(self) -> list[PlotWindow]:
         return self._external_plot_windows
 
+    @Slot()
+    def _refresh_plot_windows(self) -> None:
+        if self._plot_window is not None:
+            self._plot_window.refresh()
+        for plot_window in self._external_plot_windows:
+            plot_window.refresh()
+
     def select_central_widget(self) -> None:
         actor = self.sender()
         if actor:
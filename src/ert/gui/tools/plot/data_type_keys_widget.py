@@ -124,6 +124,22 @@ def getSelectedItem(self) -> PlotApiKeyDefinition | None:
         item = self.model.itemAt(source_index)
         return item
 
+    def getNeighbourItems(self, distance: int = 1) -> list[PlotApiKeyDefinition]:
+        """The items up to distance rows above and below the selected item,
+        as the list is filtered."""
+        row = self.data_type_keys_widget.currentIndex().row()
+        if row < 0:
+            return []
+        items = []
+        for neighbour_row in range(row - distance, row + distance + 1):
+            index = self.filter_model.index(neighbour_row, 0)
+            if neighbour_row == row or not index.isValid():
+                continue
+            item = self.model.itemAt(self.filter_model.mapToSource(index))
+            if item is not None:
+                items.append(item)
+        return items
+
     def selectDefault(self) -> None:
         self.data_type_keys_widget.setCurrentIndex(self.filter_model.index(0, 0))
 
@@ -3,11 +3,15 @@
 import io
 import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from dataclasses import dataclass
 from functools import cached_property
 from itertools import combinations as combi
 from json.decoder import JSONDecodeError
-from typing import TYPE_CHECKING, Any, NamedTuple
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 from urllib.parse import quote
 
 import httpx
@@ -19,6 +23,7 @@
 
 from ert.config import ParameterMetadata, ResponseMetadata
 from ert.services import StorageService
+from ert.storage.local_storage import LocalStorage
 from ert.summary_key_type import history_key
 
 logger = logging.getLogger(__name__)
@@ -26,6 +31,10 @@
 if TYPE_CHECKING:
     from pathlib import Path
 
+T = TypeVar("T", pd.DataFrame, npt.NDArray[np.float32])
+
+PLOT_API_CACHE_MAX_BYTES = 512 * 1024**2
+
 
 @dataclass(frozen=True, eq=True)
 class EnsembleObject:
@@ -47,11 +56,117 @@ class PlotApiKeyDefinition(NamedTuple):
     response_metadata: ResponseMetadata | None = None
 
 
+def _size_in_bytes(value: pd.DataFrame | npt.NDArray[np.float32]) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    return int(value.nbytes)
+
+
+class _FrameCache:
+    """A thread safe cache of decoded frames and arrays, holding at most
+    max_bytes of them, and evicting the least recently used first. Each
+    value is stored with the state of the storage it was fetched in, and is
+    only returned while the storage is in that state."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._entries: OrderedDict[Hashable, tuple[Hashable, Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, state: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != state:
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, state: Hashable, value: Any, size: int) -> None:
+        if size > self._max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (state, value, size)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
+
+
 class PlotApi:
-    def __init__(self, ens_path: Path) -> None:
+    def __init__(
+        self, ens_path: Path, cache_max_bytes: int = PLOT_API_CACHE_MAX_BYTES
+    ) -> None:
         self.ens_path = ens_path
         self._all_ensembles: list[EnsembleObject] | None = None
         self._timeout = 120
+        self._cache = _FrameCache(cache_max_bytes)
+        self._ensemble_states: dict[str, Hashable] = {}
+
+    def refresh(self) -> None:
+        """Forget the ensembles and their fingerprints, so that data saved
+        to storage since they were taken is fetched again."""
+        self._all_ensembles = None
+        self._ensemble_states.clear()
+
+    def _ensemble_state(self, ensemble_id: str) -> Hashable:
+        """A fingerprint of the files of the ensemble, taken once until
+        refresh is called. None if the ensemble is not found on disk, then
+        nothing is cached for it."""
+        state = self._ensemble_states.get(ensemble_id)
+        if state is None:
+            state = self._scan_ensemble_state(ensemble_id)
+            if state is not None:
+                self._ensemble_states[ensemble_id] = state
+        return state
+
+    def _scan_ensemble_state(self, ensemble_id: str) -> Hashable:
+        """The inode, modification time and size of the files of the
+        ensemble, which change when data is saved to the ensemble, as the
+        storage writes a new file and renames it into place."""
+        ensemble_path = os.path.join(
+            self.ens_path, LocalStorage.ENSEMBLES_PATH, ensemble_id
+        )
+        files: list[tuple[str, str, int, int, int]] = []
+        try:
+            with os.scandir(ensemble_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        with os.scandir(entry.path) as realization_entries:
+                            files.extend(
+                                (entry.name, file.name, *_file_state(file))
+                                for file in realization_entries
+                            )
+                    else:
+                        files.append(("", entry.name, *_file_state(entry)))
+        except OSError:
+            return None
+        return hash(tuple(sorted(files)))
+
+    def _cached(
+        self,
+        key: Hashable,
+        state: Hashable,
+        fetch: Callable[[], T],
+    ) -> T:
+        """The value of fetch, or a copy of it from the cache if it was
+        fetched before in the same state of the storage. Copies are returned
+        so callers may modify them without changing the cache."""
+        if state is None:
+            return fetch()
+        value = self._cache.get(key, state)
+        if value is None:
+            value = fetch()
+            self._cache.put(key, state, value, _size_in_bytes(value))
+        return value.copy()
 
     @staticmethod
     def escape(s: str) -> str:
@@ -200,6 +315,23 @@ def data_for_response(
         ensemble_id: str,
         response_key: str,
         filter_on: dict[str, Any] | None = None,
+    ) -> pd.DataFrame:
+        return self._cached(
+            (
+                "response",
+                ensemble_id,
+                response_key,
+                json.dumps(filter_on, sort_keys=True),
+            ),
+            self._ensemble_state(ensemble_id),
+            lambda: self._fetch_data_for_response(ensemble_id, response_key, filter_on),
+        )
+
+    def _fetch_data_for_response(
+        self,
+        ensemble_id: str,
+        response_key: str,
+        filter_on: dict[str, Any] | None,
     ) -> pd.DataFrame:
         with StorageService.session(project=self.ens_path) as client:
             response = client.get(
@@ -226,6 +358,15 @@ def data_for_response(
                 return df
 
     def data_for_parameter(self, ensemble_id: str, parameter_key: str) -> pd.DataFrame:
+        return self._cached(
+            ("parameter", ensemble_id, parameter_key),
+            self._ensemble_state(ensemble_id),
+            lambda: self._fetch_data_for_parameter(ensemble_id, parameter_key),
+        )
+
+    def _fetch_data_for_parameter(
+        self, ensemble_id: str, parameter_key: str
+    ) -> pd.DataFrame:
         with StorageService.session(project=self.ens_path) as client:
             parameter = client.get(
                 f"/ensembles/{ensemble_id}/parameters/{PlotApi.escape(parameter_key)}",
@@ -253,6 +394,23 @@ def observations_for_key(self, ensemble_ids: list[str], key: str) -> pd.DataFram
         index is a multi-index with (obs_key, index/date, obs_index), where index/date
         is used to relate the observation to the data point it relates to, and obs_index
         is the index for the observation itself"""
+        # The observations of an experiment do not change, so they are
+        # cached as long as the ensembles exist
+        ensembles_exist = all(
+            os.path.isdir(
+                os.path.join(self.ens_path, LocalStorage.ENSEMBLES_PATH, ensemble_id)
+            )
+            for ensemble_id in ensemble_ids
+        )
+        return self._cached(
+            ("observations", tuple(ensemble_ids), key),
+            True if ensemble_ids and ensembles_exist else None,
+            lambda: self._fetch_observations_for_key(ensemble_ids, key),
+        )
+
+    def _fetch_observations_for_key(
+        self, ensemble_ids: list[str], key: str
+    ) -> pd.DataFrame:
         all_observations = pd.DataFrame()
         for ensemble_id in ensemble_ids:
             ensemble = self._get_ensemble_by_id(ensemble_id)
@@ -346,6 +504,15 @@ def history_data(
 
     def std_dev_for_parameter(
         self, key: str, ensemble_id: str, z: int
+    ) -> npt.NDArray[np.float32]:
+        return self._cached(
+            ("std_dev", ensemble_id, key, z),
+            self._ensemble_state(ensemble_id),
+            lambda: self._fetch_std_dev_for_parameter(key, ensemble_id, z),
+        )
+
+    def _fetch_std_dev_for_parameter(
+        self, key: str, ensemble_id: str, z: int
     ) -> npt.NDArray[np.float32]:
         ensemble = self._get_ensemble_by_id(ensemble_id)
         if not ensemble:
@@ -363,3 +530,8 @@ def std_dev_for_parameter(
                 return np.load(io.BytesIO(response.content))
             else:
                 return np.array([])
+
+
+def _file_state(entry: os.DirEntry[str]) -> tuple[int, int, int]:
+    stat = entry.stat(follow_symlinks=False)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from pandas import DataFrame
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtCore import pyqtSignal as Signal
+
+from .plot_api import EnsembleObject, PlotApi, PlotApiKeyDefinition
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+MAX_PLOT_DATA_WORKERS = 4
+
+_DataKey = tuple[str, str, str, str]
+
+
+@dataclass
+class PlotData:
+    ensemble_to_data_map: dict[EnsembleObject, DataFrame] = field(default_factory=dict)
+    observations: DataFrame | None = None
+    std_dev_images: dict[str, npt.NDArray[np.float32]] = field(default_factory=dict)
+    history_data: DataFrame | None = None
+    errors: list[BaseException] = field(default_factory=list)
+
+
+@dataclass
+class _Request:
+    generation: int
+    data: dict[EnsembleObject, Future[DataFrame]]
+    observations: Future[DataFrame] | None
+    std_dev_images: dict[str, Future[npt.NDArray[np.float32]]]
+    history_data: Future[DataFrame | None]
+
+
+def _data_key(key_def: PlotApiKeyDefinition, ensemble: EnsembleObject) -> _DataKey:
+    if key_def.response_metadata is not None:
+        return (
+            "response",
+            key_def.response_metadata.response_key,
+            json.dumps(key_def.filter_on, sort_keys=True),
+            ensemble.id,
+        )
+    assert key_def.parameter_metadata is not None
+    return ("parameter", key_def.parameter_metadata.key, "", ensemble.id)
+
+
+def _call_when_all_done(
+    futures: Sequence[Future[Any]], callback: Callable[[], None]
+) -> None:
+    remaining = len(futures)
+    lock = threading.Lock()
+
+    def done(_: Future[Any]) -> None:
+        nonlocal remaining
+        with lock:
+            remaining -= 1
+            last = remaining == 0
+        if last:
+            callback()
+
+    if not futures:
+        callback()
+    for future in futures:
+        future.add_done_callback(done)
+
+
+class PlotDataLoader(QObject):
+    """Loads the data of a plot from the plot api in background threads, so
+    the user interface is not blocked while the data is fetched.
+
+    The data of each ensemble is fetched concurrently, and dataLoaded is
+    emitted with the generation of the request when all of it is fetched.
+    A new request makes the previous one stale, and what has not started
+    of it is cancelled. The data of the keys next to the selected key is
+    fetched in the background, so it is at hand when the user moves on to
+    them.
+    """
+
+    dataLoaded = Signal(int)
+
+    def __init__(self, api: PlotApi, max_workers: int = MAX_PLOT_DATA_WORKERS) -> None:
+        super().__init__()
+        self._api = api
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="plot_data_loader"
+        )
+        self._generation = 0
+        self._request: _Request | None = None
+        self._data_futures: dict[_DataKey, Future[DataFrame]] = {}
+
+    def _fetch_data(
+        self, key_def: PlotApiKeyDefinition, ensemble: EnsembleObject
+    ) -> Future[DataFrame]:
+        data_key = _data_key(key_def, ensemble)
+        future = self._data_futures.get(data_key)
+        if future is None or future.cancelled():
+            if key_def.response_metadata is not None:
+                future = self._executor.submit(
+                    self._api.data_for_response,
+                    ensemble_id=ensemble.id,
+                    response_key=key_def.response_metadata.response_key,
+                    filter_on=key_def.filter_on,
+                )
+            else:
+                assert key_def.parameter_metadata is not None
+                future = self._executor.submit(
+                    self._api.data_for_parameter,
+                    ensemble_id=ensemble.id,
+                    parameter_key=key_def.parameter_metadata.key,
+                )
+            self._data_futures[data_key] = future
+        return future
+
+    def _history_data(
+        self, key: str, ensembles: Sequence[EnsembleObject]
+    ) -> DataFrame | None:
+        # A history key already has the data it needs
+        if key.endswith("H") or "H:" in key:
+            return DataFrame()
+        if self._api.has_history_data(key):
+            return self._api.history_data(key, [e.id for e in ensembles])
+        return None
+
+    def load(
+        self,
+        key_def: PlotApiKeyDefinition,
+        ensembles: Sequence[EnsembleObject],
+        layer: int | None,
+        neighbours: Sequence[PlotApiKeyDefinition] = (),
+    ) -> int:
+        """Starts loading the plot data of the key for the ensembles, and
+        fetching the data of the neighbouring keys. Returns the generation
+        that dataLoaded is emitted with when the data is loaded."""
+        self._generation += 1
+        generation = self._generation
+        if self._request is not None:
+            # The data of the previous request is kept if it is still wanted
+            for future in self._pending_futures(self._request):
+                if future not in self._request.data.values():
+                    future.cancel()
+
+        # The data of keys that are no longer selected or next to the
+        # selected key is dropped
+        wanted = {
+            _data_key(wanted_key_def, ensemble)
+            for wanted_key_def in [key_def, *neighbours]
+            for ensemble in ensembles
+        }
+        for data_key in set(self._data_futures) - wanted:
+            self._data_futures.pop(data_key).cancel()
+
+        key = key_def.key
+        request = _Request(
+            generation=generation,
+            data={
+                ensemble: self._fetch_data(key_def, ensemble) for ensemble in ensembles
+            },
+            observations=self._executor.submit(
+                self._api.observations_for_key, [e.id for e in ensembles], key
+            )
+            if key_def.observations and ensembles
+            else None,
+            std_dev_images={
+                ensemble.name: self._executor.submit(
+                    self._api.std_dev_for_parameter, key, ensemble.id, layer
+                )
+                for ensemble in ensembles
+            }
+            if "FIELD" in key_def.metadata["data_origin"] and layer is not None
+            else {},
+            history_data=self._executor.submit(self._history_data, key, ensembles),
+        )
+        self._request = request
+
+        # Prefetch after the request, so the executor fetches the data of
+        # the selected key first
+        for neighbour in neighbours:
+            for ensemble in ensembles:
+                self._fetch_data(neighbour, ensemble)
+
+        _call_when_all_done(
+            self._pending_futures(request), lambda: self._loaded(generation)
+        )
+        return generation
+
+    @staticmethod
+    def _pending_futures(request: _Request) -> list[Future[Any]]:
+        futures: list[Future[Any]] = [
+            *request.data.values(),
+            *request.std_dev_images.values(),
+            request.history_data,
+        ]
+        if request.observations is not None:
+            futures.append(request.observations)
+        return futures
+
+    def _loaded(self, generation: int) -> None:
+        # dataLoaded is emitted from another thread than the main thread, so
+        # it is queued to receivers in the main thread. When the data was
+        # loaded before load returned, it is emitted from the event loop
+        if threading.current_thread() is threading.main_thread():
+            QTimer.singleShot(0, lambda: self._emit_loaded(generation))
+        else:
+            self._emit_loaded(generation)
+
+    def _emit_loaded(self, generation: int) -> None:
+        # Raises RuntimeError if the loader has been deleted
+        with contextlib.suppress(RuntimeError):
+            self.dataLoaded.emit(generation)
+
+    def result(self, generation: int) -> PlotData | None:
+        """The plot data of the request with the given generation, or None
+        if a newer request has been made."""
+        request = self._request
+        if request is None or request.generation != generation:
+            return None
+        plot_data = PlotData()
+
+        def get(future: Future[Any]) -> Any:
+            if (error := future.exception()) is not None:
+                plot_data.errors.append(error)
+                return None
+            return future.result()
+
+        for ensemble, future in request.data.items():
+            if (data := get(future)) is not None:
+                plot_data.ensemble_to_data_map[ensemble] = data
+        # Data that failed to load is fetched again the next time
+        for data_key, future in list(self._data_futures.items()):
+            if future.done() and not future.cancelled() and future.exception():
+                del self._data_futures[data_key]
+        if request.observations is not None:
+            plot_data.observations = get(request.observations)
+        for name, future in request.std_dev_images.items():
+            if (image := get(future)) is not None:
+                plot_data.std_dev_images[name] = image
+        plot_data.history_data = get(request.history_data)
+        return plot_data
+
+    def shutdown(self) -> None:
+        self._generation += 1
+        self._request = None
+        self._data_futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, cast
 
-import numpy as np
-import pandas as pd
-from pandas import DataFrame
 from PyQt6.QtCore import Qt
 from PyQt6.QtCore import pyqtSlot as Slot
+from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import (
     QApplication,
     QDialog,
@@ -28,6 +27,7 @@
 from .customize import PlotCustomizer
 from .data_type_keys_widget import DataTypeKeysWidget
 from .plot_api import EnsembleObject, PlotApi, PlotApiKeyDefinition
+from .plot_data_loader import PlotDataLoader
 from .plot_ensemble_selection_widget import EnsembleSelectionWidget
 from .plot_widget import PlotWidget
 from .plottery import PlotConfig, PlotContext
@@ -59,8 +59,6 @@
 if TYPE_CHECKING:
     from pathlib import Path
 
-    import numpy.typing as npt
-
 
 class _CopyButton(CopyButton):
     def __init__(self, text_edit: QTextEdit) -> None:
@@ -115,6 +113,18 @@ def handle_exception(e: BaseException) -> None:
     open_error_dialog(type(e).__name__, str(e))
 
 
+@dataclass
+class _PendingPlot:
+    """A plot waiting for its data to be loaded."""
+
+    generation: int
+    key_def: PlotApiKeyDefinition
+    plot_widget: PlotWidget
+    layer: int | None
+    ensembles: list[EnsembleObject]
+    color_indexes: list[int]
+
+
 class PlotWindow(QMainWindow):
     @log_duration(logger, logging.INFO, "PlotWindow.__init__")
     def __init__(
@@ -139,6 +149,10 @@ def __init__(
             self._key_definitions = []
         QApplication.restoreOverrideCursor()
 
+        self._plot_data_loader = PlotDataLoader(self._api)
+        self._plot_data_loader.dataLoaded.connect(self.plotDataLoaded)
+        self._pending_plot: _PendingPlot | None = None
+
         self._plot_customizer = PlotCustomizer(self, self._key_definitions)
 
         self._plot_customizer.settingsChanged.connect(self.keySelected)
@@ -198,6 +212,12 @@ def __init__(
 
         self._data_type_keys_widget.selectDefault()
 
+    @Slot()
+    def refresh(self) -> None:
+        """Plot the data saved to storage since the window was opened."""
+        self._api.refresh()
+        self.updatePlot()
+
     @Slot(int)
     def currentTabChanged(self, index: int) -> None:
         self._current_tab_index = index
@@ -211,41 +231,10 @@ def updatePlot(self, layer: int | None = None) -> None:
         key_def = self.getSelectedKey()
         if key_def is None:
             return
-        key = key_def.key
 
         plot_widget = cast(PlotWidget, self._central_tab.currentWidget())
 
         if plot_widget._plotter.dimensionality == key_def.dimensionality:
-            selected_ensembles = (
-                self._ensemble_selection_widget.get_selected_ensembles()
-            )
-            ensemble_to_data_map: dict[EnsembleObject, pd.DataFrame] = {}
-            for ensemble in selected_ensembles:
-                try:
-                    if key_def.response_metadata is not None:
-                        ensemble_to_data_map[ensemble] = self._api.data_for_response(
-                            ensemble_id=ensemble.id,
-                            response_key=key_def.response_metadata.response_key,
-                            filter_on=key_def.filter_on,
-                        )
-                    elif key_def.parameter_metadata is not None:
-                        ensemble_to_data_map[ensemble] = self._api.data_for_parameter(
-                            ensemble_id=ensemble.id,
-                            parameter_key=key_def.parameter_metadata.key,
-                        )
-                except BaseException as e:
-                    handle_exception(e)
-
-            observations = None
-            if key_def.observations and selected_ensembles:
-                try:
-                    observations = self._api.observations_for_key(
-                        [ensembles.id for ensembles in selected_ensembles], key
-                    )
-                except BaseException as e:
-                    handle_exception(e)
-
-            std_dev_images: dict[str, npt.NDArray[np.float32]] = {}
             if "FIELD" in key_def.metadata["data_origin"]:
                 plot_widget.showLayerWidget.emit(True)
 
@@ -255,54 +244,76 @@ def updatePlot(self, layer: int | None = None) -> None:
                 if layer is None:
                     plot_widget.resetLayerWidget.emit()
                     layer = 0
-
-                for ensemble in selected_ensembles:
-                    try:
-                        std_dev_images[ensemble.name] = self._api.std_dev_for_parameter(
-                            key, ensemble.id, layer
-                        )
-                    except BaseException as e:
-                        handle_exception(e)
             else:
                 plot_widget.showLayerWidget.emit(False)
 
-            plot_config = PlotConfig.createCopy(self._plot_customizer.getPlotConfig())
-            plot_context = PlotContext(
-                plot_config,
-                selected_ensembles,
-                self._ensemble_selection_widget.get_selected_ensembles_color_indexes(),
-                key,
-                layer,
+            selected_ensembles = (
+                self._ensemble_selection_widget.get_selected_ensembles()
+            )
+            color_indexes = (
+                self._ensemble_selection_widget.get_selected_ensembles_color_indexes()
+            )
+            self._pending_plot = _PendingPlot(
+                generation=self._plot_data_loader.load(
+                    key_def,
+                    selected_ensembles,
+                    layer,
+                    self._data_type_keys_widget.getNeighbourItems(),
+                ),
+                key_def=key_def,
+                plot_widget=plot_widget,
+                layer=layer,
+                ensembles=selected_ensembles,
+                color_indexes=color_indexes,
             )
 
-            # Check if key is a history key.
-            # If it is it already has the data it needs
-            if str(key).endswith("H") or "H:" in str(key):
-                plot_context.history_data = DataFrame()
-            else:
-                try:
-                    if self._api.has_history_data(key):
-                        plot_context.history_data = self._api.history_data(
-                            key,
-                            [e.id for e in plot_context.ensembles()],
-                        )
+    @Slot(int)
+    def plotDataLoaded(self, generation: int) -> None:
+        pending_plot = self._pending_plot
+        if pending_plot is None or pending_plot.generation != generation:
+            return
+        plot_data = self._plot_data_loader.result(generation)
+        self._pending_plot = None
+        if plot_data is None:
+            return
+        for error in plot_data.errors:
+            handle_exception(error)
+
+        plot_config = PlotConfig.createCopy(self._plot_customizer.getPlotConfig())
+        plot_context = PlotContext(
+            plot_config,
+            pending_plot.ensembles,
+            pending_plot.color_indexes,
+            pending_plot.key_def.key,
+            pending_plot.layer,
+        )
+        plot_context.history_data = plot_data.history_data
+
+        for data in plot_data.ensemble_to_data_map.values():
+            data = data.T
 
-                except BaseException as e:
-                    handle_exception(e)
-                    plot_context.history_data = None
+            if not data.empty and data.index.inferred_type == "datetime64":
+                self._preferred_ensemble_x_axis_format = PlotContext.DATE_AXIS
+                break
 
-            for data in ensemble_to_data_map.values():
-                data = data.T
+        self._updateCustomizer(
+            pending_plot.plot_widget, self._preferred_ensemble_x_axis_format
+        )
 
-                if not data.empty and data.index.inferred_type == "datetime64":
-                    self._preferred_ensemble_x_axis_format = PlotContext.DATE_AXIS
-                    break
+        pending_plot.plot_widget.updatePlot(
+            plot_context,
+            plot_data.ensemble_to_data_map,
+            plot_data.observations,
+            plot_data.std_dev_images,
+        )
 
-            self._updateCustomizer(plot_widget, self._preferred_ensemble_x_axis_format)
+    def isLoadingPlotData(self) -> bool:
+        return self._pending_plot is not None
 
-            plot_widget.updatePlot(
-                plot_context, ensemble_to_data_map, observations, std_dev_images
-            )
+    def closeEvent(self, a0: QCloseEvent | None) -> None:
+        self._pending_plot = None
+        self._plot_data_loader.shutdown()
+        super().closeEvent(a0)
 
     def _updateCustomizer(
         self, plot_widget: PlotWidget, preferred_x_axis_format: str
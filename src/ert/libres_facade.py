@@ -10,8 +10,6 @@
 from ert.config import (
     ErtConfig,
 )
-from ert.data import MeasuredData
-from ert.data._measured_data import ObservationError, ResponseError
 
 from .plugins import ErtPluginContext
 
@@ -42,7 +40,8 @@ def load_all_misfit_data(ensemble: Ensemble) -> DataFrame:
         The misfit data is then grouped by key, summed, and transposed to form
         a DataFrame. The DataFrame has an additional column "MISFIT:TOTAL",
         which is the sum of all misfits for each realization. The index of the
-        DataFrame is named "Realization".
+        DataFrame is named "Realization". The misfits are cached on the
+        ensemble until new responses are saved to it.
 
         Parameters:
             ensemble: The ensemble from which to load the misfit data.
@@ -54,21 +53,11 @@ def load_all_misfit_data(ensemble: Ensemble) -> DataFrame:
                 to a realization. The "MISFIT:TOTAL" column contains the total
                 misfit for each realization.
         """
-        try:
-            measured_data = MeasuredData(ensemble)
-        except (ResponseError, ObservationError):
+        misfits = ensemble.load_misfits()
+        if misfits.is_empty():
             return DataFrame()
-        misfit = DataFrame()
-        for name in measured_data.data.columns.unique(0):
-            df = (
-                (
-                    measured_data.data[name].loc["OBS"]
-                    - measured_data.get_simulated_data()[name]
-                )
-                / measured_data.data[name].loc["STD"]
-            ) ** 2
-            misfit[f"MISFIT:{name}"] = df.sum(axis=1)
-        misfit["MISFIT:TOTAL"] = misfit.sum(axis=1)
+
+        misfit = misfits.to_pandas().set_index("realization")
         misfit.index.name = "Realization"
         misfit.index = misfit.index.astype(int)
 
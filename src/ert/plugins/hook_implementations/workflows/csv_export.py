@@ -1,17 +1,24 @@
+from __future__ import annotations
+
 import json
 import os
-from collections.abc import Sequence
+import tempfile
+from collections.abc import Iterator, Sequence
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pandas as pd
 import polars as pl
 
-from ert import ErtScript, LibresFacade
+from ert import ErtScript
 from ert.storage import Storage
 
 if TYPE_CHECKING:
     from ert.storage import Ensemble
 
+REALIZATIONS_PER_BATCH = 50
+INDEX_COLUMNS = ["Realization", "Iteration", "Date", "Ensemble"]
+
 
 def loadDesignMatrix(filename: str) -> pd.DataFrame:
     dm = pd.read_csv(filename, delim_whitespace=True)
@@ -20,12 +27,103 @@ def loadDesignMatrix(filename: str) -> pd.DataFrame:
     return dm
 
 
+def _load_ensemble_scalars(
+    ensemble: Ensemble, design_matrix: pl.DataFrame | None
+) -> pl.DataFrame:
+    """One row per realization with the parameter scalars, the design matrix
+    and the misfits of the ensemble. Holds no summary data, and is therefore
+    small compared to the exported data."""
+    scalars = ensemble.load_scalars()
+    frames = []
+    if not scalars.is_empty():
+        frames.append(
+            scalars.select(
+                pl.col("realization").cast(pl.Int64),
+                *sorted(c for c in scalars.columns if c != "realization"),
+            )
+        )
+    if design_matrix is not None:
+        frames.append(design_matrix)
+    misfits = ensemble.load_misfits()
+    if not misfits.is_empty():
+        frames.append(misfits)
+
+    if not frames:
+        return pl.DataFrame(
+            {"realization": ensemble.get_realization_list_with_responses()},
+            schema={"realization": pl.Int64},
+        )
+
+    ensemble_data = frames[0]
+    for frame in frames[1:]:
+        ensemble_data = ensemble_data.join(
+            frame, on="realization", how="full", coalesce=True
+        )
+    return ensemble_data.sort("realization")
+
+
+def _summary_keys(ensemble: Ensemble) -> list[str]:
+    """The summary keys in order of first appearance, which is the column
+    order given by pivoting all of the summary data of the ensemble."""
+    try:
+        return (
+            ensemble.load_responses_lazy(
+                "summary", tuple(ensemble.get_realization_list_with_responses())
+            )
+            .select(pl.col("response_key").cast(pl.String).unique(maintain_order=True))
+            .collect(engine="streaming")
+            .get_column("response_key")
+            .to_list()
+        )
+    except (KeyError, ValueError):
+        return []
+
+
+def _load_summary(ensemble: Ensemble, realizations: Sequence[int]) -> pl.DataFrame:
+    """Summary data for the given realizations in wide format, that is one
+    row per realization and date, and one column per summary key."""
+    try:
+        summary_data = ensemble.load_responses("summary", tuple(realizations))
+    except (KeyError, ValueError):
+        return pl.DataFrame()
+    if summary_data.is_empty():
+        return summary_data
+    return summary_data.pivot(
+        index=["realization", "time"], on="response_key", values="values"
+    ).with_columns(pl.col("realization").cast(pl.Int64))
+
+
+def _batches(
+    ensemble: Ensemble, ensemble_data: pl.DataFrame, batch_size: int
+) -> Iterator[pl.DataFrame]:
+    with_responses = set(ensemble.get_realization_list_with_responses())
+    for offset in range(0, len(ensemble_data), batch_size):
+        batch = ensemble_data.slice(offset, batch_size)
+        summary = _load_summary(
+            ensemble,
+            [r for r in batch.get_column("realization") if r in with_responses],
+        )
+        if summary.is_empty():
+            batch = batch.with_columns(pl.lit(None, pl.Datetime("ms")).alias("time"))
+        else:
+            batch = batch.join(
+                summary, on="realization", how="left", maintain_order="left_right"
+            )
+
+        yield batch.rename({"realization": "Realization", "time": "Date"}).with_columns(
+            pl.lit(ensemble.iteration, pl.Int64).alias("Iteration"),
+            pl.lit(ensemble.name, pl.String).alias("Ensemble"),
+        )
+
+
 class CSVExportJob(ErtScript):
     """Export of summary, misfit, design matrix data and gen kw into a single CSV file.
 
     The script expects a single argument:
 
-        output_file: this is the path to the file to output the CSV data to
+        output_file: this is the path to the file to output the CSV data to.
+            If the file name ends with .parquet, the data is written as
+            parquet instead of CSV.
 
     Optional arguments:
 
@@ -41,6 +139,9 @@ class CSVExportJob(ErtScript):
 
         DATA_KW <CSV_OUTPUT_PATH> {some path}
         DATA_KW <DESIGN_MATRIX_PATH> {some path}
+
+    The ensembles are exported one at a time, in batches of realizations, so
+    that only one batch of summary data is held in memory at once.
     """
 
     @staticmethod
@@ -75,6 +176,7 @@ def run(
             ensemble = storage.get_ensemble(ensemble_id)
             ensembles.append(ensemble)
 
+        design_matrix = None
         if design_matrix_path is not None:
             if not os.path.exists(design_matrix_path):
                 raise UserWarning("The design matrix file does not exist!")
@@ -82,72 +184,123 @@ def run(
             if not os.path.isfile(design_matrix_path):
                 raise UserWarning("The design matrix is not a file!")
 
-        data = pd.DataFrame()
+            design_matrix_data = loadDesignMatrix(design_matrix_path)
+            if not design_matrix_data.empty:
+                design_matrix = pl.from_pandas(
+                    design_matrix_data, include_index=True
+                ).rename({"Realization": "realization"})
+                design_matrix = design_matrix.with_columns(
+                    pl.col("realization").cast(pl.Int64)
+                )
 
+        # The output columns are the union of the columns of all ensembles,
+        # so they are collected up front before anything is written.
+        ensemble_scalars: list[pl.DataFrame] = []
+        schemas = [
+            pl.DataFrame(
+                schema={
+                    "Realization": pl.Int64,
+                    "Iteration": pl.Int64,
+                    "Date": pl.Datetime("ms"),
+                    "Ensemble": pl.String,
+                }
+            )
+        ]
         for ensemble in ensembles:
             if not ensemble.has_data():
                 raise UserWarning(
                     f"The ensemble '{ensemble.name}' does not have any data!"
                 )
-
-            ensemble_data = ensemble.load_scalars().to_pandas().set_index("realization")
-            ensemble_data.columns.name = None
-            ensemble_data.index.name = "Realization"
-            ensemble_data = ensemble_data.sort_index(axis=1)
-
-            if design_matrix_path is not None:
-                design_matrix_data = loadDesignMatrix(design_matrix_path)
-                if not design_matrix_data.empty:
-                    ensemble_data = ensemble_data.join(design_matrix_data, how="outer")
-
-            misfit_data = LibresFacade.load_all_misfit_data(ensemble)
-            if not misfit_data.empty:
-                ensemble_data = ensemble_data.join(misfit_data, how="outer")
-            realizations = ensemble.get_realization_list_with_responses()
-
-            try:
-                summary_data = ensemble.load_responses("summary", tuple(realizations))
-            except (KeyError, ValueError):
-                summary_data = pl.DataFrame({})
-
-            if not summary_data.is_empty():
-                pivoted_summary = summary_data.pivot(
-                    index=["realization", "time"], on="response_key", values="values"
-                ).to_pandas()
-
-                # Rename columns to match ensemble_data conventions before merge
-                pivoted_summary = pivoted_summary.rename(
-                    columns={"realization": "Realization", "time": "Date"}
-                )
-
-                # Reset index to make 'Realization' a regular column
-                ensemble_data = ensemble_data.reset_index()
-
-                ensemble_data = pd.merge(
-                    ensemble_data,
-                    pivoted_summary,
-                    on="Realization",
-                    how="left",
+            ensemble_data = _load_ensemble_scalars(ensemble, design_matrix)
+            ensemble_scalars.append(ensemble_data)
+            schemas.append(
+                pl.DataFrame(
+                    schema={
+                        **ensemble_data.rename({"realization": "Realization"}).schema,
+                        **dict.fromkeys(_summary_keys(ensemble), pl.Float32),
+                    }
                 )
-            else:
-                ensemble_data = ensemble_data.reset_index()
-                ensemble_data["Date"] = pd.NaT
-
-            ensemble_data["Iteration"] = ensemble.iteration
-            ensemble_data["Ensemble"] = ensemble.name
-            ensemble_data = ensemble_data.set_index(
-                ["Realization", "Iteration", "Date", "Ensemble"]
             )
+        schema = pl.concat(schemas, how="diagonal_relaxed").schema
+
+        with tempfile.TemporaryDirectory(
+            dir=Path(output_file).absolute().parent
+        ) as staging_dir:
+            # Each batch is staged as parquet, and the output file is then
+            # written by streaming through the staged batches
+            parts: list[Path] = []
+            for ensemble, ensemble_data in zip(
+                ensembles, ensemble_scalars, strict=True
+            ):
+                for batch in _batches(ensemble, ensemble_data, REALIZATIONS_PER_BATCH):
+                    part = Path(staging_dir) / f"part-{len(parts):05d}.parquet"
+                    batch.select(
+                        pl.col(name).cast(dtype)
+                        if name in batch.columns
+                        else pl.lit(None, dtype).alias(name)
+                        for name, dtype in schema.items()
+                    ).write_parquet(part)
+                    parts.append(part)
+
+            data = pl.scan_parquet(parts) if parts else pl.LazyFrame(schema=schema)
+            columns = list(schema)
+            num_rows = data.select(pl.len()).collect().item()
+
+            # Integer columns with missing values are written as floats,
+            # which is how they have always been exported
+            integer_columns = [
+                name
+                for name, dtype in schema.items()
+                if dtype.is_integer() and name not in INDEX_COLUMNS
+            ]
+            if integer_columns:
+                has_nulls = (
+                    data.select(pl.col(integer_columns).null_count() > 0)
+                    .collect(engine="streaming")
+                    .row(0, named=True)
+                )
+                data = data.with_columns(
+                    pl.col(name).cast(pl.Float64)
+                    for name in integer_columns
+                    if has_nulls[name]
+                )
 
-            data = pd.concat([data, ensemble_data])
-
-        if drop_const_cols:
-            data = data.loc[:, (data != data.iloc[0]).any()]
+            if drop_const_cols and num_rows > 0:
+                # A column is constant if it has no missing values and only
+                # one unique value, the same as comparing against the first row
+                values = {
+                    name: pl.col(name).fill_nan(None)
+                    if dtype.is_float()
+                    else pl.col(name)
+                    for name, dtype in schema.items()
+                    if name not in INDEX_COLUMNS
+                }
+                constant = (
+                    data.select(
+                        ((value.null_count() == 0) & (value.n_unique() == 1)).alias(
+                            name
+                        )
+                        for name, value in values.items()
+                    )
+                    .collect(engine="streaming")
+                    .row(0, named=True)
+                )
+                columns = [name for name in columns if not constant.get(name, False)]
+            data = data.select(columns)
 
-        data.to_csv(output_file, float_format="%.6f")
+            if Path(output_file).suffix == ".parquet":
+                data.sink_parquet(output_file)
+            else:
+                date = pl.col("Date")
+                data.with_columns(
+                    pl.when(date == date.dt.truncate("1d"))
+                    .then(date.dt.strftime("%Y-%m-%d"))
+                    .otherwise(date.dt.strftime("%Y-%m-%d %H:%M:%S"))
+                    .alias("Date")
+                ).sink_csv(output_file, float_precision=6)
 
         export_info = (
-            f"Exported {len(data.index)} rows and {len(data.columns)} "
+            f"Exported {num_rows} rows and {len(columns) - len(INDEX_COLUMNS)} "
             f"columns to {output_file}."
         )
         return export_info
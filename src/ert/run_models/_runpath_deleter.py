@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import shutil
+import threading
+import uuid
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+TRASH_DIRECTORY = ".ert_trash"
+
+
+class RunpathDeleter:
+    """Deletes run paths in the background.
+
+    Each run path is first moved into a trash directory next to the run
+    paths, which is instant as it is on the same file system, so the run path
+    is gone when delete returns, and delete raises OSError if it could not be
+    moved. The trash is then deleted by a bounded pool of threads, and what
+    fails to be deleted from it is logged. When more than max_pending run
+    paths wait for deletion, delete blocks until some are deleted.
+
+    Anything left in a trash directory, for instance after a crash, is
+    deleted the next time run paths are deleted into the same trash.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 500) -> None:
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="runpath_deleter"
+        )
+        self._max_pending = max_pending
+        self._pending = 0
+        self._condition = threading.Condition()
+        self._trash_directories: set[Path] = set()
+
+    def delete(self, run_paths: Iterable[str | os.PathLike[str]]) -> None:
+        paths = [Path(run_path).absolute() for run_path in run_paths]
+        paths = [path for path in paths if path.exists()]
+        if not paths:
+            return
+        trash = Path(os.path.commonpath([path.parent for path in paths])) / (
+            TRASH_DIRECTORY
+        )
+        if trash not in self._trash_directories:
+            self._trash_directories.add(trash)
+            if trash.is_dir():
+                leftovers = list(trash.iterdir())
+                if leftovers:
+                    logger.info(f"Deleting {len(leftovers)} run paths left in {trash}")
+                for leftover in leftovers:
+                    self._reserve()
+                    self._executor.submit(self._delete, leftover)
+
+        trash.mkdir(exist_ok=True)
+        for path in paths:
+            self._reserve()
+            try:
+                trashed = path.rename(trash / f"{path.name}-{uuid.uuid4().hex}")
+            except OSError:
+                # The run path is still there, which the caller must know
+                self._release()
+                raise
+            self._executor.submit(self._delete, trashed)
+
+    def _reserve(self) -> None:
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending < self._max_pending)
+            self._pending += 1
+
+    def _release(self) -> None:
+        with self._condition:
+            self._pending -= 1
+            self._condition.notify_all()
+
+    def _delete(self, path: Path) -> None:
+        try:
+            if path.is_dir() and not path.is_symlink():
+                shutil.rmtree(
+                    path,
+                    onerror=lambda _, failed_path, sys_info: logger.warning(
+                        f"Failed to remove {failed_path}, {sys_info}"
+                    ),
+                )
+            else:
+                path.unlink(missing_ok=True)
+        except OSError as err:
+            logger.warning(f"Failed to remove {path}, {err}")
+        finally:
+            self._release()
+
+    def wait(self) -> None:
+        """Waits until all pending run paths are deleted, and removes the
+        emptied trash directories."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending == 0)
+        for trash in self._trash_directories:
+            with contextlib.suppress(OSError):
+                trash.rmdir()
+
+    def _shutdown(self) -> None:
+        self.wait()
+        self._executor.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Deletes the pending run paths and stops the worker threads. With
+        wait=False this is done in a thread, and the call returns at once."""
+        if wait:
+            self._shutdown()
+        else:
+            threading.Thread(
+                target=self._shutdown, name="runpath_deleter_shutdown"
+            ).start()
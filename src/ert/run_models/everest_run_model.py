@@ -1,24 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 import copy
 import dataclasses
 import datetime
+import hashlib
 import importlib.metadata
 import json
 import logging
 import os
 import queue
-import shutil
 import traceback
 from collections import defaultdict
-from collections.abc import Callable, Iterator, MutableSequence
+from collections.abc import Iterator, MutableSequence
 from enum import IntEnum, auto
-from functools import cached_property
+from functools import cached_property, partial
 from pathlib import Path
-from types import TracebackType
 from typing import TYPE_CHECKING, Any, Protocol
 
 import numpy as np
+import polars as pl
 from numpy.typing import NDArray
 from pydantic import PrivateAttr, ValidationError
 from ropt.enums import ExitCode as RoptExitCode
@@ -34,6 +35,7 @@
     GenDataConfig,
     ParameterConfig,
     QueueConfig,
+    QueueSystem,
     ResponseConfig,
     SummaryConfig,
 )
@@ -47,7 +49,12 @@
     DEFAULT_ECLBASE_FORMAT,
 )
 from ert.config.model_config import ModelConfig as ErtModelConfig
-from ert.ensemble_evaluator import EndEvent, EvaluatorServerConfig
+from ert.ensemble_evaluator import (
+    EndEvent,
+    EvaluatorServerConfig,
+    PersistentEnsembleEvaluator,
+)
+from ert.ensemble_evaluator.evaluator import UserCancelled
 from ert.plugins import ErtRuntimePlugins
 from ert.runpaths import Runpaths
 from everest.config import (
@@ -78,6 +85,7 @@
 from ..run_arg import RunArg, create_run_arguments
 from ..storage.local_ensemble import EverestRealizationInfo
 from ..substitutions import Substitutions
+from ._runpath_deleter import RunpathDeleter
 from .event import EverestBatchResultEvent, EverestStatusEvent
 from .run_model import RunModel, StatusEvents
 
@@ -187,6 +195,56 @@ def _get_internal_files(ever_config: EverestConfig) -> dict[Path, str]:
     )
 
 
+EVALUATION_CACHE_DECIMALS = 10
+
+
+def _evaluation_cache_keys(
+    control_vectors: NDArray[np.float64],
+    model_realizations: list[int],
+    fingerprint: str,
+) -> list[str]:
+    """Keys identifying the evaluation of each control vector in a model
+    realization, with a forward model identified by the fingerprint."""
+    # Adding zero turns -0.0 into 0.0, which would otherwise hash differently
+    rounded = np.round(control_vectors, EVALUATION_CACHE_DECIMALS) + 0.0
+    keys = []
+    for controls, model_realization in zip(rounded, model_realizations, strict=True):
+        digest = hashlib.sha256(fingerprint.encode("utf-8"))
+        digest.update(np.int64(model_realization).tobytes())
+        digest.update(np.ascontiguousarray(controls, dtype=np.float64).tobytes())
+        keys.append(digest.hexdigest())
+    return keys
+
+
+def _load_batch_responses(
+    ensemble: Ensemble,
+    response_type: str,
+    names: list[str],
+    successful: MutableSequence[bool],
+) -> NDArray[np.float64]:
+    """Load the responses of all successful realizations of a batch in one
+    read, as a matrix with one row per realization and one column per name.
+
+    The rows of failed realizations are filled with NaN.
+    """
+    values = np.full((ensemble.ensemble_size, len(names)), np.nan)
+    mask = np.asarray(successful, dtype=np.bool_)
+    if not names or not mask.any():
+        return values
+
+    realizations = np.flatnonzero(mask)
+    data = ensemble.load_responses(response_type, tuple(realizations.tolist()))
+    wide = data.pivot(on="response_key", index="realization", values="values")
+    rows = wide.get_column("realization").to_numpy().astype(np.int64)
+    if not np.array_equal(np.sort(rows), realizations):
+        raise ValueError(
+            f"Missing {response_type} for realizations: "
+            f"{sorted(set(realizations.tolist()) - set(rows.tolist()))}"
+        )
+    values[rows, :] = wide.select(names).to_numpy()
+    return values
+
+
 class EverestRunModel(RunModel):
     optimization_output_dir: str
     simulation_dir: str
@@ -208,6 +266,7 @@ class EverestRunModel(RunModel):
     optimization: OptimizationConfig
     model: ModelConfig
     keep_run_path: bool
+    enable_cache: bool = False
     experiment_name: str
     target_ensemble: str
 
@@ -216,6 +275,10 @@ class EverestRunModel(RunModel):
     _eval_server_cfg: EvaluatorServerConfig | None = PrivateAttr(default=None)
     _batch_id: int = PrivateAttr(default=0)
     _ever_storage: EverestStorage | None = PrivateAttr(default=None)
+    _evaluation_cache: dict[str, tuple[str, int]] | None = PrivateAttr(default=None)
+    _evaluator: PersistentEnsembleEvaluator | None = PrivateAttr(default=None)
+    _evaluator_runner: asyncio.Runner | None = PrivateAttr(default=None)
+    _runpath_deleter: RunpathDeleter | None = PrivateAttr(default=None)
 
     def __init__(self, **data: Any) -> None:
         super().__init__(**data)
@@ -451,6 +514,8 @@ def create(
             controls=everest_config.controls,
             simulation_dir=everest_config.simulation_dir,
             keep_run_path=not delete_run_path,
+            enable_cache=everest_config.simulator is not None
+            and everest_config.simulator.enable_cache,
             objective_names=everest_config.objective_names,
             constraint_names=everest_config.constraint_names,
             objective_functions=everest_config.objective_functions,
@@ -606,7 +671,13 @@ def run_experiment(
         optimizer.set_results_callback(self._handle_optimizer_results)
 
         # Run the optimization:
-        optimizer_exit_code = optimizer.run(initial_guesses).exit_code
+        try:
+            optimizer_exit_code = optimizer.run(initial_guesses).exit_code
+        finally:
+            self._close_evaluator()
+            if self._runpath_deleter is not None:
+                self._runpath_deleter.shutdown()
+                self._runpath_deleter = None
 
         # Store some final results.
         self._ever_storage.on_optimization_finished()
@@ -707,28 +778,44 @@ def _run_forward_model(
 
         ensemble.save_everest_realization_info(realization_info)
 
-        for sim_id in range(sim_to_control_vector.shape[0]):
-            sim_controls = sim_to_control_vector[sim_id]
-            offset = 0
-            for control_config in self.controls:
-                ext_param_config = next(
-                    c
-                    for c in self.parameter_configuration
-                    if c.name == control_config.name
-                )
-                n_param_keys = len(ext_param_config.parameter_keys)
-
-                # Save controls to ensemble
-                ensemble.save_parameters_numpy(
-                    sim_controls[offset : (offset + n_param_keys)].reshape(-1, 1),
-                    ext_param_config.name,
-                    np.array([sim_id]),
-                )
-                offset += n_param_keys
+        # Save the controls of all simulations to the ensemble, with one write
+        # per control group:
+        offset = 0
+        for control_config in self.controls:
+            ext_param_config = next(
+                c for c in self.parameter_configuration if c.name == control_config.name
+            )
+            n_param_keys = len(ext_param_config.parameter_keys)
+            ensemble.save_parameters_numpy(
+                sim_to_control_vector[:, offset : (offset + n_param_keys)].T,
+                ext_param_config.name,
+                np.arange(sim_to_control_vector.shape[0]),
+            )
+            offset += n_param_keys
+
+        # Find the simulations that were evaluated before, these are not
+        # submitted again:
+        cache_keys: list[str] = []
+        cached: dict[int, tuple[str, int]] = {}
+        if self.enable_cache:
+            cache_keys = _evaluation_cache_keys(
+                sim_to_control_vector,
+                sim_to_model_realization,
+                self._forward_model_fingerprint,
+            )
+            cached = self._find_cached_evaluations(ensemble, cache_keys)
+            logger.info(
+                f"Evaluation cache for batch {self._batch_id}: "
+                f"{len(cached)} hits, {len(cache_keys) - len(cached)} misses"
+            )
+            assert self._ever_storage is not None
+            self._ever_storage.save_evaluation_cache_statistics(
+                self._batch_id, hits=len(cached), misses=len(cache_keys) - len(cached)
+            )
 
         # Evaluate the batch:
         run_args = self._get_run_args(
-            ensemble, sim_to_model_realization, sim_to_perturbation
+            ensemble, sim_to_model_realization, sim_to_perturbation, set(cached)
         )
         self._context_env.update(
             {
@@ -737,18 +824,89 @@ def _run_forward_model(
                 "_ERT_SIMULATION_MODE": "batch_simulation",
             }
         )
-        assert self._eval_server_cfg is not None
-        self._evaluate_and_postprocess(run_args, ensemble, self._eval_server_cfg)
+        if any(self.active_realizations):
+            assert self._eval_server_cfg is not None
+            self._evaluate_and_postprocess(run_args, ensemble, self._eval_server_cfg)
+
+            # If necessary, delete the run path:
+            self._delete_run_path(run_args)
 
-        # If necessary, delete the run path:
-        self._delete_run_path(run_args)
+        if cached:
+            self._copy_cached_responses(ensemble, cached)
 
         # Gather the results
         objectives, constraints = self._gather_simulation_results(ensemble)
 
+        if self.enable_cache:
+            self._update_evaluation_cache(ensemble, cache_keys, cached)
+
         # Return the results, together with the indices of the evaluated controls:
         return objectives, constraints
 
+    def run_ensemble_evaluator(
+        self,
+        run_args: list[RunArg],
+        ensemble: Ensemble,
+        ee_config: EvaluatorServerConfig,
+    ) -> list[int]:
+        # Only the local driver can be reused, so on other queues each batch
+        # gets its own evaluator
+        if self.queue_system != QueueSystem.LOCAL:
+            return super().run_ensemble_evaluator(run_args, ensemble, ee_config)
+
+        # The batches are evaluated by one evaluator, which is kept running on
+        # the same event loop from the first batch until the optimization ends
+        if self._evaluator_runner is None:
+            self._evaluator_runner = asyncio.Runner()
+        return self._evaluator_runner.run(
+            self._run_persistent_ensemble_evaluator(run_args, ensemble, ee_config)
+        )
+
+    async def _run_persistent_ensemble_evaluator(
+        self,
+        run_args: list[RunArg],
+        ensemble: Ensemble,
+        ee_config: EvaluatorServerConfig,
+    ) -> list[int]:
+        if self._end_event.is_set():
+            logger.debug("Run model cancelled - pre evaluation")
+            raise UserCancelled("Experiment cancelled by user in pre evaluation")
+
+        if self._evaluator is None:
+            self._evaluator = PersistentEnsembleEvaluator(
+                self.queue_config, ee_config, end_event=self._end_event
+            )
+            await self._evaluator.start()
+
+        successful_realizations = await self._evaluator.evaluate_ensemble(
+            self._build_ensemble(run_args, ensemble.experiment_id),
+            event_handler=partial(
+                self.forward_event_from_ee, iteration=ensemble.iteration
+            ),
+        )
+
+        if self._end_event.is_set():
+            logger.debug("Run model cancelled - post evaluation")
+            raise UserCancelled("Experiment cancelled by user in post evaluation")
+
+        try:
+            ensemble.refresh_ensemble_state()
+        except OSError as err:
+            logger.error(f"Got OSError when refreshing ensemble state: {err}")
+
+        return successful_realizations
+
+    def _close_evaluator(self) -> None:
+        if self._evaluator_runner is None:
+            return
+        try:
+            if self._evaluator is not None:
+                self._evaluator_runner.run(self._evaluator.close())
+        finally:
+            self._evaluator = None
+            self._evaluator_runner.close()
+            self._evaluator_runner = None
+
     def _forward_model_evaluator(
         self, control_values: NDArray[np.float64], evaluator_context: EvaluatorContext
     ) -> EvaluatorResult:
@@ -949,9 +1107,13 @@ def _get_run_args(
         ensemble: Ensemble,
         sim_to_model_realization: list[int],
         sim_to_perturbation: list[int],
+        cached_simulations: set[int] | None = None,
     ) -> list[RunArg]:
         substitutions = self.substitutions
-        self.active_realizations = [True] * len(sim_to_model_realization)
+        self.active_realizations = [
+            sim_id not in (cached_simulations or set())
+            for sim_id in range(len(sim_to_model_realization))
+        ]
 
         # Function evalutions do not have a number/id yet, so we index
         # them from zero in each model realization:
@@ -985,32 +1147,146 @@ def _get_run_args(
             ensemble=ensemble,
         )
 
+    @cached_property
+    def _forward_model_fingerprint(self) -> str:
+        """Identifies the configuration that determines the results of a
+        forward model run, other than the controls and model realization."""
+        fingerprint = json.dumps(
+            {
+                "forward_model_steps": [
+                    step.model_dump(mode="json") for step in self.forward_model_steps
+                ],
+                "ert_templates": self.ert_templates,
+                "objective_names": self.objective_names,
+                "constraint_names": self.constraint_names,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def _load_evaluation_cache(self) -> dict[str, tuple[str, int]]:
+        if self._evaluation_cache is None:
+            assert self._experiment is not None
+            self._evaluation_cache = {
+                key: (ensemble_id, realization)
+                for key, ensemble_id, realization in (
+                    self._experiment.load_evaluation_cache().iter_rows()
+                )
+            }
+        return self._evaluation_cache
+
+    def _find_cached_evaluations(
+        self, ensemble: Ensemble, cache_keys: list[str]
+    ) -> dict[int, tuple[str, int]]:
+        """Map simulations that need not be run to the ensemble and
+        realization to take their results from.
+
+        These are the simulations that were evaluated in an earlier batch,
+        and those that are repeated in the batch itself.
+        """
+        evaluation_cache = self._load_evaluation_cache()
+        cached: dict[int, tuple[str, int]] = {}
+        first_in_batch: dict[str, int] = {}
+        for sim_id, key in enumerate(cache_keys):
+            if key in evaluation_cache:
+                cached[sim_id] = evaluation_cache[key]
+            elif key in first_in_batch:
+                cached[sim_id] = (str(ensemble.id), first_in_batch[key])
+            else:
+                first_in_batch[key] = sim_id
+        return cached
+
+    def _copy_cached_responses(
+        self, ensemble: Ensemble, cached: dict[int, tuple[str, int]]
+    ) -> None:
+        response_types = ["everest_objectives"]
+        if self.constraint_names:
+            response_types.append("everest_constraints")
+
+        by_source: defaultdict[str, list[tuple[int, int]]] = defaultdict(list)
+        for sim_id, (ensemble_id, realization) in cached.items():
+            # A simulation repeated in this batch fails if the first one did
+            if (
+                ensemble_id == str(ensemble.id)
+                and not self.active_realizations[realization]
+            ):
+                continue
+            by_source[ensemble_id].append((sim_id, realization))
+
+        for ensemble_id, simulations in by_source.items():
+            source = (
+                ensemble
+                if ensemble_id == str(ensemble.id)
+                else self._storage.get_ensemble(ensemble_id)
+            )
+            realizations = tuple(sorted({real for _, real in simulations}))
+            for response_type in response_types:
+                responses = source.load_responses(response_type, realizations)
+                for sim_id, realization in simulations:
+                    ensemble.save_response(
+                        response_type,
+                        responses.filter(pl.col("realization") == realization).drop(
+                            "realization"
+                        ),
+                        sim_id,
+                    )
+            for sim_id, _ in simulations:
+                self.active_realizations[sim_id] = True
+
+    def _update_evaluation_cache(
+        self,
+        ensemble: Ensemble,
+        cache_keys: list[str],
+        cached: dict[int, tuple[str, int]],
+    ) -> None:
+        evaluated = {
+            key: (str(ensemble.id), sim_id)
+            for sim_id, key in enumerate(cache_keys)
+            if sim_id not in cached and self.active_realizations[sim_id]
+        }
+        if not evaluated:
+            return
+
+        evaluation_cache = self._load_evaluation_cache()
+        evaluation_cache.update(evaluated)
+        assert self._experiment is not None
+        self._experiment.save_evaluation_cache(
+            pl.DataFrame(
+                {
+                    "key": list(evaluation_cache),
+                    "ensemble_id": [e for e, _ in evaluation_cache.values()],
+                    "realization": [r for _, r in evaluation_cache.values()],
+                },
+                schema={
+                    "key": pl.String,
+                    "ensemble_id": pl.String,
+                    "realization": pl.Int64,
+                },
+            )
+        )
+
     def _delete_run_path(self, run_args: list[RunArg]) -> None:
         logger.debug("Simulation callback called")
         if not self.keep_run_path:
-            for i, real in self.get_current_snapshot().reals.items():
-                path_to_delete = run_args[int(i)].runpath
-                if real.get("status") == "Finished" and os.path.isdir(path_to_delete):
-
-                    def onerror(
-                        _: Callable[..., Any],
-                        path: str,
-                        sys_info: tuple[
-                            type[BaseException], BaseException, TracebackType
-                        ],
-                    ) -> None:
-                        logger.debug(f"Failed to remove {path}, {sys_info}")
-
-                    shutil.rmtree(path_to_delete, onerror=onerror)
+            # The run paths are deleted in the background, so the next batch
+            # does not have to wait for it
+            if self._runpath_deleter is None:
+                self._runpath_deleter = RunpathDeleter()
+            try:
+                self._runpath_deleter.delete(
+                    run_args[int(i)].runpath
+                    for i, real in self.get_current_snapshot().reals.items()
+                    if real.get("status") == "Finished"
+                )
+            except OSError as err:
+                logger.warning(f"Failed to delete run paths: {err}")
 
     def _gather_simulation_results(
         self, ensemble: Ensemble
     ) -> tuple[NDArray[np.float64], NDArray[np.float64] | None]:
         objective_names = self.objective_names
-        objectives = np.zeros((ensemble.ensemble_size, len(objective_names)))
-
         constraint_names = self.constraint_names
-        constraints = np.zeros((ensemble.ensemble_size, len(constraint_names)))
 
         if not any(self.active_realizations):
             nan_objectives = np.full(
@@ -1028,17 +1304,13 @@ def _gather_simulation_results(
         for sim_id, successful in enumerate(self.active_realizations):
             if not successful:
                 logger.error(f"Simulation {sim_id} failed.")
-                objectives[sim_id, :] = np.nan
-                constraints[sim_id, :] = np.nan
-                continue
-
-            for i, obj_name in enumerate(objective_names):
-                data = ensemble.load_responses(obj_name, (sim_id,))
-                objectives[sim_id, i] = data["values"].item()
 
-            for i, constr_name in enumerate(constraint_names):
-                data = ensemble.load_responses(constr_name, (sim_id,))
-                constraints[sim_id, i] = data["values"].item()
+        objectives = _load_batch_responses(
+            ensemble, "everest_objectives", objective_names, self.active_realizations
+        )
+        constraints = _load_batch_responses(
+            ensemble, "everest_constraints", constraint_names, self.active_realizations
+        )
 
         return objectives, constraints if constraint_names else None
 
@@ -1,14 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import concurrent.futures
 import copy
 import dataclasses
 import functools
 import logging
 import os
 import queue
-import shutil
 import threading
 import time
 import traceback
@@ -66,6 +64,7 @@
 
 from ..run_arg import RunArg
 from ._create_run_path import create_run_path
+from ._runpath_deleter import RunpathDeleter
 from .event import EndEvent, FullSnapshotEvent, SnapshotUpdateEvent, StatusEvents
 
 if TYPE_CHECKING:
@@ -108,11 +107,6 @@ def __init__(
         super().__init__(self.message)
 
 
-def delete_runpath(run_path: str) -> None:
-    if os.path.exists(run_path):
-        shutil.rmtree(run_path)
-
-
 class _LogAggregration(logging.Handler):
     def __init__(self, messages: MutableSequence[str]) -> None:
         self.messages = messages
@@ -745,8 +739,14 @@ def get_number_of_successful_realizations(self) -> int:
 
     @log_duration(logger, logging.INFO)
     def rm_run_path(self) -> None:
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            executor.map(delete_runpath, self.paths)
+        # The run paths are gone when this returns, but their content is
+        # deleted in the background. Raises OSError if a run path could not
+        # be moved away
+        deleter = RunpathDeleter()
+        try:
+            deleter.delete(self.paths)
+        finally:
+            deleter.shutdown(wait=False)
 
     def validate_successful_realizations_count(self) -> None:
         successful_realizations_count = self.get_number_of_successful_realizations()
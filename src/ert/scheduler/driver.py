@@ -43,6 +43,11 @@ def event_queue(self) -> asyncio.Queue[DriverEvent]:
             self._event_queue = asyncio.Queue()
         return self._event_queue
 
+    def clear_event_queue(self) -> None:
+        """Drop the events that have not been read, so that the driver can
+        be reused for jobs with the same iens."""
+        self._event_queue = asyncio.Queue()
+
     @abstractmethod
     async def submit(
         self,
@@ -82,7 +87,10 @@ async def poll(self) -> None:
 
     @abstractmethod
     async def finish(self) -> None:
-        """make sure that all the jobs / realizations are complete."""
+        """make sure that all the jobs / realizations are complete.
+
+        Only the LocalDriver can be given new jobs afterwards, the other
+        drivers keep state from the jobs they have run."""
 
     def read_stdout_and_stderr_files(
         self, runpath: str, job_name: str, num_characters_to_read_from_end: int = 300
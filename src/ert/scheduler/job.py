@@ -4,13 +4,15 @@
 import contextlib
 import hashlib
 import logging
+import os
+import re
 import time
 import warnings
 from collections import Counter
 from contextlib import suppress
 from enum import StrEnum
 from pathlib import Path
-from typing import TYPE_CHECKING, assert_never
+from typing import TYPE_CHECKING, Any, assert_never
 
 from lxml import etree
 from opentelemetry.trace import Status, StatusCode
@@ -25,7 +27,7 @@
     RealizationTimeout,
     RealizationWaiting,
 )
-from ert.config import ForwardModelStep
+from ert.config import ChecksumVerification, ForwardModelStep
 from ert.constant_filenames import ERROR_file
 from ert.storage import (
     RealizationStorageState,
@@ -59,6 +61,24 @@ class JobState(StrEnum):
 FILE_VERIFICATION_LOG_TIME_THRESHOLD = 5
 DISK_SYNCHRONIZATION_POLLING_INTERVAL = 1
 
+# Anything in stdout and stderr of forward model steps that looks like a warning
+WARNING_PATTERN = re.compile(
+    b"|".join(
+        re.escape(pattern)
+        for pattern in (
+            b"Warning:",
+            b"FutureWarning",
+            b"DeprecationWarning",
+            b"UserWarning",
+            b":WARNING:",
+            b"- WARNING - ",
+            b"- ERROR - ",
+        )
+    )
+)
+MAX_WARNING_SCAN_BYTES = 16 * 1024**2
+WARNING_SCAN_CHUNK_SIZE = 1024**2
+
 
 class Job:
     """Handle to a single job scheduler job.
@@ -243,7 +263,7 @@ async def run(
         self,
         sem: asyncio.BoundedSemaphore,
         load_lock: asyncio.Lock,
-        checksum_lock: asyncio.Lock,
+        checksum_sem: asyncio.Semaphore,
         max_submit: int = 1,
     ) -> None:
         current_span = trace.get_current_span()
@@ -257,7 +277,7 @@ async def run(
 
             if self.returncode.result() == 0:
                 if self._scheduler._manifest_queue is not None:
-                    await self._verify_checksum(checksum_lock)
+                    await self._verify_checksum(checksum_sem)
                     await self.log_time_spent_above_threshold_waiting_for_files(
                         method_name=self._verify_checksum.__name__
                     )
@@ -308,7 +328,7 @@ async def _max_runtime_task(self) -> None:
 
     async def _verify_checksum(
         self,
-        checksum_lock: asyncio.Lock,
+        checksum_sem: asyncio.Semaphore,
         timeout: int | None = None,  # noqa: ASYNC109
     ) -> None:
         if timeout is None:
@@ -342,22 +362,19 @@ async def _verify_checksum(
             timeout -= DISK_SYNCHRONIZATION_POLLING_INTERVAL
             logger.debug("Waiting for disk synchronization")
             await asyncio.sleep(DISK_SYNCHRONIZATION_POLLING_INTERVAL)
-        async with checksum_lock:
-            for info in valid_checksums:
-                file_path = Path(info["path"])
-                expected_md5sum = info.get("md5sum")
-                if file_path.exists() and expected_md5sum:
-                    actual_md5sum = hashlib.md5(file_path.read_bytes()).hexdigest()
-                    if expected_md5sum == actual_md5sum:
-                        logger.debug(f"File {file_path} checksum successful.")
-                    else:
-                        logger.warning(
-                            f"File {file_path} checksum verification failed."
-                        )
-                elif file_path.exists() and expected_md5sum is None:
-                    logger.warning(f"Checksum not received for file {file_path}")
-                else:
-                    logger.error(f"Disk synchronization failed for {file_path}")
+        async with checksum_sem:
+            # Files are read in a thread so that the event loop is not blocked
+            start_time = time.perf_counter()
+            await asyncio.to_thread(
+                _verify_files, valid_checksums, self._scheduler.checksum_verification
+            )
+            elapsed = time.perf_counter() - start_time
+        self._scheduler.checksum_verification_time += elapsed
+        self._scheduler.checksum_verified_files += len(valid_checksums)
+        logger.debug(
+            f"Verified {len(valid_checksums)} files for realization {self.iens} "
+            f"in {elapsed:.2f} seconds"
+        )
         self.remaining_file_verification_time = timeout
 
     async def _handle_finished_forward_model(self) -> None:
@@ -472,6 +489,85 @@ def log_info_from_exit_file(exit_file_path: Path) -> None:
     )
 
 
+def _verify_files(
+    checksums: list[dict[str, Any]], verification: ChecksumVerification
+) -> None:
+    for info in checksums:
+        file_path = Path(info["path"])
+        expected_md5sum = info.get("md5sum")
+        if not file_path.exists():
+            logger.error(f"Disk synchronization failed for {file_path}")
+        elif (
+            verification == ChecksumVerification.SIZE_MTIME
+            and "size" in info
+            and "mtime" in info
+        ):
+            stat = file_path.stat()
+            if stat.st_size == info["size"] and stat.st_mtime == info["mtime"]:
+                logger.debug(f"File {file_path} checksum successful.")
+            else:
+                logger.warning(f"File {file_path} checksum verification failed.")
+        elif expected_md5sum:
+            with open(file_path, "rb") as f:
+                actual_md5sum = hashlib.file_digest(f, "md5").hexdigest()
+            if expected_md5sum == actual_md5sum:
+                logger.debug(f"File {file_path} checksum successful.")
+            else:
+                logger.warning(f"File {file_path} checksum verification failed.")
+        else:
+            logger.warning(f"Checksum not received for file {file_path}")
+
+
+def _lines_with_warnings(
+    file: Path, max_bytes: int = MAX_WARNING_SCAN_BYTES, max_length: int = 2048
+) -> list[str]:
+    """The lines of file that look like a warning, truncated to max_length.
+
+    The file is read in chunks, and only the last max_bytes of it are read,
+    as warnings are most often found in the end of large files."""
+    captured: list[str] = []
+
+    def scan(text: bytes) -> None:
+        position = 0
+        while match := WARNING_PATTERN.search(text, position):
+            line_start = text.rfind(b"\n", 0, match.start()) + 1
+            line_end = text.find(b"\n", match.end())
+            if line_end == -1:
+                line_end = len(text)
+            line = text[line_start:line_end].decode("utf-8", errors="replace")
+            captured.append(line.rstrip("\r")[:max_length])
+            position = line_end + 1
+
+    with open(file, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size > max_bytes:
+            logger.info(
+                f"Only scanning the last {max_bytes} bytes of {file} "
+                f"of {size} bytes for warnings"
+            )
+            f.seek(size - max_bytes)
+            f.readline()  # Skip the partial first line
+        remainder = b""
+        while chunk := f.read(WARNING_SCAN_CHUNK_SIZE):
+            text = remainder + chunk
+            last_newline = text.rfind(b"\n") + 1
+            scan(text[:last_newline])
+            remainder = text[last_newline:]
+        scan(remainder)
+    return captured
+
+
+def _warnings_in_files(files: list[Path]) -> list[list[str]]:
+    warnings_in_files = []
+    for file in files:
+        try:
+            warnings_in_files.append(_lines_with_warnings(file))
+        except OSError as err:
+            logger.debug(f"Could not scan {file} for warnings: {err}")
+            warnings_in_files.append([])
+    return warnings_in_files
+
+
 async def log_warnings_from_forward_model(
     real: Realization,
     job_submission_time: float,
@@ -481,7 +577,8 @@ async def log_warnings_from_forward_model(
     for anything that looks like a Warning, and log it.
 
     This is not a critical task to perform, but it is critical not to crash
-    during this process.
+    during this process. The files are read in a worker thread, so
+    large files do not block the event loop.
 
     Args:
         real: The realization to look for warnings in
@@ -493,35 +590,6 @@ async def log_warnings_from_forward_model(
         The seconds left of the given timeout_seconds.
     """
 
-    max_length = 2048  # Lines will be truncated in length when logged
-
-    def line_contains_warning(line: str) -> bool:
-        return (
-            "Warning:" in line
-            or "FutureWarning" in line
-            or "DeprecationWarning" in line
-            or "UserWarning" in line
-            or ":WARNING:" in line
-            or "- WARNING - " in line
-            or "- ERROR - " in line
-        )
-
-    async def log_warnings_from_file(  # noqa
-        file: Path, iens: int, step: ForwardModelStep, step_idx: int, filetype: str
-    ) -> None:
-        captured: list[str] = []
-        for line in file.read_text(encoding="utf-8").splitlines():
-            if line_contains_warning(line):
-                captured.append(line[:max_length])
-
-        for line, counter in Counter(captured).items():
-            warning_msg = (
-                f"Realization {iens} step {step.name}.{step_idx} "
-                f"warned {counter} time(s) in {filetype}: {line}"
-            )
-            warnings.warn(warning_msg, PostSimulationWarning, stacklevel=2)
-            logger.warning(warning_msg)
-
     async def wait_for_file(file_path: Path, _timeout: int) -> int:
         if _timeout <= 0:
             return 0
@@ -536,6 +604,7 @@ async def wait_for_file(file_path: Path, _timeout: int) -> int:
                 break
         return remaining_timeout
 
+    std_files: list[tuple[Path, ForwardModelStep, int, str]] = []
     with suppress(KeyError):
         runpath = Path(real.run_arg.runpath)
         for step_idx, step in enumerate(real.fm_steps):
@@ -550,9 +619,21 @@ async def wait_for_file(file_path: Path, _timeout: int) -> int:
                     if timeout_seconds <= 0:
                         break
 
-                    await log_warnings_from_file(
-                        std_path, real.iens, step, step_idx, file_type
-                    )
+                    std_files.append((std_path, step, step_idx, file_type))
             if timeout_seconds <= 0:
                 break
+
+    warnings_in_files = await asyncio.to_thread(
+        _warnings_in_files, [std_path for std_path, *_ in std_files]
+    )
+    for (_, step, step_idx, file_type), captured in zip(
+        std_files, warnings_in_files, strict=True
+    ):
+        for line, counter in Counter(captured).items():
+            warning_msg = (
+                f"Realization {real.iens} step {step.name}.{step_idx} "
+                f"warned {counter} time(s) in {file_type}: {line}"
+            )
+            warnings.warn(warning_msg, PostSimulationWarning, stacklevel=2)
+            logger.warning(warning_msg)
     return timeout_seconds
@@ -3,12 +3,15 @@
 import asyncio
 import contextlib
 import logging
+import os
 import signal
 from asyncio.subprocess import Process
 from collections.abc import Iterable, MutableMapping
 from contextlib import suppress
 from pathlib import Path
 
+import psutil
+
 from .driver import SIGNAL_OFFSET, Driver
 from .event import FinishedEvent, StartedEvent
 
@@ -17,11 +20,71 @@
 logger = logging.getLogger(__name__)
 
 
+def _available_cpus() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class _Resources:
+    """The cores and memory of the machine, booked by the realizations
+    that run on it.
+
+    A realization waits until its cores and memory are free. Waiting
+    realizations are admitted in the order they were submitted, but a
+    realization that fits is not held back by an earlier one that does not,
+    so the machine is kept busy. A realization that needs more than the
+    machine has is admitted when nothing else runs.
+    """
+
+    def __init__(self, num_cpu: int, memory: int) -> None:
+        self.num_cpu = num_cpu
+        self.memory = memory
+        self._used_cpu = 0
+        self._used_memory = 0
+        self._running = 0
+        self._condition = asyncio.Condition()
+
+    def _fits(self, num_cpu: int, memory: int) -> bool:
+        return self._running == 0 or (
+            self._used_cpu + num_cpu <= self.num_cpu
+            and self._used_memory + memory <= self.memory
+        )
+
+    async def acquire(self, num_cpu: int, memory: int) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._fits(num_cpu, memory))
+            self._used_cpu += num_cpu
+            self._used_memory += memory
+            self._running += 1
+
+    async def release(self, num_cpu: int, memory: int) -> None:
+        async with self._condition:
+            self._used_cpu -= num_cpu
+            self._used_memory -= memory
+            self._running -= 1
+            self._condition.notify_all()
+
+
 class LocalDriver(Driver):
-    def __init__(self) -> None:
+    def __init__(self, num_cpu: int | None = None, memory: int | None = None) -> None:
+        """Runs the realizations as subprocesses on this machine, as many at
+        a time as the cores and memory they book fit on it.
+
+        Args:
+          num_cpu: Number of cores to run realizations on. Defaults to the
+            cores this process may run on.
+          memory: Memory, in bytes, to run realizations in. Defaults to the
+            memory available when the driver is created.
+        """
         super().__init__()
         self._tasks: MutableMapping[int, asyncio.Task[None]] = {}
         self._sent_finished_events: set[int] = set()
+        self._resources = _Resources(
+            num_cpu or _available_cpus(),
+            memory or psutil.virtual_memory().available,
+        )
 
     async def submit(
         self,
@@ -35,7 +98,15 @@ async def submit(
         realization_memory: int | None = 0,
         activate_script: str = "",
     ) -> None:
-        self._tasks[iens] = asyncio.create_task(self._run(iens, executable, *args))
+        self._tasks[iens] = asyncio.create_task(
+            self._run(
+                iens,
+                executable,
+                *args,
+                num_cpu=num_cpu or 1,
+                realization_memory=realization_memory or 0,
+            )
+        )
         with suppress(KeyError):
             self._sent_finished_events.remove(iens)
 
@@ -59,14 +130,47 @@ async def kill(self, realizations: Iterable[int]) -> None:
                 )
 
     async def finish(self) -> None:
-        results = await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        try:
+            results = await asyncio.gather(
+                *self._tasks.values(), return_exceptions=True
+            )
+        finally:
+            self._tasks.clear()
+            self._sent_finished_events.clear()
         for result in results:
             if isinstance(result, Exception):
                 logger.error(f"Exception in LocalDriver: {result}")
                 raise result
         logger.info("All realization tasks finished")
 
-    async def _run(self, iens: int, executable: str, /, *args: str | Path) -> None:
+    async def _run(
+        self,
+        iens: int,
+        executable: str,
+        /,
+        *args: str | Path,
+        num_cpu: int = 1,
+        realization_memory: int = 0,
+    ) -> None:
+        if (
+            num_cpu > self._resources.num_cpu
+            or realization_memory > self._resources.memory
+        ):
+            logger.warning(
+                f"Realization {iens} needs {num_cpu} cores and {realization_memory} "
+                f"bytes of memory, but only {self._resources.num_cpu} cores and "
+                f"{self._resources.memory} bytes are available. It will run "
+                "when no other realization is running"
+            )
+        await self._resources.acquire(num_cpu, realization_memory)
+        try:
+            await self._run_process(iens, executable, *args)
+        finally:
+            await self._resources.release(num_cpu, realization_memory)
+
+    async def _run_process(
+        self, iens: int, executable: str, /, *args: str | Path
+    ) -> None:
         logger.debug(
             f"Submitting realization {iens} as command "
             f"'{executable} {' '.join(str(arg) for arg in args)}'"
@@ -21,6 +21,7 @@
     RealizationStoppedLongRunning,
     SnapshotInputEvent,
 )
+from ert.config import ChecksumVerification
 
 from .driver import Driver
 from .event import FinishedEvent, StartedEvent
@@ -31,6 +32,8 @@
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_CHECKSUM_VERIFICATIONS = 4
+
 
 @dataclass
 class _JobsJson:
@@ -71,6 +74,7 @@ def __init__(
         max_submit: int = 1,
         max_running: int = 1,
         submit_sleep: float = 0.0,
+        checksum_verification: ChecksumVerification = ChecksumVerification.MD5,
         ens_id: str | None = None,
     ) -> None:
         self.driver = driver
@@ -106,6 +110,9 @@ def __init__(
         self._ens_id = ens_id
 
         self.checksum: dict[str, dict[str, Any]] = {}
+        self.checksum_verification = checksum_verification
+        self.checksum_verification_time: float = 0.0
+        self.checksum_verified_files: int = 0
         self._realization_ids_to_kill: list[int] = []
         self._kill_task: asyncio.Task[None] | None = None
         self._stop_kill_task = asyncio.Event()
@@ -294,7 +301,9 @@ async def execute(
         # this lock is to assure that no more than 1 task
         # does internalization at a time
         load_lock = asyncio.Lock()
-        verify_checksum_lock = asyncio.Lock()
+        verify_checksum_sem = asyncio.BoundedSemaphore(
+            MAX_CONCURRENT_CHECKSUM_VERIFICATIONS
+        )
         for iens, job in self._jobs.items():
             await asyncio.sleep(0)
             if job.state != JobState.ABORTED:
@@ -302,7 +311,7 @@ async def execute(
                     job.run(
                         sem,
                         load_lock,
-                        verify_checksum_lock,
+                        verify_checksum_sem,
                         self._max_submit,
                     ),
                     name=f"job-{iens}_task",
@@ -334,6 +343,12 @@ async def execute(
             )
             if self._kill_task:
                 await self._kill_task
+        if self.checksum_verified_files:
+            logger.info(
+                f"Verified {self.checksum_verified_files} files "
+                f"({self.checksum_verification}) in "
+                f"{self.checksum_verification_time:.2f} seconds"
+            )
         if self._cancelled:
             logger.debug("Scheduler has been cancelled, jobs are stopped.")
             return False
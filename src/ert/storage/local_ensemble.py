@@ -6,6 +6,7 @@
 import time
 from collections import Counter
 from collections.abc import Iterable
+from contextlib import suppress
 from datetime import datetime
 from functools import cache, cached_property, lru_cache
 from multiprocessing.pool import ThreadPool
@@ -14,7 +15,6 @@
 from uuid import UUID
 
 import numpy as np
-import pandas as pd
 import polars as pl
 import resfo
 import xarray as xr
@@ -101,6 +101,8 @@ def __init__(
             (path / "index.json").read_text(encoding="utf-8")
         )
         self._error_log_name = "error.json"
+        self._misfits: pl.DataFrame | None = None
+        self._parameter_groups: dict[str, pl.DataFrame] = {}
 
         @cache
         def create_realization_dir(realization: int) -> Path:
@@ -285,6 +287,24 @@ def _existing_scalars(self) -> dict[str, list[int]]:
             if param != "realization" and param in genkw_mask
         }
 
+    @cached_property
+    def _existing_parameter_groups(self) -> dict[str, set[int]]:
+        groups: dict[str, set[int]] = {}
+        for name, param in self.experiment.parameter_configuration.items():
+            if (
+                param.cardinality
+                == ParameterCardinality.one_config_per_ensemble_dataset
+            ):
+                try:
+                    groups[name] = set(
+                        self._load_parameter_group(name)
+                        .get_column("realization")
+                        .to_list()
+                    )
+                except KeyError:
+                    groups[name] = set()
+        return groups
+
     def has_data(self) -> bool:
         """
         Check if the ensemble has any responses.
@@ -396,9 +416,13 @@ def get_failure(self, realization: int) -> _Failure | None:
         return None
 
     def refresh_ensemble_state(self) -> None:
+        self._misfits = None
+        self._parameter_groups.clear()
         self.get_ensemble_state.cache_clear()
         if self._existing_scalars is not None:
             del self._existing_scalars
+        with suppress(AttributeError):
+            del self._existing_parameter_groups
         self.get_ensemble_state()
 
     @lru_cache  # noqa: B019
@@ -414,6 +438,7 @@ def get_ensemble_state(self) -> list[set[RealizationStorageState]]:
 
         response_configs = self.experiment.response_configuration
         existing_scalars = self._existing_scalars
+        existing_groups = self._existing_parameter_groups
 
         def _parameters_exist_for_realization(realization: int) -> bool:
             """
@@ -438,6 +463,7 @@ def _parameters_exist_for_realization(realization: int) -> bool:
                     parameter.name in existing_scalars
                     and realization in existing_scalars[parameter.name]
                 )
+                or realization in existing_groups.get(parameter.name, set())
                 or ((path / (_escape_filename(parameter.name) + ".nc")).exists())
                 for parameter in self.experiment.parameter_configuration.values()
             )
@@ -561,6 +587,16 @@ def _load_parameters_lazy(
         df = pl.scan_parquet(group_path)
         return df
 
+    def _load_parameter_group(self, group: str) -> pl.DataFrame:
+        """
+        Load all realizations of a parameter group that is stored as one
+        dataset for the ensemble. The group is read once, and kept until it
+        is saved again.
+        """
+        if group not in self._parameter_groups:
+            self._parameter_groups[group] = self._load_parameters_lazy(group).collect()
+        return self._parameter_groups[group]
+
     def _load_scalar_keys(
         self,
         keys: list[str],
@@ -622,6 +658,26 @@ def load_parameters(
             return self._load_scalar_keys(
                 [cfg.name for cfg in cfgs], realizations, transformed
             )
+        if cardinality == ParameterCardinality.one_config_per_ensemble_dataset:
+            df = self._load_parameter_group(group)
+            if realizations is None:
+                return df
+            if isinstance(realizations, int | np.integer):
+                realizations = np.array([realizations])
+            # Rows are returned in the order of the given realizations
+            selected = pl.DataFrame(
+                {"realization": realizations},
+                schema={"realization": df.schema["realization"]},
+            ).join(df, on="realization", how="left", maintain_order="left")
+            missing = selected.filter(
+                pl.all_horizontal(pl.exclude("realization").is_null())
+            )
+            if not missing.is_empty():
+                raise KeyError(
+                    f"No dataset '{group}' in storage for realizations "
+                    f"{missing.get_column('realization').to_list()}"
+                )
+            return selected
         return self._load_dataset(
             group,
             (
@@ -746,15 +802,16 @@ def load_responses(self, key: str, realizations: tuple[int, ...]) -> pl.DataFram
             Loaded polars DataFrame with responses.
         """
 
-        return self._load_responses_lazy(key, realizations).collect(engine="streaming")
+        return self.load_responses_lazy(key, realizations).collect(engine="streaming")
 
-    def _load_responses_lazy(
+    def load_responses_lazy(
         self, key: str, realizations: tuple[int, ...]
     ) -> pl.LazyFrame:
-        """Load responses for key and realizations into xarray Dataset.
+        """Scan responses for key and realizations without reading them.
 
-        For each given realization, response data is loaded from the NetCDF
-        file whose filename matches the given key parameter.
+        For each given realization, the parquet file of the response type of
+        the key is scanned, so only what the returned frame is collected
+        with is read.
 
         Parameters
         ----------
@@ -765,8 +822,8 @@ def _load_responses_lazy(
 
         Returns
         -------
-        responses : DataFrame
-            Loaded polars DataFrame with responses.
+        responses : LazyFrame
+            Polars LazyFrame with the responses.
         """
 
         select_key = False
@@ -803,6 +860,16 @@ def save_parameters(
         Saves the provided dataset under a parameter group and realization index(es)
 
         """
+        if (
+            isinstance(dataset, pl.DataFrame)
+            and group is not None
+            and group in self.experiment.parameter_configuration
+            and self.experiment.parameter_configuration[group].cardinality
+            == ParameterCardinality.one_config_per_ensemble_dataset
+        ):
+            self._save_parameter_group(dataset, group)
+            return
+
         if isinstance(dataset, pl.DataFrame):
             if dataset.is_empty():
                 raise ValueError("Parameters dataframe is empty.")
@@ -868,6 +935,37 @@ def save_parameters(
             data_to_save = dataset.expand_dims(realizations=[realization])
         self._storage._to_netcdf_transaction(path, data_to_save)
 
+    def _save_parameter_group(self, dataset: pl.DataFrame, group: str) -> None:
+        if dataset.is_empty():
+            raise ValueError(f"Parameters {group} are empty.")
+        if "realization" not in dataset.columns:
+            raise KeyError(
+                f"DataFrame must contain a 'realization' column for saving {group}"
+            )
+
+        # All realizations of the group are saved in a single parquet file,
+        # rows of realizations that are saved again are replaced.
+        try:
+            existing = self._load_parameter_group(group)
+            df_full = pl.concat(
+                [
+                    existing.filter(
+                        ~pl.col("realization").is_in(dataset["realization"].implode())
+                    ),
+                    dataset,
+                ],
+                how="diagonal_relaxed",
+            ).sort("realization")
+        except KeyError:
+            df_full = dataset.sort("realization")
+
+        self._storage._to_parquet_transaction(
+            self.mount_point / f"{_escape_filename(group)}.parquet", df_full
+        )
+        self._parameter_groups[group] = df_full
+        with suppress(AttributeError):
+            del self._existing_parameter_groups
+
     @require_write
     def save_response(
         self, response_type: str, data: pl.DataFrame, realization: int
@@ -911,6 +1009,7 @@ def save_response(
         self._storage._to_parquet_transaction(
             output_path / f"{response_type}.parquet", data
         )
+        self._misfits = None
 
         if not self.experiment._has_finalized_response_keys(response_type):
             response_keys = data["response_key"].unique().to_list()
@@ -929,11 +1028,13 @@ def get_parameter_state(
     ) -> dict[str, RealizationStorageState]:
         path = self._realization_dir(realization)
         existing_scalars = self._existing_scalars
+        existing_groups = self._existing_parameter_groups
         return {
             e: (
                 RealizationStorageState.PARAMETERS_LOADED
                 if (path / (_escape_filename(e) + ".nc")).exists()
                 or (e in existing_scalars and realization in existing_scalars[e])
+                or realization in existing_groups.get(e, set())
                 else RealizationStorageState.UNDEFINED
             )
             for e in self.experiment.parameter_configuration
@@ -1006,7 +1107,7 @@ def get_observations_and_responses(
                 first_columns: pl.DataFrame | None = None
                 realization_columns: list[pl.DataFrame] = []
                 for real in reals:
-                    responses = self._load_responses_lazy(
+                    responses = self.load_responses_lazy(
                         response_type, (real,)
                     ).with_columns(
                         [
@@ -1109,6 +1210,76 @@ def get_observations_and_responses(
                 pl.col("response_key").cast(pl.String).alias("response_key")
             )
 
+    def load_misfits(self) -> pl.DataFrame:
+        """Calculates the misfit for every observation key and realization.
+
+        The misfit of an observation is the squared difference between the
+        observed and simulated value, normalized by the observation error.
+        The aligned observation and response matrix is read once, and the
+        misfits are summed per observation key. The result is cached until
+        new responses are saved to the ensemble.
+
+        Returns
+        -------
+        misfits : DataFrame
+            One row per realization with responses, a "realization" column,
+            one "MISFIT:<observation_key>" column per observation key in
+            sorted order, and a "MISFIT:TOTAL" column. Empty if the ensemble
+            has no observations or no realizations with responses.
+        """
+        if self._misfits is not None:
+            return self._misfits
+
+        observation_keys = sorted(self.experiment.observation_keys)
+        realizations = self.get_realization_list_with_responses()
+        if not observation_keys or not realizations:
+            self._misfits = pl.DataFrame()
+            return self._misfits
+
+        observations_and_responses = self.get_observations_and_responses(
+            observation_keys, np.array(realizations)
+        )
+        real_columns = [str(real) for real in realizations]
+        residuals = observations_and_responses.select(
+            "observation_key",
+            *[
+                ((pl.col(real) - pl.col("observations")) / pl.col("std"))
+                .pow(2)
+                .fill_nan(0.0)
+                .fill_null(0.0)
+                .alias(real)
+                for real in real_columns
+            ],
+        )
+        # The misfits are summed in the same order as when they were computed
+        # with pandas, so they are the same to the last digit
+        values = residuals.select(real_columns).to_numpy()
+        rows_per_key = (
+            residuals.with_row_index()
+            .group_by("observation_key", maintain_order=True)
+            .agg("index")
+            .sort("observation_key")
+        )
+        per_key = np.stack(
+            [
+                np.ascontiguousarray(values[rows].T).sum(axis=1)
+                for _, rows in rows_per_key.iter_rows()
+            ]
+        )
+        self._misfits = pl.DataFrame(
+            {
+                "realization": pl.Series(realizations, dtype=pl.Int64),
+                **{
+                    f"MISFIT:{key}": misfit
+                    for key, misfit in zip(
+                        rows_per_key["observation_key"], per_key, strict=True
+                    )
+                },
+                "MISFIT:TOTAL": per_key.sum(axis=0),
+            }
+        )
+        return self._misfits
+
     @property
     def everest_realization_info(self) -> dict[int, EverestRealizationInfo] | None:
         return self._index.everest_realization_info
@@ -1156,22 +1327,8 @@ def all_parameters_and_gen_data(self) -> pl.DataFrame | None:
         """
         param_dfs = []
         for param_group in self.experiment.parameter_configuration:
-            params_pd = self.load_parameters(param_group)["values"].to_pandas()
-
-            assert isinstance(params_pd, pd.DataFrame)
-            params_pd = params_pd.reset_index()
-            param_df = pl.from_pandas(params_pd)
-
-            param_columns = [c for c in param_df.columns if c != "realizations"]
-            param_df = param_df.rename(
-                {
-                    **{
-                        c: param_group + "." + c.replace("\0", ".")
-                        for c in param_columns
-                    },
-                    "realizations": "realization",
-                }
-            )
+            param_df = self.load_parameters(param_group)
+            assert isinstance(param_df, pl.DataFrame)
             param_df = param_df.cast(
                 {
                     "realization": pl.UInt16,
@@ -489,6 +489,43 @@ def _update_response_keys(
         if self.response_type_to_response_keys is not None:
             del self.response_type_to_response_keys
 
+    @property
+    def _evaluation_cache_path(self) -> Path:
+        return self.mount_point / "evaluation_cache.parquet"
+
+    def load_evaluation_cache(self) -> pl.DataFrame:
+        """
+        Load the cache of successful evaluations, which maps the key of an
+        evaluation to the ensemble and realization holding its responses.
+
+        Returns
+        -------
+        cache : DataFrame
+            With the columns key, ensemble_id and realization, empty if
+            nothing has been cached.
+        """
+        if not self._evaluation_cache_path.exists():
+            return pl.DataFrame(
+                schema={
+                    "key": pl.String,
+                    "ensemble_id": pl.String,
+                    "realization": pl.Int64,
+                }
+            )
+        return pl.read_parquet(self._evaluation_cache_path)
+
+    @require_write
+    def save_evaluation_cache(self, cache: pl.DataFrame) -> None:
+        """
+        Save the cache of successful evaluations, replacing the saved cache.
+
+        Parameters
+        ----------
+        cache : DataFrame
+            With the columns key, ensemble_id and realization.
+        """
+        self._storage._to_parquet_transaction(self._evaluation_cache_path, cache)
+
     @property
     def all_parameters_and_gen_data(self) -> pl.DataFrame | None:
         if not self.ensembles:
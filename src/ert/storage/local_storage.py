@@ -6,7 +6,9 @@
 import os
 import re
 import shutil
+import threading
 from collections.abc import Generator, MutableSequence
+from dataclasses import dataclass, field
 from datetime import datetime
 from functools import cached_property
 from pathlib import Path
@@ -31,7 +33,7 @@
 
 logger = logging.getLogger(__name__)
 
-_LOCAL_STORAGE_VERSION = 14
+_LOCAL_STORAGE_VERSION = 15
 
 
 class _Migrations(BaseModel):
@@ -46,6 +48,22 @@ class _Index(BaseModel):
     migrations: MutableSequence[_Migrations] = Field(default_factory=list)
 
 
+@dataclass
+class _Snapshot:
+    """The ensembles in the storage when it was refreshed, and the
+    ensembles and experiments that have been loaded from it.
+
+    A refresh replaces the snapshot, so that threads that share the storage
+    each see one snapshot. What is loaded into it is added under the lock.
+    """
+
+    ensemble_ids: set[UUID]
+    ensembles: dict[UUID, LocalEnsemble] = field(default_factory=dict)
+    experiments: dict[UUID, LocalExperiment] = field(default_factory=dict)
+    all_ensembles_loaded: bool = False
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+
 class LocalStorage(BaseMode):
     """
     A class representing the local storage for ERT experiments and ensembles.
@@ -84,8 +102,7 @@ def __init__(
         super().__init__(mode)
         self.path = Path(path).absolute()
 
-        self._experiments: dict[UUID, LocalExperiment]
-        self._ensembles: dict[UUID, LocalEnsemble]
+        self._snapshot: _Snapshot
         self._index: _Index
 
         try:
@@ -111,6 +128,7 @@ def __init__(
             )
         if self.can_write:
             self._acquire_lock()
+            self._recover_interrupted_migration(version)
             if version < _LOCAL_STORAGE_VERSION and not ignore_migration_check:
                 self._migrate(version)
             self._index = self._load_index()
@@ -125,19 +143,17 @@ def __init__(
 
     def refresh(self) -> None:
         """
-        Reloads the index, experiments, and ensembles from the storage.
+        Takes a new snapshot of the storage.
 
-        This method is used to refresh the state of the storage to reflect any
-        changes made to the underlying file system since the storage was last
-        accessed.
+        The snapshot is the committed ensembles in the storage, and is taken
+        without reading any of them. Their experiments and ensembles are
+        loaded when first used, so the cost of the snapshot does not grow
+        with the number of ensembles in the storage. Ensembles added after the
+        snapshot was taken are not seen until the storage is refreshed.
         """
 
         self._index = self._load_index()
-        self._ensembles = self._load_ensembles()
-        self._experiments = self._load_experiments()
-
-        for ens in self._ensembles.values():
-            ens.refresh_ensemble_state()
+        self._snapshot = _Snapshot(ensemble_ids=self._list_ensemble_ids())
 
     def get_experiment(self, uuid: UUID) -> LocalExperiment:
         """
@@ -154,7 +170,9 @@ def get_experiment(self, uuid: UUID) -> LocalExperiment:
             The experiment associated with the given UUID.
         """
 
-        return self._experiments[uuid]
+        if (experiment := self._load_experiment(self._snapshot, uuid)) is None:
+            raise KeyError(uuid)
+        return experiment
 
     def get_experiment_by_name(self, name: str) -> LocalExperiment:
         """
@@ -172,7 +190,7 @@ def get_experiment_by_name(self, name: str) -> LocalExperiment:
         KeyError
             If no experiment with the given name is found.
         """
-        for exp in self._experiments.values():
+        for exp in self.experiments:
             if exp.name == name:
                 return exp
         raise KeyError(f"Experiment with name '{name}' not found")
@@ -192,15 +210,50 @@ def get_ensemble(self, uuid: UUID | str) -> LocalEnsemble:
         """
         if isinstance(uuid, str):
             uuid = UUID(uuid)
-        return self._ensembles[uuid]
+        if (ensemble := self._load_ensemble(self._snapshot, uuid)) is None:
+            raise KeyError(uuid)
+        return ensemble
 
     @property
     def experiments(self) -> Generator[LocalExperiment]:
-        yield from self._experiments.values()
+        snapshot = self._snapshot
+        for ensemble in self._all_ensembles(snapshot):
+            self._load_experiment(snapshot, ensemble.experiment_id)
+        with snapshot.lock:
+            experiments = list(snapshot.experiments.values())
+        yield from experiments
 
     @property
     def ensembles(self) -> Generator[LocalEnsemble]:
-        yield from self._ensembles.values()
+        yield from self._all_ensembles(self._snapshot)
+
+    def _all_ensembles(self, snapshot: _Snapshot) -> list[LocalEnsemble]:
+        with snapshot.lock:
+            if not snapshot.all_ensembles_loaded:
+                loaded = [
+                    ensemble
+                    for uuid in list(snapshot.ensemble_ids)
+                    if (ensemble := self._load_ensemble(snapshot, uuid)) is not None
+                ]
+                created = [
+                    ensemble
+                    for uuid, ensemble in snapshot.ensembles.items()
+                    if uuid not in snapshot.ensemble_ids
+                ]
+                # Make sure that the ensembles are sorted by name in reverse.
+                # Given multiple ensembles with a common name, iterating over
+                # the ensemble dictionary will yield the newest ensemble first.
+                # Ensembles created since the snapshot follow in the order
+                # they were created.
+                snapshot.ensembles = {
+                    ensemble.id: ensemble
+                    for ensemble in [
+                        *sorted(loaded, key=lambda x: x.started_at, reverse=True),
+                        *created,
+                    ]
+                }
+                snapshot.all_ensembles_loaded = True
+            return list(snapshot.ensembles.values())
 
     def _load_index(self) -> _Index:
         try:
@@ -210,32 +263,45 @@ def _load_index(self) -> _Index:
         except FileNotFoundError:
             return _Index()
 
-    def _load_ensembles(self) -> dict[UUID, LocalEnsemble]:
-        if not (self.path / "ensembles").exists():
-            return {}
-        ensembles: list[LocalEnsemble] = []
-        for ensemble_path in (self.path / "ensembles").iterdir():
+    def _list_ensemble_ids(self) -> set[UUID]:
+        ensemble_ids = set()
+        with contextlib.suppress(FileNotFoundError):
+            for entry in os.scandir(self.path / self.ENSEMBLES_PATH):
+                with contextlib.suppress(ValueError):
+                    ensemble_ids.add(UUID(entry.name))
+        return ensemble_ids
+
+    def _load_ensemble(self, snapshot: _Snapshot, uuid: UUID) -> LocalEnsemble | None:
+        with snapshot.lock:
+            if uuid in snapshot.ensembles:
+                return snapshot.ensembles[uuid]
+            if uuid not in snapshot.ensemble_ids:
+                return None
             try:
-                ensemble = LocalEnsemble(self, ensemble_path, self.mode)
-                ensembles.append(ensemble)
+                ensemble = LocalEnsemble(self, self._ensemble_path(uuid), self.mode)
             except FileNotFoundError:
-                logger.exception(
-                    "Failed to load an ensemble from path: %s", ensemble_path
+                # The index of an ensemble is written when it is created, so
+                # an ensemble without it is still being created, or is broken
+                logger.info(f"Ensemble {uuid} in {self.path} has no index, skipping it")
+                snapshot.ensemble_ids.discard(uuid)
+                return None
+            snapshot.ensembles[uuid] = ensemble
+            return ensemble
+
+    def _load_experiment(
+        self, snapshot: _Snapshot, uuid: UUID
+    ) -> LocalExperiment | None:
+        with snapshot.lock:
+            if uuid in snapshot.experiments:
+                return snapshot.experiments[uuid]
+            try:
+                experiment = LocalExperiment(
+                    self, self._experiment_path(uuid), self.mode
                 )
-                continue
-        # Make sure that the ensembles are sorted by name in reverse. Given
-        # multiple ensembles with a common name, iterating over the ensemble
-        # dictionary will yield the newest ensemble first.
-        return {
-            x.id: x for x in sorted(ensembles, key=lambda x: x.started_at, reverse=True)
-        }
-
-    def _load_experiments(self) -> dict[UUID, LocalExperiment]:
-        experiment_ids = {ens.experiment_id for ens in self._ensembles.values()}
-        return {
-            exp_id: LocalExperiment(self, self._experiment_path(exp_id), self.mode)
-            for exp_id in experiment_ids
-        }
+            except FileNotFoundError:
+                return None
+            snapshot.experiments[uuid] = experiment
+            return experiment
 
     def _ensemble_path(self, ensemble_id: UUID) -> Path:
         return self.path / self.ENSEMBLES_PATH / str(ensemble_id)
@@ -287,8 +353,7 @@ def close(self) -> None:
         the storage.
         """
 
-        self._ensembles.clear()
-        self._experiments.clear()
+        self._snapshot = _Snapshot(ensemble_ids=set())
 
         if not self.can_write:
             return
@@ -352,7 +417,8 @@ def create_experiment(
             templates=templates,
         )
 
-        self._experiments[exp.id] = exp
+        with self._snapshot.lock:
+            self._snapshot.experiments[exp.id] = exp
         return exp
 
     @require_write
@@ -432,7 +498,8 @@ def create_ensemble(
                         f"Failure from prior: {state}",
                     )
 
-        self._ensembles[ens.id] = ens
+        with self._snapshot.lock:
+            self._snapshot.ensembles[ens.id] = ens
         return ens
 
     @require_write
@@ -446,7 +513,19 @@ def _add_migration_information(
             )
         )
         self._index.version = to_version
-        self._save_index()
+
+    @require_write
+    def _recover_interrupted_migration(self, version: int) -> None:
+        from .migration._staged import recover_interrupted_migration  # noqa: PLC0415
+
+        recover_interrupted_migration(
+            self.path, completed=version == _LOCAL_STORAGE_VERSION
+        )
+
+    def _report_migration_progress(self, migrated: int, total: int) -> None:
+        message = f"Migrated {migrated} of {total} experiments in {self.path}"
+        logger.info(message)
+        print(message)
 
     @require_write
     def _save_index(self) -> None:
@@ -493,7 +572,9 @@ def _migrate(self, version: int) -> None:
             to12,
             to13,
             to14,
+            to15,
         )
+        from .migration._staged import migrate_staged  # noqa: PLC0415
 
         try:
             self._index = self._load_index()
@@ -536,12 +617,28 @@ def _migrate(self, version: int) -> None:
                     11: to12,
                     12: to13,
                     13: to14,
+                    14: to15,
                 }
-                for from_version in range(version, _LOCAL_STORAGE_VERSION):
-                    migrations[from_version].migrate(self.path)
-                    self._add_migration_information(
-                        from_version, from_version + 1, migrations[from_version].info
-                    )
+                from_versions = range(version, _LOCAL_STORAGE_VERSION)
+
+                def complete() -> None:
+                    for from_version in from_versions:
+                        self._add_migration_information(
+                            from_version,
+                            from_version + 1,
+                            migrations[from_version].info,
+                        )
+                    self._save_index()
+
+                migrate_staged(
+                    self.path,
+                    [
+                        migrations[from_version].migrate
+                        for from_version in from_versions
+                    ],
+                    complete,
+                    self._report_migration_progress,
+                )
         except Exception as e:
             logger.error(
                 f"Migrating storage at {self.path} failed with: {e}", stack_info=True
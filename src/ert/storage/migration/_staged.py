@@ -0,0 +1,163 @@
+"""Migration of a storage through a staging directory.
+
+Each experiment is migrated together with its ensembles, independently of
+the other experiments, so the experiments are migrated in parallel. They are
+migrated in a copy made in the staging directory of the storage, and are
+swapped in for the original experiments and ensembles only when all of them
+have been migrated. A migration that fails or is interrupted therefore
+leaves the storage as it was, and what was staged is removed the next time
+the storage is opened.
+
+The files of the ensembles are hard linked into the staging directory rather
+than copied, so staging costs little even for large ensembles. Migrations
+must therefore not write into existing files of an ensemble, but write new
+files and remove the old ones.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_PATH = "_migration"
+STORAGE_DIRECTORIES = ("experiments", "ensembles")
+MAX_MIGRATION_WORKERS = 8
+
+Migration = Callable[[Path], None]
+
+
+def _experiment_id(directory: Path, key: str) -> str | None:
+    try:
+        with open(directory / "index.json", encoding="utf-8") as fin:
+            return str(json.load(fin)[key])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _group_by_experiment(path: Path) -> list[list[Path]]:
+    """The experiments and ensembles of the storage, grouped by experiment.
+    What does not belong to an experiment is grouped together."""
+    groups: dict[str | None, list[Path]] = defaultdict(list)
+    for directory, key in zip(
+        STORAGE_DIRECTORIES, ("id", "experiment_id"), strict=True
+    ):
+        if (path / directory).is_dir():
+            for entry in sorted((path / directory).iterdir()):
+                groups[_experiment_id(entry, key)].append(entry)
+    return list(groups.values())
+
+
+def _link_or_copy(source: str, destination: str) -> None:
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def _stage(entry: Path, destination: Path) -> None:
+    copy_function = _link_or_copy if entry.parent.name == "ensembles" else shutil.copy2
+    if entry.is_dir() and not entry.is_symlink():
+        shutil.copytree(entry, destination, symlinks=True, copy_function=copy_function)
+    else:
+        copy_function(str(entry), str(destination))
+
+
+def _migrate_group(
+    group: Sequence[Path], group_path: Path, migrations: Sequence[Migration]
+) -> None:
+    for directory in STORAGE_DIRECTORIES:
+        (group_path / directory).mkdir(parents=True)
+    for entry in group:
+        _stage(entry, group_path / entry.parent.name / entry.name)
+    for migration in migrations:
+        migration(group_path)
+
+
+def recover_interrupted_migration(path: Path, completed: bool) -> None:
+    """Cleans up after a migration that was interrupted. If it was not
+    completed, the original experiments and ensembles are put back in case
+    the migration was interrupted while they were swapped."""
+    staging = path / MIGRATION_PATH
+    if not staging.exists():
+        return
+    if not completed:
+        logger.warning(f"Rolling back interrupted migration of storage {path}")
+        for directory in STORAGE_DIRECTORIES:
+            original = staging / "original" / directory
+            if original.exists():
+                if (path / directory).exists():
+                    shutil.rmtree(path / directory)
+                original.rename(path / directory)
+    shutil.rmtree(staging)
+
+
+def migrate_staged(
+    path: Path,
+    migrations: Sequence[Migration],
+    complete: Callable[[], None],
+    progress: Callable[[int, int], None] | None = None,
+    max_workers: int = MAX_MIGRATION_WORKERS,
+) -> None:
+    """Applies the migrations to each experiment of the storage at path,
+    together with its ensembles, in parallel in a staging directory. When
+    all are migrated, they are swapped in for the original experiments and
+    ensembles, and complete is called to record that the storage is
+    migrated. progress is called with the number of migrated experiments
+    and the total number of experiments."""
+    staging = path / MIGRATION_PATH
+    if staging.exists():
+        shutil.rmtree(staging)
+    for directory in STORAGE_DIRECTORIES:
+        (path / directory).mkdir(exist_ok=True)
+
+    groups = _group_by_experiment(path)
+    group_paths = [staging / "groups" / str(i) for i in range(len(groups))]
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(groups))),
+            thread_name_prefix="storage_migration",
+        ) as executor:
+            pending = {
+                executor.submit(_migrate_group, group, group_path, migrations)
+                for group, group_path in zip(groups, group_paths, strict=True)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is not None:
+                        for remaining in pending:
+                            remaining.cancel()
+                        future.result()
+                if progress is not None:
+                    progress(len(groups) - len(pending), len(groups))
+
+        staged = staging / "staged"
+        for directory in STORAGE_DIRECTORIES:
+            (staged / directory).mkdir(parents=True)
+            for group_path in group_paths:
+                for entry in (group_path / directory).iterdir():
+                    entry.rename(staged / directory / entry.name)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    # From here on an interruption is rolled back, or completed, by
+    # recover_interrupted_migration
+    (staging / "original").mkdir()
+    try:
+        for directory in STORAGE_DIRECTORIES:
+            (path / directory).rename(staging / "original" / directory)
+            (staged / directory).rename(path / directory)
+        complete()
+    except Exception:
+        recover_interrupted_migration(path, completed=False)
+        raise
+    shutil.rmtree(staging)
@@ -0,0 +1,61 @@
+import json
+import os
+from pathlib import Path
+
+import polars as pl
+import xarray as xr
+
+from ert.storage.local_ensemble import _escape_filename
+
+info = "Store everest parameters in one parquet file per ensemble"
+
+
+def migrate_everest_parameters(path: Path) -> None:
+    for experiment in path.glob("experiments/*"):
+        with open(experiment / "index.json", encoding="utf-8") as f:
+            experiment_id = json.load(f)["id"]
+
+        with open(experiment / "parameter.json", encoding="utf-8") as fin:
+            parameters_json = json.load(fin)
+
+        groups = [
+            config["name"]
+            for config in parameters_json.values()
+            if config["type"] == "everest_parameters"
+        ]
+        if not groups:
+            continue
+
+        for ens in path.glob("ensembles/*"):
+            with open(ens / "index.json", encoding="utf-8") as f:
+                if json.load(f)["experiment_id"] != experiment_id:
+                    continue
+
+            for group in groups:
+                filename = _escape_filename(group)
+                nc_files = sorted(ens.glob(f"realization-*/{filename}.nc"))
+                rows = []
+                for nc_file in nc_files:
+                    realization = int(nc_file.parent.name.removeprefix("realization-"))
+                    with xr.open_dataset(nc_file, engine="scipy") as ds:
+                        values = ds["values"].values.reshape(-1)
+                        names = [str(name) for name in ds["names"].values]
+                    rows.append(
+                        {
+                            "realization": realization,
+                            **{
+                                f"{group}.{name.replace(chr(0), '.')}": float(value)
+                                for name, value in zip(names, values, strict=True)
+                            },
+                        }
+                    )
+                if rows:
+                    pl.DataFrame(rows).sort("realization").write_parquet(
+                        ens / f"{filename}.parquet"
+                    )
+                for nc_file in nc_files:
+                    os.remove(nc_file)
+
+
+def migrate(path: Path) -> None:
+    migrate_everest_parameters(path)
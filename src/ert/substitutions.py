@@ -4,9 +4,11 @@
 import re
 from collections import UserDict
 from collections.abc import Mapping
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 _PATTERN = re.compile(r"<[^<>]+>")
+_BRACKETS = re.compile(r"([<>])")
 
 
 class Substitutions(UserDict[str, str]):
@@ -36,15 +38,36 @@ def substitute_parameters(
         Returns:
             substituted string
         """
-        for values in parameter_values.values():
-            for param_name, value in values.items():
-                if isinstance(value, (int, float)):
-                    formatted_value = f"{value:.6g}"
-                else:
-                    formatted_value = str(value)
-                to_substitute = to_substitute.replace(
-                    f"<{param_name}>", formatted_value
-                )
+        replacements = [
+            (
+                f"<{param_name}>",
+                f"{value:.6g}" if isinstance(value, (int, float)) else str(value),
+            )
+            for values in parameter_values.values()
+            for param_name, value in values.items()
+        ]
+        if not replacements:
+            return to_substitute
+
+        # The magic strings are replaced in one pass, unless a replacement
+        # may give a new magic string, where the result depends on the order
+        # the parameters are replaced in
+        formatted_values: dict[str, str] = {}
+        for key, formatted_value in replacements:
+            formatted_values.setdefault(key, formatted_value)
+        if all(
+            _PATTERN.fullmatch(key) and not _BRACKETS.search(formatted_value)
+            for key, formatted_value in formatted_values.items()
+        ):
+            substituted = _PATTERN.sub(
+                lambda match: formatted_values.get(match[0], match[0]),
+                to_substitute,
+            )
+            if formatted_values.keys().isdisjoint(_PATTERN.findall(substituted)):
+                return substituted
+
+        for key, formatted_value in replacements:
+            to_substitute = to_substitute.replace(key, formatted_value)
         return to_substitute
 
     def substitute_real_iter(
@@ -89,6 +112,12 @@ def _substitute(
     emitted during subsitution.
 
     """
+    substituted = _substitute_in_one_pass(substitutions, to_substitute, max_iterations)
+    if substituted is not None:
+        return substituted
+
+    # The substitutions did not resolve within max_iterations, so they are
+    # applied iteratively to give the same string and warning as always
     substituted_string = to_substitute
     for _ in range(max_iterations):
         substituted_tmp_string = _replace_strings(substitutions, substituted_string)
@@ -110,6 +139,126 @@ def _substitute(
     return substituted_string
 
 
+def _substitute_in_one_pass(
+    substitutions: Mapping[str, str], string: str, max_iterations: int
+) -> str | None:
+    """Gives the same string as applying _replace_strings until nothing is
+    replaced, or None if that takes max_iterations or more, which is where
+    _substitute stops and warns.
+
+    The magic strings are replaced in one pass with their values, which are
+    resolved once. If a value does not resolve to plain text, or forms a new
+    magic string together with the text around it, the string is scanned by
+    _scan instead.
+    """
+    if max_iterations < 1:
+        return None
+    # The values the magic strings resolve to. Those that do not resolve to
+    # plain text are left as they are, and the string is scanned instead
+    resolved: dict[str, str] = {}
+    rounds = 0
+    needs_scan = False
+
+    def resolve(key: str) -> str:
+        nonlocal rounds, needs_scan
+        resolved[key] = key
+        if value := substitutions.get(key):
+            resolution = _scan(substitutions, value, max_iterations, depth=1)
+            if resolution is None or _BRACKETS.search(resolution[0]):
+                needs_scan = True
+            else:
+                resolved[key], value_rounds = resolution
+                rounds = max(rounds, value_rounds)
+        return resolved[key]
+
+    def replace(match: re.Match[str]) -> str:
+        key = match[0]
+        return resolved[key] if key in resolved else resolve(key)
+
+    substituted = _PATTERN.sub(replace, string)
+    if not needs_scan:
+        if rounds == 0:
+            return string
+        if not any(map(substitutions.get, set(_PATTERN.findall(substituted)))):
+            return substituted
+    if (scanned := _scan(substitutions, string, max_iterations)) is None:
+        return None
+    # The string is given back as is if nothing is replaced, so the
+    # location of a token of a config file is kept
+    return scanned[0] if scanned[1] > 0 else string
+
+
+@lru_cache(maxsize=128)
+def _tokenize(string: str) -> tuple[str, ...]:
+    return tuple(token for token in _BRACKETS.split(string) if token)
+
+
+def _scan(
+    substitutions: Mapping[str, str],
+    string: str,
+    max_iterations: int,
+    depth: int = 0,
+) -> tuple[str, int] | None:
+    """Resolves the magic strings of the string in one pass over its tokens,
+    and gives the resolved string with the number of times _replace_strings
+    has to be applied to replace them all, or None if that is max_iterations
+    or more.
+
+    A magic string is resolved when its closing bracket is reached, and its
+    value is then scanned in its place, so values with magic strings, and
+    magic strings formed by a value together with the text around it, are
+    resolved as well. The depth of a magic string is the number of times
+    _replace_strings has to be applied for it to be formed, and depth is
+    that of the string itself.
+    """
+    parts: list[str] = []
+    # The index in parts of each unclosed "<", whether a magic string that
+    # is not replaced comes after it, and the depth of what comes after it
+    opened: list[tuple[int, bool, int]] = []
+    # The tokens that are left to scan, with their depth, of the string and
+    # the values that are being scanned
+    pending: list[tuple[tuple[str, ...], int, int]] = []
+    tokens, index = _tokenize(string), 0
+    rounds = depth
+    while True:
+        if index == len(tokens):
+            if not pending:
+                return "".join(parts), rounds
+            tokens, index, depth = pending.pop()
+            continue
+        token = tokens[index]
+        index += 1
+        if token == "<":
+            opened.append((len(parts), False, depth))
+            parts.append(token)
+            continue
+        if token != ">" or not opened:
+            parts.append(token)
+            if opened and depth > opened[-1][2]:
+                opened[-1] = (opened[-1][0], opened[-1][1], depth)
+            continue
+        start, unreplaced, magic_depth = opened.pop()
+        magic_depth = max(magic_depth, depth)
+        parts.append(token)
+        if (
+            not unreplaced
+            and len(parts) > start + 2
+            and (value := substitutions.get("".join(parts[start:])))
+        ):
+            if magic_depth + 1 >= max_iterations:
+                return None
+            del parts[start:]
+            rounds = max(rounds, magic_depth + 1)
+            pending.append((tokens, index, depth))
+            tokens, index, depth = _tokenize(value), 0, magic_depth + 1
+            continue
+        # What is not replaced stays, and so do its brackets, so what it is
+        # in can not become a magic string
+        if opened:
+            outer_start, _, outer_depth = opened[-1]
+            opened[-1] = (outer_start, True, max(outer_depth, magic_depth))
+
+
 def _replace_strings(substitutions: Mapping[str, str], string: str) -> str | None:
     start = 0
     parts: list[str] = []
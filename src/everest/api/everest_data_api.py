@@ -24,15 +24,11 @@ def __init__(self, config: EverestConfig, filter_out_gradient: bool = True) -> N
 
     @property
     def batches(self) -> list[int]:
-        return sorted(
-            b.batch_id for b in self._ever_storage.data.batches_with_function_results
-        )
+        return self._ever_storage.data.function_batch_ids
 
     @property
     def accepted_batches(self) -> list[int]:
-        return sorted(
-            b.batch_id for b in self._ever_storage.data.batches if b.is_improvement
-        )
+        return self._ever_storage.data.accepted_batch_ids
 
     @property
     def objective_function_names(self) -> list[str]:
@@ -56,25 +52,34 @@ def output_constraint_names(self) -> list[str]:
             else []
         )
 
+    def _first_batch_objectives(self) -> pl.LazyFrame | None:
+        objectives = self._ever_storage.data.scan_results("realization_objectives")
+        batches = self.batches
+        if objectives is None or not batches:
+            return None
+        return objectives.filter(pl.col("batch_id") == batches[0])
+
     @property
     def realizations(self) -> list[int]:
-        if not self._ever_storage.data.batches_with_function_results:
+        objectives = self._first_batch_objectives()
+        if objectives is None:
             return []
         return sorted(
-            self._ever_storage.data.batches_with_function_results[0]
-            .realization_objectives["realization"]
-            .unique()
+            objectives.select(pl.col("realization").unique())
+            .collect()
+            .get_column("realization")
             .to_list()
         )
 
     @property
     def simulations(self) -> list[int]:
-        if not self._ever_storage.data.batches_with_function_results:
+        objectives = self._first_batch_objectives()
+        if objectives is None:
             return []
         return sorted(
-            self._ever_storage.data.batches_with_function_results[0]
-            .realization_objectives["simulation_id"]
-            .unique()
+            objectives.select(pl.col("simulation_id").unique())
+            .collect()
+            .get_column("simulation_id")
             .to_list()
         )
 
@@ -92,82 +97,96 @@ def control_values(self) -> list[dict[str, Any]]:
             if self._ever_storage.data.controls is not None
             else []
         )
-        new = []
-        for batch in self._ever_storage.data.batches_with_function_results:
-            for controls_dict in batch.realization_controls.to_dicts():
-                for name in all_control_names:
-                    new.append(
-                        {
-                            "control": name,
-                            "batch": batch.batch_id,
-                            "value": controls_dict[name],
-                        }
-                    )
+        controls = self._ever_storage.data.scan_results("realization_controls")
+        if controls is None or not all_control_names:
+            return []
 
-        return new
+        # One row per batch, simulation and control, ordered by batch, then
+        # by simulation as stored, then by control as configured
+        return (
+            controls.filter(pl.col("batch_id").is_in(self.batches))
+            .sort("batch_id", maintain_order=True)
+            .with_row_index("row")
+            .unpivot(
+                on=all_control_names,
+                index=["row", "batch_id"],
+                variable_name="control",
+                value_name="value",
+            )
+            .sort("row", pl.col("control").cast(pl.Enum(all_control_names)))
+            .select("control", pl.col("batch_id").alias("batch"), "value")
+            .collect()
+            .to_dicts()
+        )
 
     @property
     def objective_values(self) -> list[dict[str, Any]]:
-        obj_values = []
-        for b in self._ever_storage.data.batches_with_function_results:
-            for (
-                model_realization,
-                simulation_id,
-            ), df in b.realization_objectives.sort(
-                ["realization", "simulation_id"]
-            ).group_by(["realization", "simulation_id"], maintain_order=True):
-                for obj_dict in (
-                    self._ever_storage.data.objective_functions.sort(
-                        ["objective_name"]
-                    ).to_dicts()
-                    if self._ever_storage.data.objective_functions is not None
-                    else []
-                ):
-                    obj_name = obj_dict["objective_name"]
-                    obj_value = df[obj_name].item()
-
-                    if obj_value is None:
-                        logger.error(
-                            f"Objective {obj_name} has no value for "
-                            f"batch {b.batch_id}, "
-                            f"model realization {model_realization},"
-                            f"simulation id {simulation_id}. "
-                            f"Columns in dataframe: {', '.join(df.columns)}"
-                        )
-                        continue
-
-                    obj_values.append(
-                        {
-                            "batch": int(b.batch_id),
-                            "realization": int(model_realization),
-                            "simulation": int(simulation_id),
-                            "function": obj_name,
-                            "scale": float(obj_dict["scale"]),
-                            "value": float(obj_value),
-                            "weight": float(obj_dict["weight"]),
-                        }
-                    )
+        objectives = self._ever_storage.data.scan_results("realization_objectives")
+        objective_functions = self._ever_storage.data.objective_functions
+        if objectives is None or objective_functions is None:
+            return []
 
-        return obj_values
+        index = ["batch_id", "realization", "simulation_id"]
+        values = (
+            objectives.filter(pl.col("batch_id").is_in(self.batches))
+            .unpivot(
+                on=objective_functions["objective_name"].to_list(),
+                index=index,
+                variable_name="objective_name",
+                value_name="value",
+            )
+            .join(objective_functions.lazy(), on="objective_name")
+            .sort([*index, "objective_name"])
+            .collect()
+        )
+
+        for row in values.filter(pl.col("value").is_null()).iter_rows(named=True):
+            logger.error(
+                f"Objective {row['objective_name']} has no value for "
+                f"batch {row['batch_id']}, "
+                f"model realization {row['realization']},"
+                f"simulation id {row['simulation_id']}. "
+                f"Columns in dataframe: "
+                f"{', '.join([*index, *objective_functions['objective_name']])}"
+            )
+
+        return (
+            values.filter(pl.col("value").is_not_null())
+            .select(
+                pl.col("batch_id").cast(pl.Int64).alias("batch"),
+                pl.col("realization").cast(pl.Int64),
+                pl.col("simulation_id").cast(pl.Int64).alias("simulation"),
+                pl.col("objective_name").alias("function"),
+                pl.col("scale").cast(pl.Float64),
+                pl.col("value").cast(pl.Float64),
+                pl.col("weight").cast(pl.Float64),
+            )
+            .to_dicts()
+        )
 
     @property
     def single_objective_values(self) -> list[dict[str, Any]]:
-        batch_datas = pl.concat(
-            [
-                b.batch_objectives.select(
-                    c for c in b.batch_objectives.columns if c != "merit_value"
-                ).with_columns(pl.lit(1 if b.is_improvement else 0).alias("accepted"))
-                for b in self._ever_storage.data.batches_with_function_results
-            ]
+        batch_objectives = self._ever_storage.data.scan_results("batch_objectives")
+        assert batch_objectives is not None
+        batch_datas = (
+            batch_objectives.filter(pl.col("batch_id").is_in(self.batches))
+            .sort("batch_id", maintain_order=True)
+            .select(pl.exclude("merit_value"))
+            .with_columns(
+                pl.col("batch_id")
+                .is_in(self.accepted_batches)
+                .cast(pl.Int32)
+                .alias("accepted")
+            )
         )
         objectives = self._ever_storage.data.objective_functions
         assert objectives is not None
         objective_names = objectives["objective_name"].unique().to_list()
 
-        for o in objectives.to_dicts():
-            batch_datas = batch_datas.with_columns(
-                pl.col(o["objective_name"]) * o["weight"] / o["scale"]
-            )
+        batch_datas = batch_datas.with_columns(
+            pl.col(o["objective_name"]) * o["weight"] / o["scale"]
+            for o in objectives.to_dicts()
+        )
 
         columns = [
             "batch",
@@ -181,21 +200,23 @@ def single_objective_values(self) -> list[dict[str, Any]]:
                 {"total_objective_value": "objective", "batch_id": "batch"}
             )
             .select(columns)
+            .collect()
             .to_dicts()
         )
 
     @property
     def gradient_values(self) -> list[dict[str, Any]]:
-        all_batch_data = [
-            b.batch_objective_gradient
-            for b in self._ever_storage.data.batches_with_gradient_results
-            if b.batch_objective_gradient is not None
-            and b.is_improvement  # Note: This part might not be sensible
-        ]
-        if not all_batch_data:
+        gradients = self._ever_storage.data.scan_results("batch_objective_gradient")
+        if gradients is None:
+            return []
+
+        # Note: Only using the accepted batches might not be sensible
+        all_info = gradients.filter(
+            pl.col("batch_id").is_in(self.accepted_batches)
+        ).collect()
+        if all_info.is_empty():
             return []
 
-        all_info = pl.concat(all_batch_data)
         objective_columns = [
             c
             for c in all_info.drop(["batch_id", "control_name"]).columns
@@ -60,6 +60,22 @@ class SimulatorConfig(BaseModelWithContextSupport, extra="forbid"):
             """
         ),
     )
+    enable_cache: bool = Field(
+        default=False,
+        description=dedent(
+            """
+            If `True`, forward model runs are not repeated for a control vector
+            and model realization that were already evaluated successfully.
+            Instead, the stored objectives and constraints of the earlier run
+            are reused.
+
+            Control values are compared after rounding to 10 decimals. The
+            cache is only valid as long as the forward model gives the same
+            results for the same controls, it should not be enabled if the
+            forward model is not deterministic.
+            """
+        ),
+    )
     max_runtime: NonNegativeInt | None = Field(
         default=None,
         description=dedent(
@@ -4,6 +4,7 @@
 import logging
 import os
 import traceback
+from collections.abc import Iterable
 from functools import cached_property
 from pathlib import Path
 from typing import Any, ClassVar, TypedDict
@@ -45,6 +46,173 @@ class OptimizationDataframes(TypedDict, total=False):
     realization_weights: pl.DataFrame | None
 
 
+class _ResultTables:
+    """
+    Append-only tables with the optimization results, one table per kind of
+    result, e.g. realization_controls.
+
+    The results of a batch are appended to a table as one part file,
+    results/<kind>/batch_<id>.parquet. Once enough part files are appended,
+    they are compacted into a single file for the range of batches,
+    results/<kind>/batches_<first>_<last>.parquet. Results stored per batch
+    directory by earlier versions are read as part files.
+    """
+
+    COMPACTION_THRESHOLD: ClassVar[int] = 20
+
+    def __init__(self, path: Path, legacy_batches_path: Path) -> None:
+        self._path = path
+        self._legacy_batches_path = legacy_batches_path
+        self._batch_ids: dict[str, set[int]] = {}
+
+    def _part_path(self, kind: str, batch_id: int) -> Path:
+        return self._path / kind / f"batch_{batch_id}.parquet"
+
+    def _compacted_ranges(self, kind: str) -> list[tuple[int, int, Path]]:
+        ranges = []
+        for path in (self._path / kind).glob("batches_*.parquet"):
+            first, last = path.stem.removeprefix("batches_").split("_")
+            ranges.append((int(first), int(last), path))
+        return sorted(ranges)
+
+    def _parts(self, kind: str) -> list[tuple[int, Path]]:
+        ranges = self._compacted_ranges(kind)
+        parts = []
+        for path in (self._path / kind).glob("batch_*.parquet"):
+            batch_id = int(path.stem.removeprefix("batch_"))
+            # A part file that is also in a compacted file is left over from
+            # an interrupted compaction
+            if not any(first <= batch_id <= last for first, last, _ in ranges):
+                parts.append((batch_id, path))
+        return sorted(parts)
+
+    def _legacy_files(self, kind: str) -> list[Path]:
+        return sorted(
+            self._legacy_batches_path.glob(f"batch_*/optimizer/{kind}.parquet")
+        )
+
+    def _files(self, kind: str) -> list[Path]:
+        return [
+            *(path for _, _, path in self._compacted_ranges(kind)),
+            *(path for _, path in self._parts(kind)),
+            *self._legacy_files(kind),
+        ]
+
+    def scan(self, kind: str) -> pl.LazyFrame | None:
+        files = self._files(kind)
+        if not files:
+            return None
+        return pl.concat(
+            [pl.scan_parquet(file) for file in files], how="diagonal_relaxed"
+        )
+
+    def batch_ids(self, kind: str) -> set[int]:
+        if kind not in self._batch_ids:
+            lf = self.scan(kind)
+            self._batch_ids[kind] = (
+                set()
+                if lf is None
+                else set(
+                    lf.select(pl.col("batch_id").unique())
+                    .collect()
+                    .get_column("batch_id")
+                    .to_list()
+                )
+            )
+        return self._batch_ids[kind]
+
+    def scan_batch_ids(self, kinds: Iterable[str]) -> set[int]:
+        """The ids of the batches with results of any of the given kinds."""
+        lfs = [
+            lf.select(pl.col("batch_id").cast(pl.Int64))
+            for kind in kinds
+            if (lf := self.scan(kind)) is not None
+        ]
+        if not lfs:
+            return set()
+        return set(pl.concat(lfs).unique().collect().get_column("batch_id").to_list())
+
+    def read_batches(
+        self, kind: str, batch_ids: Iterable[int]
+    ) -> dict[int, pl.DataFrame]:
+        """The results of the given batches, by batch id. Batches without
+        results of the kind are left out."""
+        batch_ids = set(batch_ids) & self.batch_ids(kind)
+        if not batch_ids:
+            return {}
+        lf = self.scan(kind)
+        assert lf is not None
+        return {
+            int(key[0]): df
+            for key, df in lf.filter(pl.col("batch_id").is_in(batch_ids))
+            .collect()
+            .partition_by("batch_id", as_dict=True)
+            .items()
+        }
+
+    def read_batch(self, kind: str, batch_id: int) -> pl.DataFrame | None:
+        if batch_id not in self.batch_ids(kind):
+            return None
+        part = self._part_path(kind, batch_id)
+        if part.exists():
+            return pl.read_parquet(part)
+        legacy = (
+            self._legacy_batches_path / f"batch_{batch_id}/optimizer/{kind}.parquet"
+        )
+        if legacy.exists():
+            return pl.read_parquet(legacy)
+        return self.read_batches(kind, [batch_id]).get(batch_id)
+
+    def save_accepted_batch_ids(self, batch_ids: Iterable[int]) -> None:
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._write_parquet_transaction(
+            self._path / "accepted_batches.parquet",
+            pl.DataFrame({"batch_id": pl.Series(sorted(batch_ids), dtype=pl.Int64)}),
+        )
+
+    def accepted_batch_ids(self) -> set[int] | None:
+        """The ids of the accepted batches, or None if they are only stored
+        per batch directory, as by earlier versions."""
+        path = self._path / "accepted_batches.parquet"
+        if path.exists():
+            return set(pl.scan_parquet(path).collect().get_column("batch_id").to_list())
+        if any(self._legacy_batches_path.glob("batch_*/optimizer/*.parquet")):
+            return None
+        # No batch is accepted before the optimization has finished
+        return set()
+
+    @staticmethod
+    def _write_parquet_transaction(path: Path, df: pl.DataFrame) -> None:
+        # Written to a temporary file first, so that a failed or killed write
+        # does not leave a half-written table behind
+        tmp_path = path.with_suffix(".tmp")
+        df.write_parquet(tmp_path)
+        tmp_path.replace(path)
+
+    def append(self, kind: str, batch_id: int, df: pl.DataFrame) -> None:
+        (self._path / kind).mkdir(parents=True, exist_ok=True)
+        self._write_parquet_transaction(self._part_path(kind, batch_id), df)
+        self._batch_ids.pop(kind, None)
+        if len(self._parts(kind)) >= self.COMPACTION_THRESHOLD:
+            self.compact(kind)
+
+    def compact(self, kind: str) -> None:
+        parts = self._parts(kind)
+        if len(parts) < 2:
+            return
+        first, last = parts[0][0], parts[-1][0]
+        compacted = self._path / kind / f"batches_{first}_{last}.parquet"
+        self._write_parquet_transaction(
+            compacted,
+            pl.concat(
+                [pl.read_parquet(path) for _, path in parts], how="diagonal_relaxed"
+            ),
+        )
+        for _, path in parts:
+            path.unlink()
+        self._batch_ids.pop(kind, None)
+
+
 class BatchStorageData:
     BATCH_DATAFRAMES: ClassVar[list[str]] = [
         "realization_controls",
@@ -61,95 +229,83 @@ class BatchStorageData:
         "perturbation_constraints",
     ]
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, tables: _ResultTables) -> None:
         self._path = path
+        self._tables = tables
 
-    @property
-    def has_data(self) -> bool:
+    def _has_any(self, df_names: Iterable[str]) -> bool:
         return any(
-            (self._path / f"{df_name}.parquet").exists()
-            for df_name in self.BATCH_DATAFRAMES
+            self.batch_id in self._tables.batch_ids(df_name) for df_name in df_names
         )
 
+    @property
+    def has_data(self) -> bool:
+        return self._has_any(self.BATCH_DATAFRAMES)
+
     @property
     def has_function_results(self) -> bool:
-        return any(
-            (self._path / f"{df_name}.parquet").exists()
-            for df_name in _FunctionResults.__annotations__
-        )
+        return self._has_any(_FunctionResults.__annotations__)
 
     @property
     def has_gradient_results(self) -> bool:
-        return any(
-            (self._path / f"{df_name}.parquet").exists()
-            for df_name in _GradientResults.__annotations__
-        )
+        return self._has_any(_GradientResults.__annotations__)
 
-    @staticmethod
-    def _read_df_if_exists(path: Path) -> pl.DataFrame | None:
-        if path.exists():
-            return pl.read_parquet(path)
-        return None
+    def _read_df(self, df_name: str) -> pl.DataFrame | None:
+        return self._tables.read_batch(df_name, self.batch_id)
 
     @property
     def realization_controls(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(self._path / "realization_controls.parquet")
+        return self._read_df("realization_controls")
 
     @property
     def batch_objectives(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(self._path / "batch_objectives.parquet")
+        return self._read_df("batch_objectives")
 
     @property
     def realization_objectives(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(self._path / "realization_objectives.parquet")
+        return self._read_df("realization_objectives")
 
     @property
     def batch_constraints(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(self._path / "batch_constraints.parquet")
+        return self._read_df("batch_constraints")
 
     @property
     def realization_constraints(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(self._path / "realization_constraints.parquet")
+        return self._read_df("realization_constraints")
 
     @property
     def batch_bound_constraint_violations(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(
-            self._path / "batch_bound_constraint_violations.parquet"
-        )
+        return self._read_df("batch_bound_constraint_violations")
 
     @property
     def batch_input_constraint_violations(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(
-            self._path / "batch_input_constraint_violations.parquet"
-        )
+        return self._read_df("batch_input_constraint_violations")
 
     @property
     def batch_output_constraint_violations(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(
-            self._path / "batch_output_constraint_violations.parquet"
-        )
+        return self._read_df("batch_output_constraint_violations")
 
     @property
     def batch_objective_gradient(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(self._path / "batch_objective_gradient.parquet")
+        return self._read_df("batch_objective_gradient")
 
     @property
     def perturbation_objectives(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(self._path / "perturbation_objectives.parquet")
+        return self._read_df("perturbation_objectives")
 
     @property
     def batch_constraint_gradient(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(self._path / "batch_constraint_gradient.parquet")
+        return self._read_df("batch_constraint_gradient")
 
     @property
     def perturbation_constraints(self) -> pl.DataFrame | None:
-        return self._read_df_if_exists(self._path / "perturbation_constraints.parquet")
+        return self._read_df("perturbation_constraints")
 
     def save_dataframes(self, dataframes: BatchDataframes) -> None:
         for df_name in self.BATCH_DATAFRAMES:
             df = dataframes.get(df_name)
             if isinstance(df, pl.DataFrame):
-                df.write_parquet(self._path / f"{df_name}.parquet")
+                self._tables.append(df_name, self.batch_id, df)
 
     @cached_property
     def is_improvement(self) -> bool:
@@ -159,12 +315,21 @@ def is_improvement(self) -> bool:
         return bool(info["is_improvement"])
 
     @cached_property
-    def batch_id(self) -> bool:
+    def batch_id(self) -> int:
         with open(self._path / "batch.json", encoding="utf-8") as f:
             info = json.load(f)
 
         return info["batch_id"]
 
+    @property
+    def evaluation_cache_statistics(self) -> dict[str, int] | None:
+        """The number of hits and misses in the evaluation cache, if it was
+        enabled for the batch."""
+        with open(self._path / "batch.json", encoding="utf-8") as f:
+            info = json.load(f)
+
+        return info.get("evaluation_cache")
+
     def write_metadata(self, is_improvement: bool) -> None:
         # Clear the cached prop for the new value to take place
         if "is_improvement" in self.__dict__:
@@ -273,11 +438,12 @@ class OptimizationStorageData:
     def __init__(self, path: Path) -> None:
         self._path = path
         self.batches: list[BatchStorageData] = []
+        self.tables = _ResultTables(path / "results", path.parent / "ensembles")
 
     @property
     def batches_with_function_results(self) -> list[FunctionBatchStorageData]:
         return [
-            FunctionBatchStorageData(b._path)
+            FunctionBatchStorageData(b._path, self.tables)
             for b in self.batches
             if b.has_function_results
         ]
@@ -285,11 +451,31 @@ def batches_with_function_results(self) -> list[FunctionBatchStorageData]:
     @property
     def batches_with_gradient_results(self) -> list[GradientBatchStorageData]:
         return [
-            GradientBatchStorageData(b._path)
+            GradientBatchStorageData(b._path, self.tables)
             for b in self.batches
             if b.has_gradient_results
         ]
 
+    @property
+    def function_batch_ids(self) -> list[int]:
+        """The ids of the batches with function results."""
+        return sorted(self.tables.scan_batch_ids(_FunctionResults.__annotations__))
+
+    @property
+    def accepted_batch_ids(self) -> list[int]:
+        """The ids of the batches accepted as improvements."""
+        accepted = self.tables.accepted_batch_ids()
+        if accepted is None:
+            accepted = {b.batch_id for b in self.batches if b.is_improvement}
+        return sorted(accepted)
+
+    def scan_results(self, df_name: str) -> pl.LazyFrame | None:
+        """
+        Lazy scan of one kind of result, e.g. realization_controls, for all
+        batches. Returns None if no batch has results of that kind.
+        """
+        return self.tables.scan(df_name)
+
     @property
     def controls(self) -> pl.DataFrame | None:
         return pl.read_parquet(self._path / "controls.parquet")
@@ -316,30 +502,27 @@ def simulation_to_model_realization_map(self, batch_id: int) -> dict[int, int]:
         """
         Mapping from simulation ID to model realization
         """
-        dummy_df = next(
-            (
-                b.realization_controls
-                for b in self.batches_with_function_results
-                if b.batch_id == batch_id
-            ),
-            None,
-        )
-
-        if dummy_df is None:
+        controls = self.scan_results("realization_controls")
+        if controls is None:
             return {}
 
-        mapping = {}
-        for d in dummy_df.select("realization", "simulation_id").to_dicts():
-            mapping[int(d["simulation_id"])] = int(d["realization"])
-
-        return mapping
+        mapping = (
+            controls.filter(pl.col("batch_id") == batch_id)
+            .select("simulation_id", "realization")
+            .collect()
+        )
+        return dict(
+            zip(
+                mapping["simulation_id"].cast(pl.Int64).to_list(),
+                mapping["realization"].cast(pl.Int64).to_list(),
+                strict=True,
+            )
+        )
 
     def read_from_experiment(self, experiment: _OptimizerOnlyExperiment) -> None:
         for ens in experiment.ensembles.values():
             self.batches.append(
-                BatchStorageData(
-                    path=ens.optimizer_mount_point,
-                )
+                BatchStorageData(path=ens.optimizer_mount_point, tables=self.tables)
             )
 
         self.batches.sort(key=lambda b: b.batch_id)
@@ -430,6 +613,14 @@ def __init__(
     def is_empty(self) -> bool:
         return not any(b.has_data for b in self.data.batches)
 
+    def compact(self) -> None:
+        """
+        Compact the results appended per batch, this is done automatically
+        once enough batches are appended.
+        """
+        for df_name in BatchStorageData.BATCH_DATAFRAMES:
+            self.data.tables.compact(df_name)
+
     @staticmethod
     def _rename_ropt_df_columns(df: pl.DataFrame) -> pl.DataFrame:
         """
@@ -906,20 +1097,25 @@ def on_batch_evaluation_finished(
         for batch_id, batch_dict in batch_dicts.items():
             target_ensemble = self._experiment.get_ensemble_by_name(f"batch_{batch_id}")
 
-            with open(
-                target_ensemble.optimizer_mount_point / "batch.json",
-                "w+",
-                encoding="utf-8",
-            ) as f:
+            batch_info_path = target_ensemble.optimizer_mount_point / "batch.json"
+            batch_info = (
+                json.loads(batch_info_path.read_text(encoding="utf-8"))
+                if batch_info_path.exists()
+                else {}
+            )
+            with open(batch_info_path, "w+", encoding="utf-8") as f:
                 json.dump(
                     {
+                        **batch_info,
                         "batch_id": batch_id,
                         "is_improvement": False,
                     },
                     f,
                 )
 
-            batch_data = BatchStorageData(path=target_ensemble.optimizer_mount_point)
+            batch_data = BatchStorageData(
+                path=target_ensemble.optimizer_mount_point, tables=self.data.tables
+            )
 
             batch_data.save_dataframes(
                 {
@@ -956,57 +1152,81 @@ def on_batch_evaluation_finished(
 
             self.data.batches.append(batch_data)
 
+    def save_evaluation_cache_statistics(
+        self, batch_id: int, hits: int, misses: int
+    ) -> None:
+        """Store how many simulations of a batch were served from the
+        evaluation cache, and how many were run."""
+        target_ensemble = self._experiment.get_ensemble_by_name(f"batch_{batch_id}")
+        batch_info_path = target_ensemble.optimizer_mount_point / "batch.json"
+        batch_info = (
+            json.loads(batch_info_path.read_text(encoding="utf-8"))
+            if batch_info_path.exists()
+            else {"batch_id": batch_id, "is_improvement": False}
+        )
+        batch_info["evaluation_cache"] = {"hits": hits, "misses": misses}
+        with open(batch_info_path, "w", encoding="utf-8") as f:
+            json.dump(batch_info, f)
+
     def on_optimization_finished(self) -> None:
         logger.debug("Storing final results Everest storage")
+        self.compact()
 
         # This a somewhat arbitrary threshold, this should be a user choice
         # during visualization:
         CONSTRAINT_TOL = 1e-6
 
-        max_total_objective = -np.inf
-        for b in self.data.batches_with_function_results:
-            total_objective = b.batch_objectives["total_objective_value"].item()
-            bound_constraint_violation = (
-                0.0
-                if b.batch_bound_constraint_violations is None
-                else (
-                    b.batch_bound_constraint_violations.drop("batch_id")
-                    .to_numpy()
-                    .min()
-                    .item()
-                )
-            )
-            input_constraint_violation = (
-                0.0
-                if b.batch_input_constraint_violations is None
-                else (
-                    b.batch_input_constraint_violations.drop("batch_id")
-                    .to_numpy()
-                    .min()
-                    .item()
-                )
-            )
-            output_constraint_violation = (
-                0.0
-                if b.batch_output_constraint_violations is None
-                else (
-                    b.batch_output_constraint_violations.drop("batch_id")
-                    .to_numpy()
-                    .min()
-                    .item()
+        batch_objectives = self.data.scan_results("batch_objectives")
+        if batch_objectives is None:
+            return
+
+        # The smallest violation of each kind of constraint, per batch:
+        batch_results = batch_objectives.select("batch_id", "total_objective_value")
+        violations = []
+        for df_name in (
+            "batch_bound_constraint_violations",
+            "batch_input_constraint_violations",
+            "batch_output_constraint_violations",
+        ):
+            lf = self.data.scan_results(df_name)
+            if lf is not None:
+                batch_results = batch_results.join(
+                    lf.select(
+                        "batch_id",
+                        pl.min_horizontal(pl.exclude("batch_id")).alias(df_name),
+                    ),
+                    on="batch_id",
+                    how="left",
                 )
+                violations.append(pl.col(df_name).fill_null(0.0))
+        if violations:
+            batch_results = batch_results.with_columns(
+                pl.max_horizontal(violations).alias("violation")
             )
+        else:
+            batch_results = batch_results.with_columns(pl.lit(0.0).alias("violation"))
+        batch_results_df = batch_results.collect()
+
+        results_by_batch = {
+            row["batch_id"]: row
+            for row in batch_results_df.select(
+                "batch_id", "total_objective_value", "violation"
+            ).iter_rows(named=True)
+        }
+
+        max_total_objective = -np.inf
+        accepted_batch_ids = []
+        for b in self.data.batches_with_function_results:
+            row = results_by_batch[b.batch_id]
+            total_objective = row["total_objective_value"]
             if (
-                max(
-                    bound_constraint_violation,
-                    input_constraint_violation,
-                    output_constraint_violation,
-                )
-                < CONSTRAINT_TOL
+                row["violation"] < CONSTRAINT_TOL
                 and total_objective > max_total_objective
             ):
                 b.write_metadata(is_improvement=True)
+                accepted_batch_ids.append(b.batch_id)
                 max_total_objective = total_objective
+        self.data.tables.save_accepted_batch_ids(accepted_batch_ids)
 
     def export_dataframes(
         self,
@@ -1058,38 +1278,50 @@ def pivot_gradient(df: pl.DataFrame) -> pl.DataFrame:
                 }
             )
 
+        # Each kind of result is read once for all batches, and split by batch
+        tables = {
+            df_name: self.data.tables.read_batches(df_name, batch_ids)
+            for df_name in BatchStorageData.BATCH_DATAFRAMES
+        }
+
         for batch in self.data.batches:
             if not batch.has_data:
                 continue
 
+            batch_dfs = {
+                df_name: dfs.get(batch.batch_id) for df_name, dfs in tables.items()
+            }
+
             try_append_perturbation_dfs(
                 batch.batch_id,
-                batch.perturbation_objectives,
-                batch.perturbation_constraints,
+                batch_dfs["perturbation_objectives"],
+                batch_dfs["perturbation_constraints"],
             )
 
             try_append_realization_dfs(
                 batch.batch_id,
-                batch.realization_objectives,
-                batch.realization_controls,
-                batch.realization_constraints,
+                batch_dfs["realization_objectives"],
+                batch_dfs["realization_controls"],
+                batch_dfs["realization_constraints"],
             )
 
-            if batch.batch_objective_gradient is not None:
+            batch_objective_gradient = batch_dfs["batch_objective_gradient"]
+            if batch_objective_gradient is not None:
                 try_append_batch_dfs(
-                    batch.batch_id, pivot_gradient(batch.batch_objective_gradient)
+                    batch.batch_id, pivot_gradient(batch_objective_gradient)
                 )
 
-            if batch.batch_constraint_gradient is not None:
+            batch_constraint_gradient = batch_dfs["batch_constraint_gradient"]
+            if batch_constraint_gradient is not None:
                 try_append_batch_dfs(
                     batch.batch_id,
-                    pivot_gradient(batch.batch_constraint_gradient),
+                    pivot_gradient(batch_constraint_gradient),
                 )
 
             try_append_batch_dfs(
                 batch.batch_id,
-                batch.batch_objectives,
-                batch.batch_constraints,
+                batch_dfs["batch_objectives"],
+                batch_dfs["batch_constraints"],
             )
 
         def _join_by_batch(
@@ -44,6 +44,11 @@ def no_jobs_file_retry(monkeypatch):
     monkeypatch.setattr(_ert.forward_model_runner.fm_dispatch, "FILE_RETRY_TIME", 0)
 
 
+@pytest.fixture(autouse=True)
+def isolated_config_cache(monkeypatch, tmp_path_factory):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+
+
 @pytest.fixture(autouse=True)
 def log_check():
     logger = logging.getLogger()
@@ -0,0 +1,404 @@
+"""Benchmarks of running whole experiments at scale.
+
+The realizations are run by a driver that simulates a cluster in the test
+process: a realization waits in the queue for a while, and its forward model
+finishes at once, writing responses copied from templates and sending the
+events a dispatcher would send. All of ert's own work is done for real, and
+the wall time and peak memory of each phase of the experiment is recorded in
+the extra info of the benchmark.
+"""
+
+import asyncio
+import functools
+import inspect
+import resource
+import shutil
+import signal
+import sys
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from textwrap import dedent
+
+import numpy as np
+import orjson
+import pytest
+import resfo
+import xtgeo
+from resdata.summary import Summary
+
+from _ert.events import (
+    ForwardModelStepChecksum,
+    ForwardModelStepRunning,
+    ForwardModelStepStart,
+    ForwardModelStepSuccess,
+    dispatcher_event_to_json,
+)
+from _ert.forward_model_runner.client import Client
+from ert.ensemble_evaluator import _ensemble, evaluator
+from ert.mode_definitions import ENSEMBLE_SMOOTHER_MODE, ES_MDA_MODE
+from ert.run_models import ensemble_smoother, multiple_data_assimilation, run_model
+from ert.scheduler import job
+from ert.scheduler.driver import SIGNAL_OFFSET
+from ert.scheduler.local_driver import LocalDriver
+from ert.storage import open_storage
+from ert.storage.local_storage import LocalStorage
+from tests.ert.ui_tests.cli.run_cli import run_cli
+
+START_DATE = datetime(2010, 1, 1)
+SUMMARY_VARIANTS = 4
+
+
+@dataclass
+class _Phase:
+    calls: int = 0
+    busy_time: float = 0.0
+    first_start: float = float("inf")
+    last_end: float = 0.0
+    peak_rss: int = 0
+
+    @property
+    def wall_time(self) -> float:
+        return max(0.0, self.last_end - self.first_start)
+
+
+class PhaseTimer:
+    """Records the calls of the functions of each phase. The wall time of a
+    phase is from the start of its first call to the end of its last, and
+    its busy time is the sum of the time of its calls, which may overlap."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, _Phase] = defaultdict(_Phase)
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start: float, end: float) -> None:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        with self._lock:
+            phase = self.phases[name]
+            phase.calls += 1
+            phase.busy_time += end - start
+            phase.first_start = min(phase.first_start, start)
+            phase.last_end = max(phase.last_end, end)
+            phase.peak_rss = max(phase.peak_rss, peak_rss)
+
+    def wrap(self, name, func):
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def timed_coroutine(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.record(name, start, time.perf_counter())
+
+            return timed_coroutine
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, start, time.perf_counter())
+
+        return timed
+
+    def report(self) -> dict[str, dict[str, float]]:
+        return {
+            name: asdict(phase) | {"wall_time": phase.wall_time}
+            for name, phase in sorted(self.phases.items())
+        }
+
+
+class SimulatedClusterDriver(LocalDriver):
+    """Runs the realizations in the test process. A realization is pending
+    for up to queue_latency seconds, and then its forward model writes the
+    responses from the templates and reports to the evaluator, as the
+    dispatcher of a real forward model would."""
+
+    def __init__(
+        self,
+        templates: Path,
+        gen_data_entries: int,
+        queue_latency: float,
+        timer: PhaseTimer,
+    ) -> None:
+        # The simulated realizations do not use the cores or memory of the machine
+        super().__init__(num_cpu=sys.maxsize, memory=sys.maxsize)
+        self._templates = templates
+        self._gen_data_entries = gen_data_entries
+        self._queue_latency = queue_latency
+        self._timer = timer
+        self._rng = np.random.default_rng(42)
+        self._client: Client | None = None
+        self._client_lock: asyncio.Lock | None = None
+
+    async def submit(self, iens, executable, /, *args, **kwargs) -> None:
+        start = time.perf_counter()
+        await super().submit(iens, executable, *args, **kwargs)
+        self._timer.record("submission", start, time.perf_counter())
+
+    async def _init(self, iens, executable, runpath, *args):
+        await asyncio.sleep(self._rng.uniform(0, self._queue_latency))
+        return iens, Path(runpath)
+
+    async def _send(self, jobs, event) -> None:
+        if self._client_lock is None:
+            self._client_lock = asyncio.Lock()
+        async with self._client_lock:
+            if self._client is None:
+                self._client = Client(
+                    jobs["dispatch_url"],
+                    token=jobs["ee_token"],
+                    dealer_name="dispatch-real-0-simulated",
+                )
+                await self._client.connect()
+            await self._client.send(dispatcher_event_to_json(event))
+
+    async def _wait(self, proc) -> int:
+        iens, runpath = proc
+        jobs = orjson.loads((runpath / "jobs.json").read_bytes())
+        step = {"ensemble": jobs["ens_id"], "real": str(iens), "fm_step": "0"}
+        await self._send(jobs, ForwardModelStepStart(**step))
+        await self._send(
+            jobs, ForwardModelStepRunning(**step, max_memory_usage=1, cpu_seconds=1)
+        )
+
+        for step_data in jobs["jobList"]:
+            (runpath / step_data["stdout"]).touch()
+            (runpath / step_data["stderr"]).touch()
+        variant = self._templates / f"variant-{iens % SUMMARY_VARIANTS}"
+        for template in variant.iterdir():
+            shutil.copyfile(template, runpath / template.name)
+        np.savetxt(
+            runpath / "response_0.out", self._rng.normal(size=self._gen_data_entries)
+        )
+
+        await self._send(jobs, ForwardModelStepSuccess(**step))
+        await self._send(
+            jobs,
+            ForwardModelStepChecksum(
+                ensemble=jobs["ens_id"], real=str(iens), checksums={str(runpath): {}}
+            ),
+        )
+        return 0
+
+    async def _kill(self, proc) -> int:
+        return signal.SIGTERM + SIGNAL_OFFSET
+
+    async def finish(self) -> None:
+        await super().finish()
+        if self._client is not None:
+            await self._client.__aexit__(None, None, None)
+            self._client = None
+
+
+@dataclass
+class ExperimentSize:
+    realizations: int
+    field_dimensions: tuple[int, int, int]
+    summary_keys: int
+    summary_steps: int
+    gen_data_entries: int
+    queue_latency: float
+
+
+def _write_summary(case: Path, size: ExperimentSize, rng) -> None:
+    summary = Summary.writer(str(case), START_DATE, 1, 1, 1)
+    keys = [f"WOPR:W{i}" for i in range(size.summary_keys)]
+    for i in range(size.summary_keys):
+        summary.add_variable("WOPR", wgname=f"W{i}")
+    for day in range(1, size.summary_steps + 1):
+        t_step = summary.add_t_step(day, sim_days=day)
+        for key, value in zip(keys, rng.uniform(size=len(keys)), strict=True):
+            t_step[key] = value
+    summary.fwrite()
+
+
+def _make_experiment(path: Path, size: ExperimentSize) -> None:
+    rng = np.random.default_rng(1234)
+    nx, ny, nz = size.field_dimensions
+    xtgeo.create_box_grid(dimension=size.field_dimensions).to_file(
+        path / "GRID.EGRID", "egrid"
+    )
+    (path / "fields").mkdir()
+    for iens in range(size.realizations):
+        resfo.write(
+            path / "fields" / f"poro_{iens}.bgrdecl",
+            [("PORO    ", rng.uniform(size=nx * ny * nz).astype(np.float32))],
+        )
+
+    templates = path / "templates"
+    for variant in range(SUMMARY_VARIANTS):
+        (templates / f"variant-{variant}").mkdir(parents=True)
+        _write_summary(templates / f"variant-{variant}" / "SIM", size, rng)
+
+    gen_obs_indices = range(0, size.gen_data_entries, 10)
+    np.savetxt(
+        templates / "gen_obs.txt",
+        np.column_stack(
+            [rng.normal(size=len(gen_obs_indices)), np.ones(len(gen_obs_indices))]
+        ),
+    )
+    observations = [
+        dedent(
+            f"""
+            GENERAL_OBSERVATION GEN_OBS {{
+                DATA = RESPONSE;
+                INDEX_LIST = {",".join(map(str, gen_obs_indices))};
+                RESTART = 0;
+                OBS_FILE = {templates / "gen_obs.txt"};
+            }};"""
+        )
+    ]
+    for i in range(size.summary_keys):
+        for day in range(1, size.summary_steps + 1, 10):
+            date = (START_DATE + timedelta(days=day)).date().isoformat()
+            observations.append(
+                f"SUMMARY_OBSERVATION WOPR_W{i}_{day} {{ VALUE = 0.5; "
+                f"ERROR = 0.1; DATE = {date}; KEY = WOPR:W{i}; }};"
+            )
+    (path / "observations").write_text("\n".join(observations), encoding="utf-8")
+
+    simulator = path / "simulator"
+    simulator.write_text("#!/bin/sh\n", encoding="utf-8")
+    simulator.chmod(0o755)
+    (path / "SIMULATOR").write_text(f"EXECUTABLE {simulator}\n", encoding="utf-8")
+    (path / "config.ert").write_text(
+        dedent(
+            f"""
+            NUM_REALIZATIONS {size.realizations}
+            QUEUE_OPTION LOCAL MAX_RUNNING {size.realizations}
+            RUNPATH simulations/realization-<IENS>/iter-<ITER>
+            ECLBASE SIM
+            GRID GRID.EGRID
+            FIELD PORO PARAMETER poro.bgrdecl INIT_FILES:fields/poro_%d.bgrdecl
+            GEN_DATA RESPONSE RESULT_FILE:response_%d.out REPORT_STEPS:0
+            SUMMARY WOPR:*
+            OBS_CONFIG observations
+            INSTALL_JOB SIMULATOR SIMULATOR
+            FORWARD_MODEL SIMULATOR
+            """
+        ),
+        encoding="utf-8",
+    )
+
+
+def _time_phases(monkeypatch, timer: PhaseTimer, path: Path, size: ExperimentSize):
+    monkeypatch.setattr(
+        evaluator,
+        "create_driver",
+        lambda _: SimulatedClusterDriver(
+            path / "templates", size.gen_data_entries, size.queue_latency, timer
+        ),
+    )
+    monkeypatch.setattr(
+        run_model,
+        "create_run_path",
+        timer.wrap("run_path_creation", run_model.create_run_path),
+    )
+    monkeypatch.setattr(
+        _ensemble.LegacyEnsemble,
+        "update_snapshot",
+        timer.wrap("event_processing", _ensemble.LegacyEnsemble.update_snapshot),
+    )
+    monkeypatch.setattr(
+        job,
+        "load_realization_parameters_and_responses",
+        timer.wrap("internalization", job.load_realization_parameters_and_responses),
+    )
+    for module in (ensemble_smoother, multiple_data_assimilation):
+        monkeypatch.setattr(
+            module, "smoother_update", timer.wrap("update", module.smoother_update)
+        )
+    for method in (
+        "_write_transaction",
+        "_to_netcdf_transaction",
+        "_to_parquet_transaction",
+    ):
+        monkeypatch.setattr(
+            LocalStorage, method, timer.wrap("storage", getattr(LocalStorage, method))
+        )
+
+
+@pytest.mark.usefixtures("use_site_configurations_with_no_queue_options")
+@pytest.mark.parametrize("mode", [ENSEMBLE_SMOOTHER_MODE, ES_MDA_MODE])
+@pytest.mark.parametrize(
+    "size",
+    [
+        pytest.param(
+            ExperimentSize(
+                realizations=10,
+                field_dimensions=(10, 10, 5),
+                summary_keys=10,
+                summary_steps=50,
+                gen_data_entries=100,
+                queue_latency=0.01,
+            ),
+            marks=pytest.mark.quick_only,
+            id="small",
+        ),
+        pytest.param(
+            ExperimentSize(
+                realizations=1000,
+                field_dimensions=(50, 50, 20),
+                summary_keys=200,
+                summary_steps=365,
+                gen_data_entries=2000,
+                queue_latency=1.0,
+            ),
+            marks=pytest.mark.slow,
+            id="large",
+        ),
+        pytest.param(
+            ExperimentSize(
+                realizations=5000,
+                field_dimensions=(50, 50, 20),
+                summary_keys=200,
+                summary_steps=365,
+                gen_data_entries=2000,
+                queue_latency=5.0,
+            ),
+            marks=pytest.mark.slow,
+            id="many_realizations",
+        ),
+    ],
+)
+def test_and_benchmark_running_an_experiment(
+    tmp_path, monkeypatch, benchmark, mode, size
+):
+    monkeypatch.chdir(tmp_path)
+    _make_experiment(tmp_path, size)
+    timer = PhaseTimer()
+    _time_phases(monkeypatch, timer, tmp_path, size)
+
+    def run_experiment():
+        run_cli(mode, "--disable-monitoring", "config.ert")
+
+    benchmark.pedantic(run_experiment, rounds=1, iterations=1)
+    benchmark.extra_info["phases"] = timer.report()
+    for name, phase in timer.report().items():
+        print(
+            f"{name}: {phase['wall_time']:.2f}s wall, {phase['busy_time']:.2f}s busy "
+            f"in {phase['calls']} calls, peak rss {phase['peak_rss'] / 1024**2:.0f} MiB"
+        )
+
+    assert {
+        "run_path_creation",
+        "submission",
+        "event_processing",
+        "internalization",
+        "update",
+        "storage",
+    } <= set(timer.phases)
+    with open_storage(tmp_path / "storage", mode="r") as storage:
+        ensembles = list(storage.ensembles)
+        assert len(ensembles) == (2 if mode == ENSEMBLE_SMOOTHER_MODE else 4)
+        for ensemble in ensembles:
+            assert ensemble.get_realization_list_with_responses() == list(
+                range(size.realizations)
+            )
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from ert.config import GenDataConfig
+
+NUM_REPORT_STEPS = 200
+NUM_VALUES = 10_000
+
+
+@pytest.mark.parametrize("file_format", ["text", "binary"])
+def test_and_benchmark_reading_gen_data_with_many_report_steps(
+    tmp_path, benchmark, file_format
+):
+    rng = np.random.default_rng(0)
+    for report_step in range(NUM_REPORT_STEPS):
+        values = rng.normal(size=NUM_VALUES)
+        if file_format == "binary":
+            np.save(tmp_path / f"rft_{report_step}.txt.npy", values)
+        else:
+            np.savetxt(tmp_path / f"rft_{report_step}.txt", values)
+    config = GenDataConfig(
+        keys=["RFT"],
+        report_steps_list=[list(range(NUM_REPORT_STEPS))],
+        input_files=["rft_%d.txt"],
+    )
+
+    data = benchmark(config.read_from_file, str(tmp_path), 0, 0)
+
+    assert len(data) == NUM_REPORT_STEPS * NUM_VALUES
+    assert data["report_step"].n_unique() == NUM_REPORT_STEPS
@@ -0,0 +1,61 @@
+import json
+import shutil
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from ert.storage.migration import to15
+from ert.storage.migration._staged import migrate_staged
+
+NUM_EXPERIMENTS = 16
+NUM_REALIZATIONS = 50
+
+
+def _create_everest_storage(path):
+    for i in range(NUM_EXPERIMENTS):
+        experiment = path / "experiments" / f"exp-{i}"
+        experiment.mkdir(parents=True)
+        (experiment / "index.json").write_text(json.dumps({"id": f"exp-id-{i}"}))
+        (experiment / "parameter.json").write_text(
+            json.dumps(
+                {
+                    "point": {
+                        "name": "point",
+                        "type": "everest_parameters",
+                        "input_keys": ["point.x", "point.y"],
+                    }
+                }
+            )
+        )
+        ensemble = path / "ensembles" / f"ens-{i}"
+        ensemble.mkdir(parents=True)
+        (ensemble / "index.json").write_text(
+            json.dumps({"experiment_id": f"exp-id-{i}"})
+        )
+        for realization in range(NUM_REALIZATIONS):
+            (ensemble / f"realization-{realization}").mkdir()
+            xr.Dataset(
+                {"values": ("names", np.array([1.0, 2.0])), "names": ["x", "y"]}
+            ).expand_dims(realizations=[realization]).to_netcdf(
+                ensemble / f"realization-{realization}" / "point.nc", engine="scipy"
+            )
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_and_benchmark_migrating_storage_with_many_experiments(
+    tmp_path, benchmark, max_workers
+):
+    template = tmp_path / "template"
+    _create_everest_storage(template)
+    storage = tmp_path / "storage"
+
+    def setup():
+        shutil.rmtree(storage, ignore_errors=True)
+        shutil.copytree(template, storage)
+        return (storage, [to15.migrate], lambda: None), {"max_workers": max_workers}
+
+    benchmark.pedantic(migrate_staged, setup=setup, rounds=3)
+
+    assert len(list(storage.glob("ensembles/*/point.parquet"))) == NUM_EXPERIMENTS
+    assert not list(storage.glob("ensembles/*/realization-*/point.nc"))
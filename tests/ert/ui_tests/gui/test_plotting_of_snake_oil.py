@@ -104,6 +104,7 @@ def plot_figure(
                         found_selected_key = True
                         if central_tab.isTabEnabled(i):
                             central_tab.setCurrentWidget(tab)
+                            qtbot.waitUntil(lambda: not plot_window.isLoadingPlotData())
                             assert (
                                 selected_key.dimensionality
                                 == tab._plotter.dimensionality
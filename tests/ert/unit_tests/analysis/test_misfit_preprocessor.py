@@ -1,7 +1,9 @@
 import numpy as np
 import pytest
 
+from ert.analysis import misfit_preprocessor
 from ert.analysis.misfit_preprocessor import (
+    cluster_responses,
     get_nr_primary_components,
     get_scaling_factor,
     main,
@@ -343,3 +345,75 @@ def test_autoscale_clusters_observations_by_correlation_pattern_ignoring_sign(
         expected_scale_factors[cluster_indices] = expected_sf
 
     np.testing.assert_allclose(scale_factors, expected_scale_factors)
+
+
+def _partition(clusters):
+    """The clusters as sets of observations, which do not depend on labels"""
+    return {frozenset(np.flatnonzero(clusters == label)) for label in set(clusters)}
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("nr_groups", [2, 4, 7])
+def test_that_low_rank_clustering_gives_the_same_clusters_as_dense_clustering(
+    seed, nr_groups, monkeypatch
+):
+    """With more observations than realizations, the observations are
+    clustered without building the correlation matrix. Observations that are
+    strongly correlated, positively or negatively, must be grouped the same
+    as when clustering on the dense correlation matrix."""
+    rng = np.random.default_rng(seed)
+    nr_realizations = 50
+    rows = []
+    for _ in range(nr_groups):
+        parameter = rng.standard_normal(nr_realizations)
+        for i in range(30):
+            sign = rng.choice([-1, 1])
+            noise = 0.3 * rng.standard_normal(nr_realizations)
+            rows.append((i + 1) * (sign * parameter + noise))
+    responses = np.array(rows).T[:, rng.permutation(len(rows))]
+
+    dense_clusters = cluster_responses(responses, nr_clusters=nr_groups)
+    monkeypatch.setattr(misfit_preprocessor, "LOW_RANK_MIN_OBSERVATIONS", 1)
+    low_rank_clusters = cluster_responses(responses, nr_clusters=nr_groups)
+
+    assert _partition(low_rank_clusters) == _partition(dense_clusters)
+    assert sorted(set(low_rank_clusters)) == list(range(1, nr_groups + 1))
+
+
+def test_that_clustering_is_the_same_on_both_sides_of_the_low_rank_threshold(
+    monkeypatch, caplog
+):
+    """The method changes when a group reaches LOW_RANK_MIN_OBSERVATIONS, which
+    must not change how the observations below the threshold are grouped."""
+    rng = np.random.default_rng(11)
+    nr_realizations, nr_groups, threshold = 50, 4, 200
+    rows = []
+    for _ in range(nr_groups):
+        parameter = rng.standard_normal(nr_realizations)
+        for i in range(threshold // nr_groups):
+            sign = rng.choice([-1, 1])
+            noise = 0.3 * rng.standard_normal(nr_realizations)
+            rows.append((i + 1) * (sign * parameter + noise))
+    responses = np.array(rows).T[:, rng.permutation(len(rows))]
+    monkeypatch.setattr(misfit_preprocessor, "LOW_RANK_MIN_OBSERVATIONS", threshold)
+
+    with caplog.at_level("INFO"):
+        below = cluster_responses(responses[:, :-1], nr_clusters=nr_groups)
+        at = cluster_responses(responses, nr_clusters=nr_groups)
+
+    assert "199 observations with hierarchical clustering" in caplog.messages[0]
+    assert "200 observations with low-rank clustering" in caplog.messages[1]
+    assert _partition(at[:-1]) == _partition(below)
+
+
+def test_that_nr_primary_components_is_the_same_for_wide_responses():
+    rng = np.random.default_rng(42)
+    responses = rng.standard_normal((20, 3)) @ rng.standard_normal((3, 500))
+    responses += 0.01 * rng.standard_normal(responses.shape)
+
+    data_matrix = responses - responses.mean(axis=0)
+    singulars = np.linalg.svd(data_matrix, compute_uv=False)
+    variance_ratio = np.cumsum(singulars**2) / np.sum(singulars**2)
+    for threshold in [0.5, 0.9, 0.95, 0.99]:
+        expected = np.searchsorted(variance_ratio, threshold, side="left") + 1
+        assert get_nr_primary_components(responses, threshold) == expected
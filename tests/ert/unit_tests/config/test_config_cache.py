@@ -0,0 +1,219 @@
+import datetime
+import json
+from pathlib import Path
+
+import pytest
+
+from ert.config import ConfigWarning, ErtConfig, _config_cache, ert_config
+from ert.config._config_cache import config_cache_directory
+from ert.config.refcase import Refcase
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    count = [0]
+    read_user_config_contents = ErtConfig._read_user_config_contents.__func__
+
+    def counting_read_user_config_contents(cls, *args, **kwargs):
+        count[0] += 1
+        return read_user_config_contents(cls, *args, **kwargs)
+
+    monkeypatch.setattr(
+        ErtConfig,
+        "_read_user_config_contents",
+        classmethod(counting_read_user_config_contents),
+    )
+    return count
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.ert").write_text(
+        "NUM_REALIZATIONS 1\nINCLUDE include.ert\n", encoding="utf-8"
+    )
+    (tmp_path / "include.ert").write_text(
+        "RUNPATH $RUNPATH_ROOT/realization-<IENS>/iter-<ITER>\n", encoding="utf-8"
+    )
+    monkeypatch.setenv("RUNPATH_ROOT", "first")
+    return "config.ert"
+
+
+def test_that_unchanged_config_is_read_from_cache(config_file, parse_count):
+    config = ErtConfig.from_file(config_file, use_cache=True)
+    cached_config = ErtConfig.from_file(config_file, use_cache=True)
+    assert parse_count[0] == 1
+    assert cached_config.runpath_config == config.runpath_config
+    assert cached_config.user_config_file == config.user_config_file
+
+
+def test_that_config_is_not_cached_without_use_cache(config_file, parse_count):
+    ErtConfig.from_file(config_file)
+    ErtConfig.from_file(config_file)
+    ErtConfig.from_file(config_file, use_cache=True)
+    assert parse_count[0] == 3
+
+
+def test_that_changing_an_included_file_invalidates_the_cache(
+    tmp_path, config_file, parse_count
+):
+    ErtConfig.from_file(config_file, use_cache=True)
+    (tmp_path / "include.ert").write_text(
+        "RUNPATH changed/realization-<IENS>/iter-<ITER>\n", encoding="utf-8"
+    )
+    config = ErtConfig.from_file(config_file, use_cache=True)
+    assert parse_count[0] == 2
+    assert "/changed/realization" in config.runpath_config.runpath_format_string
+
+
+def test_that_changing_a_referenced_environment_variable_invalidates_the_cache(
+    config_file, parse_count, monkeypatch
+):
+    ErtConfig.from_file(config_file, use_cache=True)
+    monkeypatch.setenv("UNRELATED_VARIABLE", "value")
+    ErtConfig.from_file(config_file, use_cache=True)
+    assert parse_count[0] == 1
+
+    monkeypatch.setenv("RUNPATH_ROOT", "second")
+    config = ErtConfig.from_file(config_file, use_cache=True)
+    assert parse_count[0] == 2
+    assert "/second/realization" in config.runpath_config.runpath_format_string
+
+
+def test_that_warnings_are_emitted_when_config_is_read_from_cache(
+    tmp_path, monkeypatch, parse_count
+):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.ert").write_text(
+        "NUM_REALIZATIONS 1\nDEFINE KEY value\n", encoding="utf-8"
+    )
+    for _ in range(2):
+        with pytest.warns(ConfigWarning, match="DEFINE with substitution strings"):
+            ErtConfig.from_file("config.ert", use_cache=True)
+    assert parse_count[0] == 1
+
+
+def test_that_custom_forward_model_steps_are_logged_for_a_cached_config(
+    tmp_path, config_file, parse_count, caplog
+):
+    (tmp_path / "script.sh").write_text("#!/bin/sh\n", encoding="utf-8")
+    (tmp_path / "script.sh").chmod(0o755)
+    (tmp_path / "CUSTOM_STEP").write_text("EXECUTABLE script.sh\n", encoding="utf-8")
+    with (tmp_path / "config.ert").open("a", encoding="utf-8") as fout:
+        fout.write("INSTALL_JOB custom_step CUSTOM_STEP\n")
+
+    ErtConfig.from_file(config_file, use_cache=True)
+    caplog.clear()
+    with caplog.at_level("INFO"):
+        ErtConfig.from_file(config_file, use_cache=True)
+    assert parse_count[0] == 1
+    assert (
+        "Custom forward_model_step custom_step installed as: EXECUTABLE script.sh"
+        in caplog.messages
+    )
+
+
+@pytest.fixture
+def build_count(monkeypatch):
+    count = {"refcase": 0, "observations": 0}
+    from_config_dict = Refcase.from_config_dict.__func__
+    create_observations = ert_config.create_observation_dataframes
+
+    def counting_from_config_dict(cls, *args, **kwargs):
+        count["refcase"] += 1
+        return from_config_dict(cls, *args, **kwargs)
+
+    def counting_create_observations(*args, **kwargs):
+        count["observations"] += 1
+        return create_observations(*args, **kwargs)
+
+    monkeypatch.setattr(
+        Refcase, "from_config_dict", classmethod(counting_from_config_dict)
+    )
+    monkeypatch.setattr(
+        ert_config, "create_observation_dataframes", counting_create_observations
+    )
+    return count
+
+
+def test_that_refcase_and_observations_are_read_from_cache(
+    copy_case, parse_count, build_count
+):
+    copy_case("snake_oil")
+    config = ErtConfig.from_file("snake_oil.ert", use_cache=True)
+    cached_config = ErtConfig.from_file("snake_oil.ert", use_cache=True)
+
+    assert parse_count[0] == 1
+    assert build_count == {"refcase": 1, "observations": 1}
+    assert cached_config.ensemble_config.refcase == config.ensemble_config.refcase
+    assert cached_config.observations.keys() == config.observations.keys()
+    for name, observations in config.observations.items():
+        assert cached_config.observations[name].equals(observations)
+
+
+def test_that_changing_an_observation_data_file_invalidates_the_cache(
+    copy_case, parse_count, build_count
+):
+    copy_case("snake_oil")
+    config = ErtConfig.from_file("snake_oil.ert", use_cache=True)
+    obs_file = Path("observations/wpr_diff_obs.txt")
+    obs_file.write_text(
+        obs_file.read_text(encoding="utf-8").replace("0.05", "0.06", 1),
+        encoding="utf-8",
+    )
+    changed_config = ErtConfig.from_file("snake_oil.ert", use_cache=True)
+
+    assert parse_count[0] == 2
+    assert build_count["observations"] == 2
+    assert not changed_config.observations["gen_data"].equals(
+        config.observations["gen_data"]
+    )
+
+
+def test_that_cache_entries_are_json_and_parquet(config_file):
+    ErtConfig.from_file(config_file, use_cache=True)
+    (entry,) = config_cache_directory().iterdir()
+    assert {file.suffix for file in entry.iterdir()} <= {".json", ".parquet"}
+    assert json.loads((entry / "entry.json").read_text(encoding="utf-8"))
+
+
+def test_that_a_corrupt_cache_entry_is_ignored(config_file, parse_count):
+    ErtConfig.from_file(config_file, use_cache=True)
+    (entry,) = config_cache_directory().iterdir()
+    (entry / "entry.json").write_text("{not json", encoding="utf-8")
+    config = ErtConfig.from_file(config_file, use_cache=True)
+    assert parse_count[0] == 2
+    assert "/first/realization" in config.runpath_config.runpath_format_string
+
+
+def test_that_cache_entries_without_date_do_not_expire(
+    config_file, parse_count, monkeypatch
+):
+    ErtConfig.from_file(config_file, use_cache=True)
+
+    class Tomorrow(datetime.date):
+        @classmethod
+        def today(cls):
+            return datetime.date(2100, 1, 1)
+
+    monkeypatch.setattr(_config_cache.datetime, "date", Tomorrow)
+    ErtConfig.from_file(config_file, use_cache=True)
+    assert parse_count[0] == 1
+
+
+def test_that_cache_entries_using_date_expire_the_next_day(
+    tmp_path, config_file, parse_count, monkeypatch
+):
+    (tmp_path / "include.ert").write_text(
+        "RUNPATH <DATE>/realization-<IENS>/iter-<ITER>\n", encoding="utf-8"
+    )
+    ErtConfig.from_file(config_file, use_cache=True)
+
+    class Tomorrow(datetime.date):
+        @classmethod
+        def today(cls):
+            return datetime.date(2100, 1, 1)
+
+    monkeypatch.setattr(_config_cache.datetime, "date", Tomorrow)
+    ErtConfig.from_file(config_file, use_cache=True)
+    assert parse_count[0] == 2
@@ -73,6 +73,33 @@ def test_ensemble_config_construct_refcase():
     assert ec.refcase is not None
 
 
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_refcase_values_are_only_read_for_requested_keys():
+    summary = Summary.writer("REFCASE_NAME", datetime(2014, 9, 10), 3, 3, 3)
+    summary.add_variable("FOPR", unit="SM3/DAY")
+    summary.add_variable("FGPR", unit="SM3/DAY")
+    for day in range(1, 4):
+        t_step = summary.add_t_step(day, sim_days=10 * day)
+        t_step["FOPR"] = day
+        t_step["FGPR"] = 10 * day
+    summary.fwrite()
+
+    refcase = EnsembleConfig.from_dict(
+        config_dict={ConfigKeys.REFCASE: "REFCASE_NAME"}
+    ).refcase
+    assert refcase is not None
+    assert "FOPR" in refcase
+    assert "FWPR" not in refcase
+    assert not refcase._values
+
+    refcase.load(["FGPR", "FWPR"])
+    assert list(refcase._values) == ["FGPR"]
+    assert refcase.values("FGPR").tolist() == [10.0, 20.0, 30.0]
+    assert refcase.values("FOPR").tolist() == [1.0, 2.0, 3.0]
+    with pytest.raises(KeyError):
+        refcase.values("FWPR")
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 @pytest.mark.parametrize(
     "existing_suffix, expected_suffix",
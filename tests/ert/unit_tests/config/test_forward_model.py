@@ -243,6 +243,51 @@ def test_that_substitutions_can_be_done_in_job_names():
     assert job.name == "ECLIPSE100"
 
 
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_parallel_forward_model_steps_depend_on_steps_sharing_files():
+    with ErtPluginContext() as ctx:
+        ert_config = ErtConfig.with_plugins(ctx).from_file_contents(
+            """
+            NUM_REALIZATIONS 1
+            NUM_CPU 2
+            PARALLEL_FORWARD_MODEL TRUE
+            FORWARD_MODEL COPY_FILE(<FROM>=a.txt, <TO>=b.txt)
+            FORWARD_MODEL COPY_FILE(<FROM>=c.txt, <TO>=d.txt)
+            FORWARD_MODEL COPY_FILE(<FROM>=b.csv, <TO>=e.txt)
+            """
+        )
+    assert [step.depends_on for step in ert_config.forward_model_steps] == [
+        [],
+        [],
+        [0],
+    ]
+
+    fm_json = create_forward_model_json(
+        context=ert_config.substitutions,
+        forward_model_steps=ert_config.forward_model_steps,
+        run_id=None,
+    )
+    assert fm_json["max_parallel_steps"] == 2
+    assert [step["depends_on"] for step in fm_json["jobList"]] == [[], [], [0]]
+
+
+def test_that_forward_model_steps_have_no_dependencies_by_default():
+    with ErtPluginContext() as ctx:
+        ert_config = ErtConfig.with_plugins(ctx).from_file_contents(
+            """
+            NUM_REALIZATIONS 1
+            FORWARD_MODEL COPY_FILE(<FROM>=a.txt, <TO>=b.txt)
+            """
+        )
+    fm_json = create_forward_model_json(
+        context=ert_config.substitutions,
+        forward_model_steps=ert_config.forward_model_steps,
+        run_id=None,
+    )
+    assert "max_parallel_steps" not in fm_json
+    assert "depends_on" not in fm_json["jobList"][0]
+
+
 def test_parsing_forward_model_with_double_dash_is_possible():
     """This is a regression test, making sure that we can put double dashes in strings.
     The use case is that a file name is utilized that contains two consecutive hyphens,
@@ -3,6 +3,7 @@
 from pathlib import Path
 
 import hypothesis.strategies as st
+import numpy as np
 import pytest
 from hypothesis import given
 
@@ -157,3 +158,39 @@ def test_that_read_file_does_not_raise_unexpected_exceptions_on_missing_director
             report_steps_list=[None],
             input_files=["DOES_NOT_EXIST"],
         ).read_from_file(str(tmp_path / "DOES_NOT_EXIST"), 0, 0)
+
+
+def test_that_gen_data_with_empty_lines_and_comments_is_read(tmp_path):
+    (tmp_path / "poly.out").write_text(
+        "# values\n 1.0\n\n2.5 \nnan\n", encoding="utf-8"
+    )
+    (tmp_path / "poly.out_active").write_text("1\n0\n1\n", encoding="utf-8")
+    data = GenDataConfig(
+        keys=["poly"], report_steps_list=[None], input_files=["poly.out"]
+    ).read_from_file(str(tmp_path), 0, 0)
+    assert data["values"].fill_nan(None).to_list() == [1.0, None, None]
+
+
+def test_that_binary_gen_data_is_read_instead_of_text(tmp_path):
+    np.save(tmp_path / "poly_1.out.npy", np.array([1.0, 2.0, 3.0]))
+    np.save(tmp_path / "poly_1.out_active.npy", np.array([1, 0, 1]))
+    (tmp_path / "poly_2.out").write_text("4.0\n5.0\n", encoding="utf-8")
+    data = GenDataConfig(
+        keys=["poly"], report_steps_list=[[1, 2]], input_files=["poly_%d.out"]
+    ).read_from_file(str(tmp_path), 0, 0)
+    assert data.fill_nan(None).to_dict(as_series=False) == {
+        "response_key": ["poly"] * 5,
+        "report_step": [1, 1, 1, 2, 2],
+        "index": [0, 1, 2, 0, 1],
+        "values": [1.0, None, 3.0, 4.0, 5.0],
+    }
+
+
+def test_that_binary_gen_data_older_than_text_file_is_not_read(tmp_path):
+    np.save(tmp_path / "poly.out.npy", np.array([1.0, 2.0]))
+    (tmp_path / "poly.out").write_text("3.0\n", encoding="utf-8")
+    os.utime(tmp_path / "poly.out.npy", (0, 0))
+    data = GenDataConfig(
+        keys=["poly"], report_steps_list=[None], input_files=["poly.out"]
+    ).read_from_file(str(tmp_path), 0, 0)
+    assert data["values"].to_list() == [3.0]
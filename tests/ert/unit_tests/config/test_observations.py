@@ -14,6 +14,7 @@
     ConfigWarning,
     ErtConfig,
 )
+from ert.config._create_observation_dataframes import _TimeMap
 from ert.config.parsing import parse_observations
 from ert.config.parsing.observations_parser import ObservationType
 
@@ -1701,3 +1702,26 @@ def test_ert_config_logs_observation_types_and_keywords(caplog):
         "'VALUE': 2, 'DATA': 1, 'ERROR': 2, 'RESTART': 2, 'SEGMENT': 1, 'KEY': 1"
         in caplog.text
     )
+
+
+def _find_nearest_by_scan(times, time, threshold=timedelta(seconds=30)):
+    nearest = [
+        (abs(time - t), i) for i, t in enumerate(times) if abs(time - t) < threshold
+    ]
+    return min(nearest)[1] if nearest else None
+
+
+@given(
+    st.lists(st.integers(min_value=0, max_value=300), max_size=20),
+    st.integers(min_value=-50, max_value=350),
+)
+def test_that_time_map_finds_the_same_nearest_time_as_a_scan(seconds, time_seconds):
+    start = datetime(2020, 1, 1)
+    times = [start + timedelta(seconds=s) for s in seconds]
+    time = start + timedelta(seconds=time_seconds)
+    expected = _find_nearest_by_scan(times, time)
+    if expected is None:
+        with pytest.raises(IndexError):
+            _TimeMap(times).find_nearest(time)
+    else:
+        assert _TimeMap(times).find_nearest(time) == expected
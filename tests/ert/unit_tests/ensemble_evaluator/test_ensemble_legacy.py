@@ -1,13 +1,22 @@
 import asyncio
 import os
+import signal
+from threading import Event
 from unittest.mock import AsyncMock
 
 import pytest
 
 from _ert.events import EEEvent
-from ert.ensemble_evaluator import EnsembleEvaluator, state
+from ert.config import QueueSystem
+from ert.ensemble_evaluator import (
+    EnsembleEvaluator,
+    PersistentEnsembleEvaluator,
+    state,
+)
 from ert.ensemble_evaluator.evaluator import UserCancelled
 from ert.scheduler import job
+from ert.scheduler.driver import SIGNAL_OFFSET
+from ert.scheduler.event import FinishedEvent
 from ert.scheduler.job import Job
 
 
@@ -39,6 +48,106 @@ async def test_run_legacy_ensemble(
             assert os.path.isfile(f"real_{i}/status.txt")
 
 
+@pytest.mark.integration_test
+@pytest.mark.timeout(60)
+async def test_run_legacy_ensembles_one_after_another_with_persistent_evaluator(
+    tmpdir, make_ensemble, make_ee_config, queue_config, monkeypatch
+):
+    num_reals = 2
+    # Skip waiting for stdout/err in job
+    mocked_stdouterr_parser = AsyncMock(
+        return_value=Job.DEFAULT_FILE_VERIFICATION_TIMEOUT
+    )
+    monkeypatch.setattr(job, "log_warnings_from_forward_model", mocked_stdouterr_parser)
+
+    evaluator = PersistentEnsembleEvaluator(
+        queue_config, make_ee_config(use_token=False), end_event=Event()
+    )
+    await evaluator.start()
+    try:
+        for batch in range(2):
+            batch_dir = tmpdir.mkdir(f"batch_{batch}")
+            ensemble = make_ensemble(monkeypatch, batch_dir, num_reals, 2)
+            ensemble.id_ = str(batch)
+            events: list[EEEvent] = []
+            with batch_dir.as_cwd():
+                successful_realizations = await evaluator.evaluate_ensemble(
+                    ensemble, event_handler=events.append
+                )
+
+            assert sorted(successful_realizations) == list(range(num_reals))
+            assert ensemble.status == state.ENSEMBLE_STATE_STOPPED
+            assert events
+            assert {event.ensemble for event in events} == {str(batch)}
+            for i in range(num_reals):
+                assert os.path.isfile(batch_dir / f"real_{i}" / "status.txt")
+    finally:
+        await evaluator.close()
+
+    assert all(task.done() for task in evaluator._ee_tasks)
+
+
+@pytest.mark.integration_test
+@pytest.mark.timeout(60)
+async def test_that_persistent_evaluator_runs_an_ensemble_after_a_killed_one(
+    tmpdir, make_ensemble, make_ee_config, queue_config, monkeypatch
+):
+    num_reals = 2
+    mocked_stdouterr_parser = AsyncMock(
+        return_value=Job.DEFAULT_FILE_VERIFICATION_TIMEOUT
+    )
+    monkeypatch.setattr(job, "log_warnings_from_forward_model", mocked_stdouterr_parser)
+    end_event = Event()
+    evaluator = PersistentEnsembleEvaluator(
+        queue_config, make_ee_config(use_token=False), end_event=end_event
+    )
+    await evaluator.start()
+    try:
+        killed_dir = tmpdir.mkdir("killed")
+        killed = make_ensemble(monkeypatch, killed_dir, num_reals, 2, job_sleep=40)
+        killed.id_ = "killed"
+
+        events: list[EEEvent] = []
+
+        def cancel_on_first_event(event: EEEvent) -> None:
+            if not events:
+                end_event.set()
+            events.append(event)
+
+        with killed_dir.as_cwd(), pytest.raises(UserCancelled):
+            await evaluator.evaluate_ensemble(
+                killed, event_handler=cancel_on_first_event
+            )
+        assert not end_event.is_set()
+
+        # An event of a killed realization that arrives after its ensemble
+        # is done must not be taken as an event of the next ensemble
+        evaluator._driver.event_queue.put_nowait(
+            FinishedEvent(iens=0, returncode=signal.SIGTERM + SIGNAL_OFFSET)
+        )
+
+        batch_dir = tmpdir.mkdir("batch")
+        ensemble = make_ensemble(monkeypatch, batch_dir, num_reals, 2)
+        ensemble.id_ = "batch"
+        with batch_dir.as_cwd():
+            successful_realizations = await evaluator.evaluate_ensemble(ensemble)
+        assert sorted(successful_realizations) == list(range(num_reals))
+        for i in range(num_reals):
+            assert os.path.isfile(batch_dir / f"real_{i}" / "status.txt")
+    finally:
+        await evaluator.close()
+
+
+def test_that_persistent_evaluator_only_supports_the_local_queue(
+    make_ee_config, queue_config
+):
+    queue_config = queue_config.model_copy(update={"queue_system": QueueSystem.LSF})
+    with pytest.raises(ValueError, match="only supports the local queue"):
+        PersistentEnsembleEvaluator(
+            queue_config, make_ee_config(use_token=False), end_event=Event()
+        )
+
+
 @pytest.mark.integration_test
 @pytest.mark.timeout(30)
 @pytest.mark.usefixtures("use_tmpdir")
@@ -415,8 +415,9 @@ def raises(*args, **kwargs):
 
 @pytest.mark.timeout(30)
 @pytest.mark.integration_test
+@pytest.mark.parametrize("num_concurrent_steps", [None, 2])
 async def test_fm_dispatch_sends_exited_event_with_terminated_msg_on_sigterm(
-    use_tmpdir,
+    use_tmpdir, num_concurrent_steps
 ):
     Path("dummy_executable").write_text(
         """#!/usr/bin/env python
@@ -428,18 +429,23 @@ async def test_fm_dispatch_sends_exited_event_with_terminated_msg_on_sigterm(
     executable = os.path.realpath("dummy_executable")
     os.chmod("dummy_executable", stat.S_IRWXU | stat.S_IRWXO | stat.S_IRWXG)
     async with MockZMQServer() as zmq_server:
+        step = {
+            "name": "dummy_executable",
+            "executable": executable,
+            "stdout": "dummy.stdout",
+            "stderr": "dummy.stderr",
+        }
         fm_description = {
             "ens_id": "_id_",
             "dispatch_url": zmq_server.uri,
-            "jobList": [
-                {
-                    "name": "dummy_executable",
-                    "executable": executable,
-                    "stdout": "dummy.stdout",
-                    "stderr": "dummy.stderr",
-                }
-            ],
+            "jobList": [step],
         }
+        if num_concurrent_steps is not None:
+            fm_description["max_parallel_steps"] = num_concurrent_steps
+            fm_description["jobList"] = [
+                {**step, "stdout": f"dummy.stdout.{i}", "depends_on": []}
+                for i in range(num_concurrent_steps)
+            ]
 
         Path(FORWARD_MODEL_DESCRIPTION_FILE).write_text(
             json.dumps(fm_description), encoding="utf-8"
@@ -469,24 +475,34 @@ async def test_fm_dispatch_sends_exited_event_with_terminated_msg_on_sigterm(
         )
         p = psutil.Process(fm_dispatch_process.pid)
 
-        async def wait_for_msg(msg_type):
+        def events_of_type(msg_type):
+            return [
+                event
+                for event in map(dispatcher_event_from_json, zmq_server.messages)
+                if msg_type in event.event_type
+            ]
+
+        async def wait_for_msg(msg_type, count=1):
             while True:
                 await asyncio.sleep(0.5)
-                if any(
-                    msg_type in dispatcher_event_from_json(msg).event_type
-                    for msg in zmq_server.messages
-                ):
+                if len(events_of_type(msg_type)) >= count:
                     return
 
+        num_steps = len(fm_description["jobList"])
         # wait for fm running
-        await asyncio.wait_for(wait_for_msg("forward_model_step.start"), timeout=15)
+        await asyncio.wait_for(
+            wait_for_msg("forward_model_step.start", num_steps), timeout=15
+        )
         p.terminate()
-        # wait for fm_dispatch has been terminated, and sends failure message
-        await asyncio.wait_for(wait_for_msg("forward_model_step.failure"), timeout=15)
-        assert (
-            dispatcher_event_from_json(zmq_server.messages[-1]).error_msg
-            == FORWARD_MODEL_TERMINATED_MSG
+        # wait for fm_dispatch has been terminated, and sends failure messages
+        await asyncio.wait_for(
+            wait_for_msg("forward_model_step.failure", num_steps), timeout=15
         )
+        failures = events_of_type("forward_model_step.failure")
+        assert sorted(event.fm_step for event in failures) == [
+            str(i) for i in range(num_steps)
+        ]
+        assert {event.error_msg for event in failures} == {FORWARD_MODEL_TERMINATED_MSG}
 
 
 @pytest.mark.timeout(30)
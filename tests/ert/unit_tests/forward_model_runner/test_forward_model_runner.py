@@ -1,13 +1,20 @@
+import hashlib
 import json
 import os
 import os.path
 import stat
 import textwrap
+import threading
 from pathlib import Path
 
 import pytest
 
-from _ert.forward_model_runner.reporting.message import Checksum, Exited, Start
+from _ert.forward_model_runner.reporting.message import (
+    Checksum,
+    Exited,
+    Finish,
+    Start,
+)
 from _ert.forward_model_runner.runner import ForwardModelRunner
 from ert.config import ErtConfig, ForwardModelStep
 from ert.config.ert_config import (
@@ -119,6 +126,22 @@ def test_when_forward_model_contains_multiple_steps_just_one_checksum_status_is_
     assert len(statuses[0].data) == 5
 
 
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_checksum_contains_md5sum_size_and_mtime_of_manifest_files():
+    Path("output").write_text("content", encoding="utf-8")
+    Path("manifest.json").write_text(json.dumps({"file_1": "output"}), encoding="utf-8")
+
+    fmr = ForwardModelRunner(create_jobs_json([]))
+
+    checksum_msg = [s for s in list(fmr.run([])) if isinstance(s, Checksum)]
+    assert len(checksum_msg) == 1
+    info = checksum_msg[0].data["file_1"]
+    file_stat = Path("output").stat()
+    assert info["md5sum"] == hashlib.md5(b"content").hexdigest()
+    assert info["size"] == file_stat.st_size
+    assert info["mtime"] == file_stat.st_mtime
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 def test_when_manifest_file_is_not_created_by_fm_runner_checksum_contains_error():
     fm_step_list = []
@@ -175,6 +198,97 @@ def test_run_multiple_fail_only_runs_one():
         assert status.exit_code == i + 1
 
 
+def _wait_for_file_step(name, touch, wait_for, depends_on):
+    return {
+        "name": name,
+        "executable": "/bin/sh",
+        "argList": [
+            "-c",
+            f"touch {touch}; for i in $(seq 100); do "
+            f"[ -f {wait_for} ] && exit 0; sleep 0.1; done; exit 1",
+        ],
+        "depends_on": depends_on,
+    }
+
+
+@pytest.mark.timeout(30)
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_independent_steps_run_concurrently():
+    fm_step_list = [
+        _wait_for_file_step("first", "first_started", "second_started", []),
+        _wait_for_file_step("second", "second_started", "first_started", []),
+        _wait_for_file_step("third", "third_started", "first_started", [0, 1]),
+    ]
+
+    fmr = ForwardModelRunner({"jobList": fm_step_list, "max_parallel_steps": 2})
+    statuses = [s for s in fmr.run([]) if isinstance(s, Start | Exited)]
+
+    assert all(s.success() for s in statuses)
+    assert [(type(s), s.step.name()) for s in statuses][:2] == [
+        (Start, "first"),
+        (Start, "second"),
+    ]
+    assert [(type(s), s.step.name()) for s in statuses][-2:] == [
+        (Start, "third"),
+        (Exited, "third"),
+    ]
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_steps_depending_on_a_failed_step_are_not_started():
+    fm_step_list = [
+        {
+            "name": "failing",
+            "executable": "/bin/sh",
+            "argList": ["-c", "exit 1"],
+            "depends_on": [],
+        },
+        {
+            "name": "dependent",
+            "executable": "/bin/sh",
+            "argList": ["-c", "touch dependent_started"],
+            "depends_on": [0],
+        },
+    ]
+
+    fmr = ForwardModelRunner(create_jobs_json(fm_step_list))
+    statuses = list(fmr.run([]))
+
+    assert not statuses[-1].success()
+    assert "dependent" not in [
+        s.step.name() for s in statuses if isinstance(s, Start | Exited)
+    ]
+    assert not Path("dependent_started").exists()
+
+
+@pytest.mark.timeout(30)
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_running_steps_are_killed_when_a_concurrent_step_fails():
+    fm_step_list = [
+        {
+            "name": "sleeping",
+            "executable": "/bin/sh",
+            "argList": ["-c", "sleep 60; touch sleeping_done"],
+            "depends_on": [],
+        },
+        {
+            "name": "failing",
+            "executable": "/bin/sh",
+            "argList": ["-c", "sleep 0.5; exit 1"],
+            "depends_on": [],
+        },
+    ]
+
+    fmr = ForwardModelRunner({"jobList": fm_step_list, "max_parallel_steps": 2})
+    statuses = list(fmr.run([]))
+
+    assert isinstance(statuses[-1], Finish)
+    assert not statuses[-1].success()
+    assert [s.step.name() for s in statuses if isinstance(s, Exited)] == ["failing"]
+    assert not fmr._currently_running_steps
+    assert all(not thread.name.startswith("step-") for thread in threading.enumerate())
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 def test_env_var_available_inside_step_context():
     Path("run_me.py").write_text(
@@ -4,10 +4,12 @@
 import stat
 import sys
 import textwrap
+import time
 from dataclasses import dataclass
 from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
+from psutil import TimeoutExpired
 
 from _ert.forward_model_runner.forward_model_step import (
     ForwardModelStep,
@@ -40,6 +42,39 @@ def test_run_with_process_failing(mock_process, mock_popen, mock_check_executabl
         next(run)
 
 
+@patch("_ert.forward_model_runner.forward_model_step.create_process_tree_sampler")
+@patch("_ert.forward_model_runner.forward_model_step.check_executable")
+@patch("_ert.forward_model_runner.forward_model_step.Popen")
+@patch("_ert.forward_model_runner.forward_model_step.Process")
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_process_is_waited_on_every_poll_period_while_memory_is_polled_less(
+    mock_process, mock_popen, mock_check_executable, mock_sampler
+):
+    fmstep = ForwardModelStep({}, 0)
+    fmstep.MEMORY_POLL_PERIOD = 0.05
+    mock_check_executable.return_value = ""
+    mock_process.return_value.pid = 1
+    mock_sampler.return_value.sample.return_value = (100, {}, 0, {1})
+    wait_timeouts = []
+
+    def wait(timeout):
+        wait_timeouts.append(timeout)
+        if len(wait_timeouts) == 12:
+            return 0
+        time.sleep(timeout)
+        raise TimeoutExpired(timeout)
+
+    mock_process.return_value.wait.side_effect = wait
+
+    messages = list(fmstep.run())
+
+    assert wait_timeouts == [0.05] * 12
+    nr_memory_polls = len([m for m in messages if isinstance(m, Running)])
+    assert 1 <= nr_memory_polls < 11
+    assert isinstance(messages[-1], Exited)
+    assert messages[-1].exit_code == 0
+
+
 @pytest.mark.integration_test
 @pytest.mark.flaky(reruns=5)
 @pytest.mark.usefixtures("use_tmpdir")
@@ -0,0 +1,87 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from _ert.forward_model_runner.forward_model_step import ForwardModelStep
+from _ert.forward_model_runner.process_tree import (
+    PAGE_SIZE,
+    CgroupSampler,
+    ProcfsSampler,
+    _parse_stat,
+)
+
+
+def test_that_stat_is_parsed_with_spaces_and_parentheses_in_process_name():
+    stat = "123 (my (odd) name) S 42 " + " ".join(str(value) for value in range(5, 53))
+    ppid, _, rss = _parse_stat(stat)
+    assert ppid == 42
+    assert rss == 24 * PAGE_SIZE
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Requires /proc")
+def test_that_procfs_sampler_finds_descendants_of_process():
+    process = subprocess.Popen(["/bin/sh", "-c", "sleep 10 & sleep 10 & wait"])
+    try:
+        sampler = ProcfsSampler(process.pid)
+        pids: set[int] = set()
+        for _ in range(50):
+            memory_rss, cpu_seconds, oom_score, pids = sampler.sample()
+            if len(pids) == 2:
+                break
+            time.sleep(0.1)
+        assert len(pids) == 2
+        assert process.pid not in pids
+        assert memory_rss > 0
+        assert set(cpu_seconds) == {str(pid) for pid in pids | {process.pid}}
+        assert oom_score is not None
+        sampler.close()
+    finally:
+        process.kill()
+        process.wait()
+
+
+def test_that_cgroup_sampler_reads_memory_and_cpu_of_cgroup(tmp_path):
+    (tmp_path / "memory.stat").write_text(
+        "anon 1000\nfile 5000\nfile_mapped 200\n", encoding="utf-8"
+    )
+    (tmp_path / "cpu.stat").write_text(
+        "usage_usec 3000000\nuser_usec 2500000\nsystem_usec 500000\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "cgroup.procs").write_text(f"{os.getpid()}\n", encoding="utf-8")
+
+    sampler = CgroupSampler(tmp_path)
+    memory_rss, cpu_seconds, _, pids = sampler.sample()
+    sampler.close()
+
+    assert memory_rss == 1200
+    assert cpu_seconds == {"cgroup": 2.5}
+    assert pids == {os.getpid()}
+
+
+@pytest.mark.parametrize(
+    "previous_rss, rss, same_processes, expected_poll_period",
+    [
+        (1000, 1010, True, 2),
+        (1000, 2000, True, 1),
+        (1000, 1000, False, 1),
+    ],
+)
+def test_that_poll_period_increases_while_readings_are_stable(
+    previous_rss, rss, same_processes, expected_poll_period
+):
+    fm_step = ForwardModelStep({}, 0)
+    fm_step.MEMORY_POLL_PERIOD = 1
+    assert (
+        fm_step._next_poll_period(1, previous_rss, rss, same_processes)
+        == expected_poll_period
+    )
+
+
+def test_that_poll_period_is_bounded():
+    fm_step = ForwardModelStep({}, 0)
+    fm_step.MEMORY_POLL_PERIOD = 1
+    assert fm_step._next_poll_period(4, 1000, 1000, True) == 4
@@ -5,7 +5,7 @@
 from ert.storage.local_ensemble import _Index as _EnsembleIndex
 from ert.storage.local_experiment import LocalExperiment
 from ert.storage.local_experiment import _Index as _ExperimentIndex
-from ert.storage.local_storage import LocalStorage
+from ert.storage.local_storage import LocalStorage, _Snapshot
 from ert.storage.realization_storage_state import RealizationStorageState
 
 REALIZATION_FINISHED_SUCCESSFULLY = {
@@ -49,8 +49,7 @@ def relative_weights(self) -> str:
 
 class MockStorage(LocalStorage):
     def __init__(self) -> None:
-        self._ensembles = {}
-        self._experiments = {}
+        self._snapshot = _Snapshot(ensemble_ids=set())
 
     def _setup_mocked_run(
         self, ensemble_name, experiment_name, ensemble_states
@@ -62,5 +61,5 @@ def _setup_mocked_run(
             storage_states=ensemble_states,
             storage=self,
         )
-        self._ensembles[mock_ensemble2.id] = mock_ensemble2
-        self._experiments[mock_experiment.id] = mock_experiment
+        self._snapshot.ensembles[mock_ensemble2.id] = mock_ensemble2
+        self._snapshot.experiments[mock_experiment.id] = mock_experiment
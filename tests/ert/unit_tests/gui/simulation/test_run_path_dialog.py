@@ -85,7 +85,10 @@ def test_run_path_deleted_error(
     QTimer.singleShot(
         1000, lambda: handle_run_path_dialog(gui, qtbot, expect_error=True)
     )
-    with patch("shutil.rmtree", side_effect=PermissionError("Not allowed!")):
+    with (
+        patch("shutil.rmtree", side_effect=PermissionError("Not allowed!")),
+        patch("pathlib.Path.rename", side_effect=PermissionError("Not allowed!")),
+    ):
         qtbot.mouseClick(run_experiment, Qt.MouseButton.LeftButton)
 
         qtbot.waitUntil(lambda: gui.findChild(RunDialog) is not None)
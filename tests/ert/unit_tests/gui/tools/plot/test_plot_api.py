@@ -254,6 +254,7 @@ def test_plot_api_handles_urlescape(api_and_storage):
         df,
         0,
     )
+    api.refresh()
     assert api.data_for_response(str(ensemble.id), key).to_csv() == dedent(
         """\
         Realization,2024-10-04
@@ -270,6 +271,60 @@ def test_plot_api_handles_urlescape(api_and_storage):
     )
 
 
+def test_that_plot_api_caches_data_until_refreshed_after_the_ensemble_changes(
+    api_and_storage, mocker
+):
+    api, storage = api_and_storage
+    key = "FOPR"
+    experiment = storage.create_experiment(
+        responses=[
+            SummaryConfig(
+                name="summary",
+                input_files=["CASE.UNSMRY", "CASE.SMSPEC"],
+                keys=[key],
+            )
+        ],
+    )
+    ensemble = experiment.create_ensemble(ensemble_size=2, name="ensemble")
+
+    def save_response(realization):
+        ensemble.save_response(
+            "summary",
+            pl.DataFrame(
+                {
+                    "response_key": [key],
+                    "time": pl.Series([datetime(2024, 10, 4)]).dt.cast_time_unit("ms"),
+                    "values": pl.Series([float(realization)], dtype=pl.Float32),
+                }
+            ),
+            realization,
+        )
+
+    save_response(0)
+    fetch = mocker.spy(api, "_fetch_data_for_response")
+    scan = mocker.spy(api, "_scan_ensemble_state")
+    first = api.data_for_response(str(ensemble.id), key)
+    first.iloc[0, 0] = 100.0
+    second = api.data_for_response(str(ensemble.id), key)
+    assert fetch.call_count == 1
+    assert scan.call_count == 1
+    assert second.to_numpy().tolist() == [[0.0]]
+
+    save_response(1)
+    assert api.data_for_response(str(ensemble.id), key).to_numpy().tolist() == [[0.0]]
+    api.refresh()
+    assert api.data_for_response(str(ensemble.id), key).to_numpy().tolist() == [
+        [0.0],
+        [1.0],
+    ]
+    assert fetch.call_count == 2
+    assert scan.call_count == 2
+
+    api.refresh()
+    api.data_for_response(str(ensemble.id), key)
+    assert fetch.call_count == 2
+
+
 def test_plot_api_handles_empty_gen_kw(api_and_storage):
     api, storage = api_and_storage
     key = "gen_kw"
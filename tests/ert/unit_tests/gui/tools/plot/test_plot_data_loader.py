@@ -0,0 +1,60 @@
+from ert.gui.tools.plot.plot_data_loader import PlotDataLoader
+
+
+def _key_defs(api):
+    return {key_def.key: key_def for key_def in api.responses_api_key_defs}
+
+
+def _ensembles(api):
+    return [e for e in api.get_all_ensembles() if e.name == "default_0"]
+
+
+def test_that_plot_data_is_loaded_in_the_background(api, qtbot):
+    loader = PlotDataLoader(api)
+    ensembles = _ensembles(api)
+    with qtbot.waitSignal(loader.dataLoaded) as blocker:
+        generation = loader.load(_key_defs(api)["FOPR"], ensembles, None)
+
+    assert blocker.args == [generation]
+    plot_data = loader.result(generation)
+    assert plot_data is not None
+    assert plot_data.errors == []
+    assert list(plot_data.ensemble_to_data_map) == ensembles
+    assert plot_data.observations is not None
+    loader.shutdown()
+
+
+def test_that_the_data_of_neighbouring_keys_is_prefetched(api, qtbot, mocker):
+    loader = PlotDataLoader(api)
+    data_for_response = mocker.spy(api, "data_for_response")
+    key_defs = _key_defs(api)
+    ensembles = _ensembles(api)
+    with qtbot.waitSignal(loader.dataLoaded):
+        loader.load(key_defs["FOPR"], ensembles, None, [key_defs["BPR:1,3,8"]])
+    qtbot.waitUntil(lambda: data_for_response.call_count == 2)
+
+    with qtbot.waitSignal(loader.dataLoaded):
+        generation = loader.load(
+            key_defs["BPR:1,3,8"], ensembles, None, [key_defs["FOPR"]]
+        )
+
+    assert data_for_response.call_count == 2
+    plot_data = loader.result(generation)
+    assert plot_data is not None
+    assert list(plot_data.ensemble_to_data_map) == ensembles
+    loader.shutdown()
+
+
+def test_that_a_new_request_makes_the_previous_one_stale(api, qtbot):
+    loader = PlotDataLoader(api)
+    key_defs = _key_defs(api)
+    ensembles = _ensembles(api)
+    first = loader.load(key_defs["FOPR"], ensembles, None)
+    with qtbot.waitSignal(
+        loader.dataLoaded, check_params_cb=lambda generation: generation != first
+    ):
+        second = loader.load(key_defs["BPR:1,3,8"], ensembles, None)
+
+    assert loader.result(first) is None
+    assert loader.result(second) is not None
+    loader.shutdown()
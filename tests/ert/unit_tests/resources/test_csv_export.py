@@ -1,7 +1,10 @@
 import json
+from pathlib import Path
 
 import polars as pl
+import pytest
 
+from ert.plugins.hook_implementations.workflows import csv_export
 from ert.plugins.hook_implementations.workflows.csv_export import CSVExportJob
 from ert.storage import open_storage
 from tests.ert.performance_tests.test_obs_and_responses_performance import (
@@ -9,7 +12,8 @@
 )
 
 
-def test_that_csv_export_matches_snapshot(monkeypatch, tmp_path, snapshot):
+@pytest.fixture
+def ensemble_with_responses(monkeypatch, tmp_path):
     monkeypatch.chdir(tmp_path)
     num_realizations = 3
     info = create_experiment_args(
@@ -42,12 +46,44 @@ def test_that_csv_export_matches_snapshot(monkeypatch, tmp_path, snapshot):
             ens.save_response("gen_data", info.gen_data_responses.clone(), real)
 
         ens.save_parameters(dataset=info.genkw_data)
-        output_file = "the_export.csv"
-        ensemble_list_json = json.dumps([str(ens.id)])
-        CSVExportJob().run(storage, [output_file, ensemble_list_json])
+        yield storage, ens
 
-        df = pl.read_csv(output_file).with_columns(pl.col(pl.Float64).round(2))
 
-        snapshot.assert_match(
-            df.write_csv(include_header=True), "csv_export_result.csv"
-        )
+def test_that_csv_export_matches_snapshot(ensemble_with_responses, snapshot):
+    storage, ens = ensemble_with_responses
+    output_file = "the_export.csv"
+    ensemble_list_json = json.dumps([str(ens.id)])
+    CSVExportJob().run(storage, [output_file, ensemble_list_json])
+
+    df = pl.read_csv(output_file).with_columns(pl.col(pl.Float64).round(2))
+
+    snapshot.assert_match(df.write_csv(include_header=True), "csv_export_result.csv")
+
+
+def test_that_csv_export_does_not_depend_on_batch_size(
+    ensemble_with_responses, monkeypatch
+):
+    storage, ens = ensemble_with_responses
+    ensemble_list_json = json.dumps([str(ens.id)])
+    CSVExportJob().run(storage, ["all_at_once.csv", ensemble_list_json])
+    monkeypatch.setattr(csv_export, "REALIZATIONS_PER_BATCH", 1)
+    CSVExportJob().run(storage, ["one_by_one.csv", ensemble_list_json])
+
+    assert Path("all_at_once.csv").read_text(encoding="utf-8") == Path(
+        "one_by_one.csv"
+    ).read_text(encoding="utf-8")
+
+
+def test_that_csv_export_writes_parquet_with_the_same_columns(
+    ensemble_with_responses,
+):
+    storage, ens = ensemble_with_responses
+    ensemble_list_json = json.dumps([str(ens.id)])
+    CSVExportJob().run(storage, ["the_export.csv", ensemble_list_json])
+    CSVExportJob().run(storage, ["the_export.parquet", ensemble_list_json])
+
+    from_csv = pl.read_csv("the_export.csv", try_parse_dates=True)
+    from_parquet = pl.read_parquet("the_export.parquet")
+    assert from_parquet.columns == from_csv.columns
+    assert from_parquet.height == from_csv.height == 9
+    assert from_parquet["Date"].dt.date().to_list() == from_csv["Date"].to_list()
@@ -0,0 +1,80 @@
+import numpy as np
+import polars as pl
+import pytest
+
+from ert.config import EverestObjectivesConfig
+from ert.run_models.everest_run_model import (
+    _evaluation_cache_keys,
+    _load_batch_responses,
+)
+from ert.storage import open_storage
+
+
+@pytest.fixture
+def ensemble_with_objectives(tmp_path):
+    names = ["distance", "cost"]
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            responses=[EverestObjectivesConfig(keys=names, input_files=names)]
+        )
+        ensemble = storage.create_ensemble(
+            experiment, ensemble_size=4, iteration=0, name="batch_0"
+        )
+        for realization in [0, 1, 3]:
+            ensemble.save_response(
+                "everest_objectives",
+                pl.DataFrame(
+                    {
+                        "response_key": names,
+                        "values": pl.Series(
+                            [10.0 * realization, -float(realization)],
+                            dtype=pl.Float32,
+                        ),
+                    }
+                ),
+                realization,
+            )
+        yield ensemble
+
+
+def test_that_batch_responses_are_loaded_in_the_order_of_the_names(
+    ensemble_with_objectives,
+):
+    objectives = _load_batch_responses(
+        ensemble_with_objectives,
+        "everest_objectives",
+        ["cost", "distance"],
+        [True, True, False, True],
+    )
+    np.testing.assert_array_equal(
+        objectives,
+        [[0.0, 0.0], [-1.0, 10.0], [np.nan, np.nan], [-3.0, 30.0]],
+    )
+
+
+def test_that_batch_responses_of_failed_realizations_are_nan(
+    ensemble_with_objectives,
+):
+    objectives = _load_batch_responses(
+        ensemble_with_objectives,
+        "everest_objectives",
+        ["distance", "cost"],
+        [False, True, False, False],
+    )
+    assert np.isnan(objectives[[0, 2, 3]]).all()
+    np.testing.assert_array_equal(objectives[1], [10.0, -1.0])
+
+
+def test_that_evaluation_cache_keys_identify_controls_and_model_realization():
+    controls = np.array(
+        [
+            [0.1, 0.0],
+            [0.1 + 1e-13, -0.0],
+            [0.1, 0.0],
+            [0.1, 0.2],
+        ]
+    )
+    keys = _evaluation_cache_keys(controls, [0, 0, 1, 0], "fingerprint")
+    assert keys[0] == keys[1]
+    assert len(set(keys)) == 3
+    assert _evaluation_cache_keys(controls[:1], [0], "other") != keys[:1]
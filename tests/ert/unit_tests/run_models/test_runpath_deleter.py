@@ -0,0 +1,82 @@
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from ert.run_models._runpath_deleter import TRASH_DIRECTORY, RunpathDeleter
+
+
+def _create_run_paths(root: Path, num_realizations: int) -> list[Path]:
+    run_paths = []
+    for iens in range(num_realizations):
+        run_path = root / f"realization-{iens}" / "iter-0"
+        (run_path / "output").mkdir(parents=True)
+        (run_path / "output" / "result.txt").write_text("1", encoding="utf-8")
+        run_paths.append(run_path)
+    return run_paths
+
+
+def test_that_run_paths_are_moved_to_trash_and_deleted(tmp_path):
+    run_paths = _create_run_paths(tmp_path, 3)
+    deleter = RunpathDeleter()
+
+    deleter.delete(run_paths)
+    assert not any(run_path.exists() for run_path in run_paths)
+    assert all(run_path.parent.exists() for run_path in run_paths)
+
+    deleter.shutdown()
+    assert not (tmp_path / TRASH_DIRECTORY).exists()
+
+
+def test_that_run_paths_left_in_trash_are_deleted(tmp_path):
+    leftover = tmp_path / TRASH_DIRECTORY / "iter-0-from-crashed-run"
+    leftover.mkdir(parents=True)
+    (leftover / "result.txt").write_text("1", encoding="utf-8")
+    run_paths = _create_run_paths(tmp_path, 2)
+
+    deleter = RunpathDeleter()
+    deleter.delete(run_paths)
+    deleter.shutdown()
+
+    assert not leftover.exists()
+    assert not (tmp_path / TRASH_DIRECTORY).exists()
+
+
+def test_that_delete_blocks_when_too_many_deletions_are_pending(tmp_path, monkeypatch):
+    run_paths = _create_run_paths(tmp_path, 2)
+    release = threading.Event()
+    rmtree = shutil.rmtree
+
+    def blocking_rmtree(*args, **kwargs):
+        release.wait()
+        rmtree(*args, **kwargs)
+
+    monkeypatch.setattr(shutil, "rmtree", blocking_rmtree)
+    deleter = RunpathDeleter(max_pending=1)
+    delete_thread = threading.Thread(target=deleter.delete, args=(run_paths,))
+    delete_thread.start()
+    try:
+        delete_thread.join(timeout=0.5)
+        assert delete_thread.is_alive()
+        assert not run_paths[0].exists()
+        assert run_paths[1].exists()
+    finally:
+        release.set()
+        delete_thread.join()
+    deleter.shutdown()
+    assert not any(run_path.exists() for run_path in run_paths)
+
+
+def test_that_delete_raises_when_a_run_path_can_not_be_moved(tmp_path, monkeypatch):
+    run_paths = _create_run_paths(tmp_path, 1)
+
+    def failing_rename(*args, **kwargs):
+        raise PermissionError("Not allowed!")
+
+    monkeypatch.setattr(Path, "rename", failing_rename)
+    deleter = RunpathDeleter()
+    with pytest.raises(PermissionError, match="Not allowed!"):
+        deleter.delete(run_paths)
+    deleter.shutdown()
+    assert (run_paths[0] / "output" / "result.txt").exists()
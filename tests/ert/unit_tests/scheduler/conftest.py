@@ -14,7 +14,8 @@
 
 class MockDriver(LocalDriver):
     def __init__(self, init=None, wait=None, kill=None) -> None:
-        super().__init__()
+        # The mocked realizations do not use the cores or memory of the machine
+        super().__init__(num_cpu=sys.maxsize, memory=sys.maxsize)
         self._mock_init = init
         self._mock_wait = wait
         self._mock_kill = kill
@@ -13,7 +13,7 @@
 from lxml import etree
 
 import ert
-from ert.config import ForwardModelStep
+from ert.config import ChecksumVerification, ForwardModelStep
 from ert.ensemble_evaluator import Realization
 from ert.run_arg import RunArg
 from ert.run_models.run_model import captured_logs
@@ -21,6 +21,7 @@
 from ert.scheduler.job import (
     Job,
     JobState,
+    _lines_with_warnings,
     log_info_from_exit_file,
     log_warnings_from_forward_model,
 )
@@ -34,6 +35,9 @@ def create_scheduler():
     sch._events = asyncio.Queue()
     sch.driver = AsyncMock()
     sch._manifest_queue = None
+    sch.checksum_verification = ChecksumVerification.MD5
+    sch.checksum_verification_time = 0.0
+    sch.checksum_verified_files = 0
     sch._cancelled = False
     sch._cancelled_by_evaluator = False
     sch.schedule_kill = lambda real: sch.driver.kill([real])
@@ -346,6 +350,48 @@ async def test_when_checksums_do_not_match_a_warning_is_logged(
     assert f"File {file_path} checksum verification failed." in log_msgs
 
 
+@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.parametrize(
+    "size_and_mtime_matches, expected_log_message",
+    [
+        (True, "File {file_path} checksum successful."),
+        (False, "File {file_path} checksum verification failed."),
+    ],
+)
+@pytest.mark.asyncio
+async def test_that_size_and_mtime_are_compared_instead_of_checksum(
+    realization: Realization, size_and_mtime_matches, expected_log_message, caplog
+):
+    file_path = "output_file"
+    Path(file_path).write_text("test", encoding="utf-8")
+    stat = Path(file_path).stat()
+    scheduler = create_scheduler()
+    scheduler._manifest_queue = asyncio.Queue()
+    scheduler.checksum_verification = ChecksumVerification.SIZE_MTIME
+    scheduler.checksum = {
+        "test_runpath": {
+            "file": {
+                "path": file_path,
+                "md5sum": "not_compared",
+                "size": stat.st_size if size_and_mtime_matches else 0,
+                "mtime": stat.st_mtime,
+            }
+        }
+    }
+
+    job = Job(scheduler, realization)
+    with caplog.at_level(logging.DEBUG):
+        job_run_task = asyncio.create_task(
+            job.run(asyncio.Semaphore(), asyncio.Lock(), asyncio.Lock(), max_submit=1)
+        )
+        job.started.set()
+        job.returncode.set_result(0)
+        await job_run_task
+
+    assert expected_log_message.format(file_path=file_path) in caplog.messages
+    assert scheduler.checksum_verified_files == 1
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 @pytest.mark.asyncio
 async def test_when_no_checksum_info_is_received_a_warning_is_logged(
@@ -561,6 +607,27 @@ async def test_deduplication_of_repeated_warnings_from_forward_model(
     assert caplog.text.count(emitted_warning_str) == 1
 
 
+def test_that_warnings_are_found_across_chunk_boundaries(tmp_path, monkeypatch):
+    monkeypatch.setattr("ert.scheduler.job.WARNING_SCAN_CHUNK_SIZE", 8)
+    stdout = tmp_path / "foo.stdout.0"
+    stdout.write_bytes(
+        b"some output\r\nUserWarning: no metadata\r\nmore output\n"
+        b"2025-02-12 - ERROR - failed"
+    )
+    assert _lines_with_warnings(stdout) == [
+        "UserWarning: no metadata",
+        "2025-02-12 - ERROR - failed",
+    ]
+
+
+def test_that_only_the_end_of_large_files_is_scanned_for_warnings(tmp_path):
+    stdout = tmp_path / "foo.stdout.0"
+    stdout.write_text(
+        "Warning: early\n" + "output\n" * 100 + "Warning: late\n", encoding="utf-8"
+    )
+    assert _lines_with_warnings(stdout, max_bytes=100) == ["Warning: late"]
+
+
 async def test_log_warnings_from_forward_model_can_detect_files_being_created_after_delay(  # noqa
     realization, mocker, tmpdir
 ):
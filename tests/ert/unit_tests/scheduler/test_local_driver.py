@@ -37,7 +37,7 @@ async def test_file_not_found():
 
 @pytest.mark.timeout(5)
 async def test_kill_while_running():
-    driver = LocalDriver()
+    driver = LocalDriver(num_cpu=2)
 
     await driver.submit(42, "/usr/bin/env", "sleep", "10")
     await driver.submit(43, "/usr/bin/env", "sleep", "10")
@@ -71,6 +71,76 @@ async def test_kill_before_running(sleep_before_killing):
     )
 
 
+@pytest.mark.timeout(10)
+async def test_that_realizations_wait_for_the_cores_they_need():
+    driver = LocalDriver(num_cpu=3)
+
+    await driver.submit(0, "/usr/bin/env", "sleep", "0.5", num_cpu=2)
+    await driver.submit(1, "/usr/bin/env", "true", num_cpu=2)
+    assert await driver.event_queue.get() == StartedEvent(iens=0)
+    assert await driver.event_queue.get() == FinishedEvent(iens=0, returncode=0)
+    assert await driver.event_queue.get() == StartedEvent(iens=1)
+    assert await driver.event_queue.get() == FinishedEvent(iens=1, returncode=0)
+
+
+@pytest.mark.timeout(10)
+async def test_that_realizations_wait_for_the_memory_they_need():
+    driver = LocalDriver(num_cpu=4, memory=1000)
+
+    await driver.submit(0, "/usr/bin/env", "sleep", "0.5", realization_memory=600)
+    await driver.submit(1, "/usr/bin/env", "true", realization_memory=600)
+    assert await driver.event_queue.get() == StartedEvent(iens=0)
+    assert await driver.event_queue.get() == FinishedEvent(iens=0, returncode=0)
+    assert await driver.event_queue.get() == StartedEvent(iens=1)
+    assert await driver.event_queue.get() == FinishedEvent(iens=1, returncode=0)
+
+
+@pytest.mark.timeout(10)
+async def test_that_realizations_that_fit_are_not_held_back_by_one_that_does_not():
+    driver = LocalDriver(num_cpu=3, memory=1000)
+
+    await driver.submit(0, "/usr/bin/env", "sleep", "1", num_cpu=2)
+    await driver.submit(1, "/usr/bin/env", "true", num_cpu=2)
+    await driver.submit(2, "/usr/bin/env", "true", realization_memory=1000)
+    assert await driver.event_queue.get() == StartedEvent(iens=0)
+    assert await driver.event_queue.get() == StartedEvent(iens=2)
+    assert await driver.event_queue.get() == FinishedEvent(iens=2, returncode=0)
+    assert await driver.event_queue.get() == FinishedEvent(iens=0, returncode=0)
+    assert await driver.event_queue.get() == StartedEvent(iens=1)
+    assert await driver.event_queue.get() == FinishedEvent(iens=1, returncode=0)
+
+
+@pytest.mark.timeout(10)
+async def test_that_a_realization_larger_than_the_machine_runs_alone(caplog):
+    driver = LocalDriver(num_cpu=2, memory=1000)
+
+    await driver.submit(0, "/usr/bin/env", "sleep", "0.5", num_cpu=1)
+    await driver.submit(1, "/usr/bin/env", "true", realization_memory=2000)
+    assert await driver.event_queue.get() == StartedEvent(iens=0)
+    assert await driver.event_queue.get() == FinishedEvent(iens=0, returncode=0)
+    assert await driver.event_queue.get() == StartedEvent(iens=1)
+    assert await driver.event_queue.get() == FinishedEvent(iens=1, returncode=0)
+    assert "Realization 1 needs 1 cores and 2000 bytes of memory" in caplog.text
+
+
+@pytest.mark.timeout(5)
+async def test_that_a_realization_waiting_for_resources_can_be_killed():
+    driver = LocalDriver(num_cpu=1)
+
+    await driver.submit(0, "/usr/bin/env", "sleep", "10")
+    await driver.submit(1, "/usr/bin/env", "sleep", "10")
+    assert await driver.event_queue.get() == StartedEvent(iens=0)
+    await driver.kill([1])
+    assert await driver.event_queue.get() == FinishedEvent(
+        iens=1, returncode=signal.SIGTERM + SIGNAL_OFFSET
+    )
+    await driver.kill([0])
+    assert await driver.event_queue.get() == FinishedEvent(
+        iens=0, returncode=signal.SIGTERM + SIGNAL_OFFSET
+    )
+    assert driver._resources._running == 0
+
+
 @pytest.mark.timeout(10)
 @pytest.mark.integration_test
 async def test_kill_unresponsive_process(monkeypatch, tmp_path):
@@ -134,6 +204,17 @@ async def test_that_killing_killed_job_does_not_raise(use_tmpdir):
     assert driver.event_queue.empty()
 
 
+async def test_that_the_driver_runs_the_same_iens_again_after_finish():
+    driver = LocalDriver()
+    for returncode, executable in enumerate(["true", "false"]):
+        await driver.submit(42, "/usr/bin/env", executable)
+        await driver.finish()
+        assert await driver.event_queue.get() == StartedEvent(iens=42)
+        assert await driver.event_queue.get() == FinishedEvent(
+            iens=42, returncode=returncode
+        )
+
+
 @pytest.mark.timeout(10)
 async def test_path_as_argument_is_valid(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
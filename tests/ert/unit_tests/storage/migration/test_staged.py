@@ -0,0 +1,141 @@
+import json
+
+import pytest
+
+from ert.storage import open_storage
+from ert.storage.local_storage import _LOCAL_STORAGE_VERSION
+from ert.storage.migration._staged import (
+    MIGRATION_PATH,
+    migrate_staged,
+    recover_interrupted_migration,
+)
+
+
+def _create_storage(path, num_experiments):
+    for i in range(num_experiments):
+        experiment = path / "experiments" / f"exp-{i}"
+        experiment.mkdir(parents=True)
+        (experiment / "index.json").write_text(json.dumps({"id": f"exp-id-{i}"}))
+        (experiment / "parameter.json").write_text(json.dumps({"version": 1}))
+        ensemble = path / "ensembles" / f"ens-{i}"
+        (ensemble / "realization-0").mkdir(parents=True)
+        (ensemble / "index.json").write_text(
+            json.dumps({"experiment_id": f"exp-id-{i}"})
+        )
+        (ensemble / "realization-0" / "values.txt").write_text("1")
+
+
+def _bump_version(path):
+    experiments = list(path.glob("experiments/*"))
+    # Each experiment is migrated with only its own ensembles
+    assert len(experiments) == 1
+    assert len(list(path.glob("ensembles/*"))) == 1
+    parameter_file = experiments[0] / "parameter.json"
+    parameter_file.write_text(json.dumps({"version": 2}))
+
+
+def _move_values(path):
+    for values in path.glob("ensembles/*/realization-0/values.txt"):
+        values.rename(values.parent.parent / "values.txt")
+
+
+def test_that_migrations_are_applied_to_each_experiment(tmp_path):
+    _create_storage(tmp_path, 3)
+    completed = []
+    progress = []
+
+    migrate_staged(
+        tmp_path,
+        [_bump_version, _move_values],
+        lambda: completed.append(True),
+        lambda migrated, total: progress.append((migrated, total)),
+    )
+
+    assert completed == [True]
+    assert progress[-1] == (3, 3)
+    assert not (tmp_path / MIGRATION_PATH).exists()
+    for i in range(3):
+        assert json.loads(
+            (tmp_path / "experiments" / f"exp-{i}" / "parameter.json").read_text()
+        ) == {"version": 2}
+        ensemble = tmp_path / "ensembles" / f"ens-{i}"
+        assert (ensemble / "values.txt").exists()
+        assert not (ensemble / "realization-0" / "values.txt").exists()
+
+
+def test_that_a_failed_migration_leaves_the_storage_unchanged(tmp_path):
+    _create_storage(tmp_path, 3)
+
+    def fail_for_one_experiment(path):
+        _move_values(path)
+        if (path / "experiments" / "exp-1").exists():
+            raise ValueError("Migration failed")
+
+    with pytest.raises(ValueError, match="Migration failed"):
+        migrate_staged(tmp_path, [_bump_version, fail_for_one_experiment], lambda: None)
+
+    assert not (tmp_path / MIGRATION_PATH).exists()
+    for i in range(3):
+        assert json.loads(
+            (tmp_path / "experiments" / f"exp-{i}" / "parameter.json").read_text()
+        ) == {"version": 1}
+        assert (
+            tmp_path / "ensembles" / f"ens-{i}" / "realization-0" / "values.txt"
+        ).read_text() == "1"
+
+
+def test_that_a_failure_to_complete_the_migration_is_rolled_back(tmp_path):
+    _create_storage(tmp_path, 2)
+
+    def fail():
+        raise OSError("Could not save index")
+
+    with pytest.raises(OSError, match="Could not save index"):
+        migrate_staged(tmp_path, [_bump_version], fail)
+
+    assert not (tmp_path / MIGRATION_PATH).exists()
+    for i in range(2):
+        assert json.loads(
+            (tmp_path / "experiments" / f"exp-{i}" / "parameter.json").read_text()
+        ) == {"version": 1}
+
+
+@pytest.mark.parametrize("completed", [True, False])
+def test_that_an_interrupted_swap_is_recovered(tmp_path, completed):
+    _create_storage(tmp_path, 1)
+    staging = tmp_path / MIGRATION_PATH
+    (staging / "original").mkdir(parents=True)
+    # Interrupted after the experiments were swapped, but before the
+    # ensembles were
+    (tmp_path / "experiments").rename(staging / "original" / "experiments")
+    (tmp_path / "experiments" / "exp-0").mkdir(parents=True)
+    (tmp_path / "experiments" / "exp-0" / "parameter.json").write_text(
+        json.dumps({"version": 2})
+    )
+
+    recover_interrupted_migration(tmp_path, completed)
+
+    assert not staging.exists()
+    assert json.loads(
+        (tmp_path / "experiments" / "exp-0" / "parameter.json").read_text()
+    ) == {"version": 2 if completed else 1}
+
+
+def test_that_opening_an_old_storage_migrates_it(tmp_path):
+    with open_storage(tmp_path / "storage", "w") as storage:
+        experiment = storage.create_experiment(name="experiment")
+        storage.create_ensemble(experiment, ensemble_size=1, name="prior")
+    index_file = tmp_path / "storage" / "index.json"
+    index = json.loads(index_file.read_text())
+    index_file.write_text(json.dumps(index | {"version": _LOCAL_STORAGE_VERSION - 1}))
+
+    with open_storage(tmp_path / "storage", "w") as storage:
+        assert [e.name for e in storage.experiments] == ["experiment"]
+        assert [e.name for e in storage.ensembles] == ["prior"]
+
+    index = json.loads(index_file.read_text())
+    assert index["version"] == _LOCAL_STORAGE_VERSION
+    assert [m["version_range"] for m in index["migrations"]] == [
+        [_LOCAL_STORAGE_VERSION - 1, _LOCAL_STORAGE_VERSION]
+    ]
+    assert not (tmp_path / "storage" / MIGRATION_PATH).exists()
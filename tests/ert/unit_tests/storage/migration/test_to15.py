@@ -0,0 +1,47 @@
+import json
+
+import numpy as np
+import polars as pl
+import xarray as xr
+
+from ert.storage.migration.to15 import migrate_everest_parameters
+
+
+def test_that_everest_parameters_are_migrated_to_one_parquet_file(tmp_path):
+    experiment = tmp_path / "experiments" / "exp"
+    experiment.mkdir(parents=True)
+    (experiment / "index.json").write_text(json.dumps({"id": "exp-id"}))
+    (experiment / "parameter.json").write_text(
+        json.dumps(
+            {
+                "point": {
+                    "name": "point",
+                    "type": "everest_parameters",
+                    "input_keys": ["point.x", "point.y.1"],
+                }
+            }
+        )
+    )
+    ensemble = tmp_path / "ensembles" / "ens"
+    ensemble.mkdir(parents=True)
+    (ensemble / "index.json").write_text(json.dumps({"experiment_id": "exp-id"}))
+
+    for realization in [0, 2]:
+        (ensemble / f"realization-{realization}").mkdir()
+        xr.Dataset(
+            {
+                "values": ("names", np.array([1.0, 2.0]) + realization),
+                "names": ["x", "y\0" + "1"],
+            }
+        ).expand_dims(realizations=[realization]).to_netcdf(
+            ensemble / f"realization-{realization}" / "point.nc", engine="scipy"
+        )
+
+    migrate_everest_parameters(tmp_path)
+
+    assert not list(ensemble.glob("realization-*/point.nc"))
+    assert pl.read_parquet(ensemble / "point.parquet").to_dict(as_series=False) == {
+        "realization": [0, 2],
+        "point.x": [1.0, 3.0],
+        "point.y.1": [2.0, 4.0],
+    }
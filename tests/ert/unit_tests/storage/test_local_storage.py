@@ -3,6 +3,8 @@
 import shutil
 import stat
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -338,6 +340,77 @@ def test_refresh(tmp_path):
             assert _ensembles(accessor) == _ensembles(reader)
 
 
+def test_that_reader_only_loads_the_ensembles_it_uses(tmp_path):
+    with open_storage(tmp_path, mode="w") as writer:
+        experiment = writer.create_experiment()
+        ensembles = [
+            writer.create_ensemble(experiment, name=f"ens-{i}", ensemble_size=1)
+            for i in range(3)
+        ]
+
+    with (
+        patch(
+            "ert.storage.local_storage.LocalEnsemble", wraps=LocalEnsemble
+        ) as local_ensemble,
+        open_storage(tmp_path, mode="r") as reader,
+    ):
+        assert local_ensemble.call_count == 0
+        assert reader.get_ensemble(ensembles[1].id).name == "ens-1"
+        assert reader.get_ensemble(ensembles[1].id).experiment.id == experiment.id
+        assert local_ensemble.call_count == 1
+        assert [e.name for e in reader.ensembles] == ["ens-2", "ens-1", "ens-0"]
+        assert local_ensemble.call_count == 3
+
+
+def test_that_reader_does_not_see_ensembles_that_are_being_created(tmp_path, caplog):
+    with open_storage(tmp_path, mode="w") as writer:
+        experiment = writer.create_experiment()
+        ensemble = writer.create_ensemble(experiment, name="foo", ensemble_size=1)
+        # The ensemble directory is created before its index is written
+        (tmp_path / "ensembles" / str(UUID(int=0))).mkdir()
+
+        with open_storage(tmp_path, mode="r") as reader:
+            assert [e.id for e in reader.ensembles] == [ensemble.id]
+            with pytest.raises(KeyError):
+                reader.get_ensemble(UUID(int=0))
+            assert "ERROR" not in caplog.text
+
+
+def test_that_reader_can_be_refreshed_while_another_thread_iterates_it(tmp_path):
+    with open_storage(tmp_path, mode="w") as writer:
+        experiment = writer.create_experiment(name="experiment")
+        ensembles = [
+            writer.create_ensemble(experiment, name=f"ens-{i}", ensemble_size=1)
+            for i in range(10)
+        ]
+
+    def slowly_loaded_ensemble(*args, **kwargs):
+        # Let the other thread run while the ensembles are loaded
+        time.sleep(0.001)
+        return LocalEnsemble(*args, **kwargs)
+
+    with (
+        patch(
+            "ert.storage.local_storage.LocalEnsemble",
+            side_effect=slowly_loaded_ensemble,
+        ),
+        open_storage(tmp_path, mode="r") as reader,
+    ):
+
+        def refresh_and_get() -> None:
+            for i in range(100):
+                reader.refresh()
+                ensemble = ensembles[i % len(ensembles)]
+                assert reader.get_ensemble(ensemble.id).name == ensemble.name
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            refreshing = executor.submit(refresh_and_get)
+            while not refreshing.done():
+                assert {e.name for e in reader.ensembles} == {e.name for e in ensembles}
+                assert [e.name for e in reader.experiments] == ["experiment"]
+            refreshing.result()
+
+
 def test_that_reader_storage_reads_most_recent_response_configs(tmp_path):
     reader = open_storage(tmp_path, mode="r")
     writer = open_storage(tmp_path, mode="w")
@@ -810,6 +883,68 @@ def test_asof_joining_summary(tmp_path, perturb_observations, perturb_responses)
         )
 
 
+def test_that_misfits_are_cached_until_new_responses_are_saved(tmp_path):
+    with open_storage(tmp_path, mode="w") as storage:
+        times = pl.Series([datetime(2000, 1, 1), datetime(2000, 1, 2)]).cast(
+            pl.Datetime("ms")
+        )
+        summary_observations = pl.DataFrame(
+            {
+                "observation_key": ["o_FOPR", "o_FOPR"],
+                "response_key": ["FOPR", "FOPR"],
+                "time": times,
+                "observations": pl.Series([1.0, 2.0], dtype=pl.Float32),
+                "std": pl.Series([0.5, 1.0], dtype=pl.Float32),
+            }
+        )
+        experiment = storage.create_experiment(
+            responses=[SummaryConfig(keys=["*"], input_files=["not_relevant"])],
+            observations={"summary": summary_observations},
+        )
+        ensemble = storage.create_ensemble(
+            experiment, ensemble_size=2, iteration=0, name="prior"
+        )
+
+        def save_summary(realization, values):
+            ensemble.save_response(
+                "summary",
+                pl.DataFrame(
+                    {
+                        "response_key": ["FOPR", "FOPR"],
+                        "time": times,
+                        "values": pl.Series(values, dtype=pl.Float32),
+                    }
+                ),
+                realization,
+            )
+
+        save_summary(0, [1.0, 2.0])
+        misfits = ensemble.load_misfits()
+        assert misfits.to_dict(as_series=False) == {
+            "realization": [0],
+            "MISFIT:o_FOPR": [0.0],
+            "MISFIT:TOTAL": [0.0],
+        }
+        assert ensemble.load_misfits() is misfits
+
+        # Saving responses drops the cached misfits without a refresh
+        save_summary(0, [2.0, 4.0])
+        assert ensemble.load_misfits().to_dict(as_series=False) == {
+            "realization": [0],
+            "MISFIT:o_FOPR": [8.0],
+            "MISFIT:TOTAL": [8.0],
+        }
+
+        # A realization with new responses is seen once the state is refreshed
+        save_summary(1, [1.0, 2.0])
+        ensemble.refresh_ensemble_state()
+        assert ensemble.load_misfits().to_dict(as_series=False) == {
+            "realization": [0, 1],
+            "MISFIT:o_FOPR": [8.0, 0.0],
+            "MISFIT:TOTAL": [8.0, 0.0],
+        }
+
+
 def test_saving_everest_metadata_to_ensemble(tmp_path):
     with open_storage(tmp_path, mode="w") as storage:
         experiment = storage.create_experiment(
@@ -903,6 +1038,60 @@ def test_that_saving_invalid_everest_realization_info_raises_error(
 ]
 
 
+def test_that_everest_controls_of_all_realizations_are_saved_in_one_file(tmp_path):
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        config = ExtParamConfig(
+            name="point",
+            input_keys=["point.x", "point.y.1", "point.y.2"],
+            output_file="point.json",
+        )
+        experiment = storage.create_experiment(parameters=[config])
+        ensemble = storage.create_ensemble(experiment, ensemble_size=4)
+
+        controls = np.arange(12, dtype=np.float64).reshape(3, 4)
+        ensemble.save_parameters_numpy(controls, "point", np.arange(4))
+
+        assert not list(ensemble.mount_point.glob("realization-*/point.nc"))
+        assert ensemble.get_realization_mask_with_parameters().all()
+        np.testing.assert_equal(
+            ensemble.load_parameters_numpy("point", np.array([3, 1])),
+            controls[:, [3, 1]],
+        )
+
+        ensemble.save_parameters_numpy(np.array([[-1.0], [-2.0], [-3.0]]), "point", [2])
+        config.write_to_runpath(tmp_path, 2, ensemble)
+        assert json.loads((tmp_path / "point.json").read_text(encoding="utf-8")) == {
+            "x": -1.0,
+            "y": {"1": -2.0, "2": -3.0},
+        }
+        np.testing.assert_equal(
+            ensemble.load_parameters_numpy("point", np.arange(4))[:, [0, 1, 3]],
+            controls[:, [0, 1, 3]],
+        )
+
+
+def test_that_saving_everest_controls_updates_their_parameter_state(tmp_path):
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        config = ExtParamConfig(
+            name="point", input_keys=["point.x"], output_file="point.json"
+        )
+        experiment = storage.create_experiment(parameters=[config])
+        ensemble = storage.create_ensemble(experiment, ensemble_size=2)
+
+        ensemble.save_parameters_numpy(np.array([[1.0]]), "point", [0])
+        assert ensemble.get_parameter_state(0) == {
+            "point": RealizationStorageState.PARAMETERS_LOADED
+        }
+        assert ensemble.get_parameter_state(1) == {
+            "point": RealizationStorageState.UNDEFINED
+        }
+
+        ensemble.save_parameters_numpy(np.array([[2.0]]), "point", [1])
+        assert ensemble.get_parameter_state(1) == {
+            "point": RealizationStorageState.PARAMETERS_LOADED
+        }
+
+
 @pytest.mark.parametrize(
     "ensemble_realization_infos, failed_realizations_per_batch",
     [
@@ -934,16 +1123,16 @@ def test_that_all_parameters_and_gen_data_consolidation_works(
             ensemble.save_everest_realization_info(everest_realization_info)
 
             for realization in range(num_realizations):
-                param_data = xr.Dataset(
+                param_data = pl.DataFrame(
                     {
-                        "values": (
-                            "names",
-                            np.array([realization] * len(param_keys)) + (batch / 10),
-                        ),
-                        "names": param_keys,
+                        "realization": [realization],
+                        **{
+                            f"point.{key}": [realization + (batch / 10)]
+                            for key in param_keys
+                        },
                     }
                 )
-                ensemble.save_parameters(param_data, "point", realization)
+                ensemble.save_parameters(param_data, "point")
 
                 if realization in failed_realizations:
                     ensemble.set_failure(
@@ -1,11 +1,13 @@
 import os
+from unittest.mock import patch
 
 import pytest
 from hypothesis import assume, given, settings
+from hypothesis import strategies as st
 
 from ert.config import ErtConfig
 from ert.config.parsing import ConfigKeys
-from ert.substitutions import Substitutions
+from ert.substitutions import Substitutions, _replace_strings
 
 from .config.config_dict_generator import config_generators
 
@@ -63,3 +65,84 @@ def test_that_parameters_as_magic_strings_are_substituted():
     assert (
         Substitutions.substitute_parameters(to_substitute, params) == "1.01 and value"
     )
+
+
+def _substitute_parameters_in_order(string, parameter_values):
+    for values in parameter_values.values():
+        for name, value in values.items():
+            formatted = f"{value:.6g}" if isinstance(value, float) else value
+            string = string.replace(f"<{name}>", formatted)
+    return string
+
+
+_texts = st.text(alphabet="<>ab", max_size=12)
+
+
+@settings(max_examples=500)
+@given(
+    st.dictionaries(
+        st.sampled_from(["GROUP1", "GROUP2"]),
+        st.dictionaries(_texts, _texts | st.floats(allow_nan=False), max_size=4),
+    ),
+    _texts,
+)
+def test_that_parameters_are_substituted_as_if_replaced_in_order(
+    parameter_values, string
+):
+    assert Substitutions.substitute_parameters(
+        string, parameter_values
+    ) == _substitute_parameters_in_order(string, parameter_values)
+
+
+def _substitute_iteratively(substitutions, string, max_iterations):
+    for _ in range(max_iterations):
+        substituted = _replace_strings(substitutions, string)
+        if substituted is None:
+            return string, False
+        string = substituted
+    return string, True
+
+
+@settings(max_examples=500)
+@given(
+    st.dictionaries(_texts.map(lambda key: f"<{key}>"), _texts, max_size=5),
+    _texts,
+    st.integers(min_value=0, max_value=6),
+)
+def test_that_substitution_gives_the_same_string_as_iterative_substitution(
+    substitutions, string, max_iterations
+):
+    expected, warned = _substitute_iteratively(substitutions, string, max_iterations)
+    with patch("ert.substitutions.logger") as logger:
+        assert (
+            Substitutions(substitutions).substitute(
+                string, max_iterations=max_iterations
+            )
+            == expected
+        )
+    assert logger.warning.called == warned
+
+
+@pytest.mark.parametrize(
+    "string, expected",
+    [
+        ("<A>", "a"),
+        ("<<B>>", "a"),
+        ("<C>>", "a"),
+        ("<<D>", "<<D>"),
+        ("<D>", "<D>"),
+        ("<E<A>>", "<Ea>"),
+        ("<<F>>", "<<G>>"),
+    ],
+)
+def test_that_nested_magic_strings_are_resolved(string, expected):
+    substitutions = Substitutions(
+        {"<A>": "a", "<B>": "A", "<C>": "<A", "<D>": "", "<F>": "<G>"}
+    )
+    assert substitutions.substitute(string) == expected
+
+
+def test_that_cyclic_substitutions_warn_and_stop_after_max_iterations(caplog):
+    substitutions = Substitutions({"<A>": "x<A>"})
+    assert substitutions.substitute("<A>", max_iterations=3) == "xxx<A>"
+    assert "Reached max iterations" in caplog.text
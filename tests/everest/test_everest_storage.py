@@ -1,3 +1,4 @@
+import shutil
 from pathlib import Path
 
 import polars as pl
@@ -5,7 +6,7 @@
 
 from ert.storage import open_storage
 from everest.config import EverestConfig
-from everest.everest_storage import EverestStorage
+from everest.everest_storage import BatchStorageData, EverestStorage, _ResultTables
 
 
 @pytest.mark.integration_test
@@ -101,7 +102,7 @@ def test_everest_data_stored_in_ert_local_storage(
 
     config = EverestConfig.load_file(Path(config_path) / config_file)
     with open_storage(config.storage_dir, mode="r") as storage:
-        experiment = next(s for s in storage._experiments.values())
+        experiment = next(storage.experiments)
         assert set(experiment.response_info.keys()) == responses
 
         response_type_mapping = experiment.response_type_to_response_keys
@@ -120,3 +121,121 @@ def test_everest_data_stored_in_ert_local_storage(
         ]
 
         assert local_storage_params == formatted_control_names
+
+
+def _save_batch(ever_storage: EverestStorage, batch_id: int) -> None:
+    batch_path = ever_storage._output_dir / "ensembles" / f"batch_{batch_id}"
+    (batch_path / "optimizer").mkdir(parents=True)
+    (batch_path / "optimizer" / "batch.json").write_text(
+        f'{{"batch_id": {batch_id}, "is_improvement": false}}', encoding="utf-8"
+    )
+    ever_storage.data.batches.append(
+        BatchStorageData(batch_path / "optimizer", ever_storage.data.tables)
+    )
+    ever_storage.data.batches[-1].save_dataframes(
+        {
+            "realization_controls": pl.DataFrame(
+                {
+                    "batch_id": pl.Series([batch_id], dtype=pl.UInt32),
+                    "realization": pl.Series([0], dtype=pl.UInt32),
+                    "simulation_id": pl.Series([0], dtype=pl.Int32),
+                    "point.x": [float(batch_id)],
+                }
+            )
+        }
+    )
+
+
+def test_that_batch_results_are_appended_and_compacted(tmp_path):
+    ever_storage = EverestStorage(output_dir=tmp_path)
+    n_batches = _ResultTables.COMPACTION_THRESHOLD + 3
+    for batch_id in range(n_batches):
+        _save_batch(ever_storage, batch_id)
+
+    results_path = tmp_path / "optimizer" / "results" / "realization_controls"
+    threshold = _ResultTables.COMPACTION_THRESHOLD
+    assert sorted(p.name for p in results_path.iterdir()) == [
+        f"batch_{batch_id}.parquet" for batch_id in range(threshold, n_batches)
+    ] + [f"batches_0_{threshold - 1}.parquet"]
+
+    ever_storage.compact()
+    assert sorted(p.name for p in results_path.iterdir()) == [
+        f"batches_0_{threshold - 1}.parquet",
+        f"batches_{threshold}_{n_batches - 1}.parquet",
+    ]
+
+    reopened = EverestStorage(output_dir=tmp_path)
+    reopened.read_from_output_dir()
+    assert [b.batch_id for b in reopened.data.batches_with_function_results] == list(
+        range(n_batches)
+    )
+    assert reopened.data.batches[5].realization_controls["point.x"].to_list() == [5.0]
+    assert reopened.data.simulation_to_model_realization_map(7) == {0: 0}
+
+
+def test_that_a_failed_append_leaves_no_part_file(tmp_path, monkeypatch):
+    ever_storage = EverestStorage(output_dir=tmp_path)
+    _save_batch(ever_storage, 0)
+
+    def write_half_and_fail(self, file, *args, **kwargs):
+        Path(file).write_bytes(b"PAR1")
+        raise OSError("Disk full")
+
+    monkeypatch.setattr(pl.DataFrame, "write_parquet", write_half_and_fail)
+    with pytest.raises(OSError, match="Disk full"):
+        _save_batch(ever_storage, 1)
+    monkeypatch.undo()
+
+    results_path = tmp_path / "optimizer" / "results" / "realization_controls"
+    assert not (results_path / "batch_1.parquet").exists()
+    scan = ever_storage.data.scan_results("realization_controls")
+    assert scan is not None
+    assert scan.collect()["batch_id"].to_list() == [0]
+
+
+def test_that_results_stored_per_batch_directory_are_read(tmp_path):
+    ever_storage = EverestStorage(output_dir=tmp_path)
+    _save_batch(ever_storage, 0)
+
+    # Earlier versions stored the results in the batch directories:
+    legacy_path = tmp_path / "ensembles" / "batch_1" / "optimizer"
+    legacy_path.mkdir(parents=True)
+    (legacy_path / "batch.json").write_text(
+        '{"batch_id": 1, "is_improvement": true}', encoding="utf-8"
+    )
+    pl.DataFrame(
+        {
+            "batch_id": pl.Series([1], dtype=pl.UInt32),
+            "realization": pl.Series([0], dtype=pl.UInt32),
+            "simulation_id": pl.Series([0], dtype=pl.Int32),
+            "point.x": [1.0],
+        }
+    ).write_parquet(legacy_path / "realization_controls.parquet")
+
+    reopened = EverestStorage(output_dir=tmp_path)
+    reopened.read_from_output_dir()
+    scan = reopened.data.scan_results("realization_controls")
+    assert scan is not None
+    assert scan.sort("batch_id").collect()["point.x"].to_list() == [0.0, 1.0]
+    assert reopened.data.batches[1].realization_controls["point.x"].to_list() == [1.0]
+    assert reopened.data.function_batch_ids == [0, 1]
+    assert reopened.data.accepted_batch_ids == [1]
+
+
+def test_that_batch_ids_are_read_from_the_result_tables(tmp_path):
+    ever_storage = EverestStorage(output_dir=tmp_path)
+    for batch_id in range(3):
+        _save_batch(ever_storage, batch_id)
+    assert ever_storage.data.accepted_batch_ids == []
+    ever_storage.data.tables.save_accepted_batch_ids([0, 2])
+
+    # The batch directories are not read:
+    shutil.rmtree(tmp_path / "ensembles")
+    reopened = EverestStorage(output_dir=tmp_path)
+    assert reopened.data.function_batch_ids == [0, 1, 2]
+    assert reopened.data.accepted_batch_ids == [0, 2]
+    batches = reopened.data.tables.read_batches("realization_controls", [1, 2, 3])
+    assert {batch_id: df["point.x"].to_list() for batch_id, df in batches.items()} == {
+        1: [1.0],
+        2: [2.0],
+    }
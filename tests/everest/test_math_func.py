@@ -6,9 +6,11 @@
 
 from ert.ensemble_evaluator.config import EvaluatorServerConfig
 from ert.plugins import ErtPluginContext
+from ert.run_models import everest_run_model
 from ert.run_models.everest_run_model import EverestRunModel
 from ert.storage import open_storage
 from everest.config import EverestConfig
+from everest.everest_storage import EverestStorage
 from everest.util import makedirs_if_needed
 from tests.everest.utils import get_optimal_result
 
@@ -126,6 +128,42 @@ def test_remove_run_path(copy_math_func_test_data_to_tmp):
     ), "Simulation folder should be there, something went wrong and was removed"
 
 
+@pytest.mark.integration_test
+@pytest.mark.usefixtures("use_site_configurations_with_no_queue_options")
+def test_that_cached_evaluations_are_not_run_again(
+    copy_math_func_test_data_to_tmp, monkeypatch
+):
+    # Rounded to one decimal, the perturbed controls are the same as the
+    # evaluated controls, so only the evaluation should be run
+    monkeypatch.setattr(everest_run_model, "EVALUATION_CACHE_DECIMALS", 1)
+    config = EverestConfig.load_file("config_minimal.yml")
+    config.simulator.enable_cache = True
+
+    with ErtPluginContext() as runtime_plugins:
+        run_model = EverestRunModel.create(config, runtime_plugins=runtime_plugins)
+    run_model.run_experiment(EvaluatorServerConfig())
+
+    ever_storage = EverestStorage(Path(config.optimization_output_dir))
+    ever_storage.read_from_output_dir()
+    statistics = ever_storage.data.batches[0].evaluation_cache_statistics
+    assert statistics is not None
+    assert statistics["misses"] == 1
+    assert statistics["hits"] > 0
+
+    realization_dir = Path(config.simulation_dir) / "batch_0" / "realization_0"
+    assert (realization_dir / "evaluation_0").exists()
+    assert not list(realization_dir.glob("perturbation_*"))
+
+    with open_storage(config.storage_dir, mode="r") as storage:
+        ensemble = next(
+            e for e in storage.ensembles if e.name == f"{run_model.target_ensemble}_0"
+        )
+        objectives = ensemble.load_responses(
+            "everest_objectives", tuple(range(ensemble.ensemble_size))
+        )
+        assert objectives["values"].n_unique() == 1
+
+
 @pytest.mark.integration_test
 @pytest.mark.usefixtures("use_site_configurations_with_no_queue_options")
 def test_math_func_auto_scaled_controls(copy_math_func_test_data_to_tmp):